@@ -0,0 +1,4 @@
+# Carrega o app do Celery junto com o Django para que @shared_task o use
+from .celery import app as celery_app
+
+__all__ = ('celery_app',)
@@ -12,5 +12,7 @@ import os
 from django.core.asgi import get_asgi_application
 
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'FinalProj.settings')
+# Views assíncronas nas leituras da API e na página inicial (TEAMFLOW_ASYNC_VIEWS=0 desliga)
+os.environ.setdefault('TEAMFLOW_ASYNC_VIEWS', '1')
 
 application = get_asgi_application()
@@ -10,6 +10,7 @@ For the full list of settings and their values, see
 https://docs.djangoproject.com/en/5.0/ref/settings/
 """
 
+import os
 from pathlib import Path
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
@@ -43,8 +44,11 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    'teamflow.timing.RequestTimingMiddleware',
+    'teamflow.nplusone.NPlusOneMiddleware',
     'django.middleware.security.SecurityMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
+    'teamflow.replicas.ReplicaPinMiddleware',
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
     'django.contrib.auth.middleware.AuthenticationMiddleware',
@@ -56,7 +60,9 @@ ROOT_URLCONF = 'FinalProj.urls'
 
 TEMPLATES = [
     {
-        'BACKEND': 'django.template.backends.django.DjangoTemplates',
+        # DjangoTemplates que mede o tempo de renderização (teamflow.timing)
+        'BACKEND': 'teamflow.timing.TimedDjangoTemplates',
+        'NAME': 'django',
         'DIRS': [],
         'APP_DIRS': True,
         'OPTIONS': {
@@ -76,13 +82,64 @@ WSGI_APPLICATION = 'FinalProj.wsgi.application'
 # Database
 # https://docs.djangoproject.com/en/5.0/ref/settings/#databases
 
+# SQLite para escritas concorrentes: WAL (leitores não bloqueiam o escritor),
+# transações IMMEDIATE (o lock de escrita é pedido no BEGIN, onde o busy timeout
+# vale, em vez de falhar ao promover uma leitura) e os pragmas abaixo, aplicados
+# a cada conexão nova pelo init_command
+SQLITE_BUSY_TIMEOUT = float(os.environ.get('TEAMFLOW_SQLITE_TIMEOUT', 20))
+SQLITE_PRAGMAS = {
+    'journal_mode': 'WAL',
+    # Com WAL, NORMAL só perde as últimas transações numa queda de energia, sem corromper
+    'synchronous': 'NORMAL',
+    'cache_size': -64000,  # KiB
+    'mmap_size': 256 * 1024 * 1024,
+    'temp_store': 'MEMORY',
+}
+SQLITE_OPTIONS = {
+    'timeout': SQLITE_BUSY_TIMEOUT,
+    'transaction_mode': 'IMMEDIATE',
+    'init_command': ';'.join(f'PRAGMA {name}={value}' for name, value in SQLITE_PRAGMAS.items()),
+}
+
 DATABASES = {
     'default': {
         'ENGINE': 'django.db.backends.sqlite3',
         'NAME': BASE_DIR / 'db.sqlite3',
+        'OPTIONS': SQLITE_OPTIONS,
     }
 }
 
+# Réplicas de leitura (teamflow.replicas): caminhos separados por vírgula em
+# TEAMFLOW_DB_REPLICAS. Localmente, cópias SQLite atualizadas com `manage.py sync_replicas`
+DATABASE_REPLICAS = []
+for number, name in enumerate(filter(None, os.environ.get('TEAMFLOW_DB_REPLICAS', '').split(',')), start=1):
+    DATABASES[f'replica{number}'] = {
+        'ENGINE': 'django.db.backends.sqlite3',
+        'NAME': name,
+        'OPTIONS': SQLITE_OPTIONS,
+        'TEST': {'MIRROR': 'default'},
+    }
+    DATABASE_REPLICAS.append(f'replica{number}')
+
+DATABASE_ROUTERS = ['teamflow.replicas.ReplicaRouter']
+# Depois de uma escrita, o cliente lê do primário por este tempo (maior que o atraso da replicação)
+REPLICA_PIN_SECONDS = 5
+
+
+# Cache
+# https://docs.djangoproject.com/en/5.0/topics/cache/
+# O cache da página inicial funciona com o backend em memória local ou com
+# 'django.core.cache.backends.filebased.FileBasedCache' (compartilhado entre processos)
+
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+    }
+}
+
+DASHBOARD_CACHE = 'default'
+DASHBOARD_CACHE_TIMEOUT = 300
+
 
 # Password validation
 # https://docs.djangoproject.com/en/5.0/ref/settings/#auth-password-validators
@@ -125,11 +182,62 @@ STATIC_URL = '/static/'
 
 DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 
+# Tamanho padrão e máximo das páginas quando a API é paginada (?cursor= ou ?page_size=)
+API_PAGE_SIZE = 100
+API_MAX_PAGE_SIZE = 500
+# Número máximo de resultados da busca de usuários
+API_SEARCH_LIMIT = 20
+# Número máximo de itens nas operações em lote da API
+API_MAX_BATCH_SIZE = 1000
+# Lotes de membros maiores que isto são adicionados em segundo plano (Celery)
+API_SYNC_BATCH_SIZE = 100
+
+# Listas do admin com mais linhas que isto usam uma contagem estimada em vez de COUNT(*)
+ESTIMATED_COUNT_THRESHOLD = 10000
+
+# Versões assíncronas (ORM assíncrono) das leituras da API e da página inicial;
+# ligadas pelo FinalProj.asgi, já que sob WSGI cada requisição ocupa uma thread de qualquer jeito
+ASYNC_VIEWS = os.environ.get('TEAMFLOW_ASYNC_VIEWS') == '1'
+
+# Consultas e tempos de cada requisição no cabeçalho Server-Timing e no log
+# 'teamflow.timing' (teamflow.timing); requisições acima dos limites viram avisos
+REQUEST_TIMING = os.environ.get('TEAMFLOW_REQUEST_TIMING') == '1'
+REQUEST_QUERY_BUDGET = 20
+REQUEST_TIME_BUDGET_MS = 500
+
+# Detector de N+1 (teamflow.nplusone): TEAMFLOW_NPLUSONE=1 registra as consultas
+# repetidas de cada requisição, TEAMFLOW_NPLUSONE=raise faz a requisição (e o teste) falhar
+NPLUSONE_DETECTION = os.environ.get('TEAMFLOW_NPLUSONE') in ('1', 'raise')
+NPLUSONE_RAISE = os.environ.get('TEAMFLOW_NPLUSONE') == 'raise'
+# Mesma consulta, do mesmo lugar, a partir de quantas vezes
+NPLUSONE_THRESHOLD = 3
+
+LOGGING = {
+    'version': 1,
+    'disable_existing_loggers': False,
+    'handlers': {
+        'console': {'class': 'logging.StreamHandler'},
+    },
+    'loggers': {
+        'teamflow.timing': {'handlers': ['console'], 'level': 'INFO'},
+        'teamflow.nplusone': {'handlers': ['console'], 'level': 'WARNING'},
+    },
+}
+
+# Exclusão de projetos em segundo plano: linhas por transação e pausa entre os lotes,
+# para que outras escritas consigam o lock do SQLite no meio
+PROJECT_DELETE_BATCH_SIZE = 2000
+PROJECT_DELETE_PAUSE = 0.05
+
 AUTH_USER_MODEL = 'teamflow.User'
 LOGIN_URL = '/login/'
 
-CELERY_BROKER_URL = 'redis://localhost:6379/0'
-CELERY_RESULT_BACKEND = 'redis://localhost:6379/0'
+# Sem CELERY_BROKER_URL no ambiente as tarefas rodam na própria requisição (modo eager),
+# então o projeto funciona sem Redis; com ele, rode também `celery -A FinalProj worker`
+CELERY_BROKER_URL = os.environ.get('CELERY_BROKER_URL', 'memory://')
+CELERY_TASK_ALWAYS_EAGER = 'CELERY_BROKER_URL' not in os.environ
+# O progresso e o resultado ficam no modelo Job, não num result backend
+CELERY_TASK_IGNORE_RESULT = True
 CELERY_ACCEPT_CONTENT = ['json']
 CELERY_TASK_SERIALIZER = 'json'
 CELERY_RESULT_SERIALIZER = 'json'
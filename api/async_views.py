@@ -0,0 +1,92 @@
+from functools import wraps
+
+from asgiref.sync import sync_to_async
+from django.contrib.auth import get_user_model
+from django.db.models import Q
+from django.http import JsonResponse
+from django.views.decorators.http import require_safe
+from teamflow.counters import atask_counts
+from teamflow.models import Project
+from teamflow.replicas import replica_reads
+from . import views
+from .conditional import async_conditional_get
+from .pagination import OptInCursorPagination
+from .serializers import PROJECT_COLUMNS, membership_rows, project_dicts
+
+PAGE_PARAMS = (OptInCursorPagination.cursor_query_param, OptInCursorPagination.page_size_query_param)
+
+
+def async_api_view(sync_view):
+    """Async GET-only version of a read API view, for ASGI deployments.
+
+    Session authentication only: anonymous requests get the same 403 as
+    DRF. Paginated requests (``?cursor=``/``?page_size=``) are passed to
+    ``sync_view`` in a thread, so the cursor handling stays in one place.
+    The wrapped view is called with the authenticated user.
+    """
+    sync_view = sync_view.as_view()
+
+    @sync_to_async
+    def paginated(request, *args, **kwargs):
+        response = sync_view(request, *args, **kwargs)
+        # A Response do DRF é renderizada aqui, ainda na thread
+        if hasattr(response, 'render'):
+            response.render()
+        return response
+
+    def decorator(view_func):
+        @require_safe
+        @wraps(view_func)
+        async def wrapper(request, *args, **kwargs):
+            user = await request.auser()
+            if not user.is_authenticated:
+                return JsonResponse({'detail': 'Authentication credentials were not provided.'}, status=403)
+            if any(param in request.GET for param in PAGE_PARAMS):
+                return await paginated(request, *args, **kwargs)
+            return await view_func(request, user, *args, **kwargs)
+        return wrapper
+    return decorator
+
+
+async def serialize_projects(projects):
+    rows = [row async for row in projects.values_list(*PROJECT_COLUMNS)]
+    if not rows:
+        return []
+    project_ids = [row[0] for row in rows]
+    memberships = [row async for row in membership_rows(project_ids)]
+    return project_dicts(rows, memberships, await atask_counts(project_ids))
+
+
+def user_projects(user):
+    return Project.objects.filter(Q(created_by=user) | Q(members=user))
+
+
+@async_api_view(views.ReturnUsersAPI)
+@replica_reads
+async def users(request, user):
+    rows = get_user_model().objects.values('email', 'username')
+    return JsonResponse([row async for row in rows], safe=False)
+
+
+@async_api_view(views.ReturnProjectsAPI)
+@replica_reads
+@async_conditional_get(lambda request, user, **kwargs: Project.objects.all())
+async def projects(request, user):
+    return JsonResponse(await serialize_projects(Project.objects.all()), safe=False)
+
+
+@async_api_view(views.ReturnUserProjectsAPI)
+@replica_reads
+@async_conditional_get(lambda request, user, **kwargs: user_projects(user))
+async def current_user_projects(request, user):
+    return JsonResponse(await serialize_projects(user_projects(user).distinct()), safe=False)
+
+
+@async_api_view(views.ReturnSpecificProjectAPI)
+@replica_reads
+@async_conditional_get(lambda request, user, pk: Project.objects.filter(pk=pk), detail=True)
+async def project_detail(request, user, pk):
+    data = await serialize_projects(Project.objects.filter(pk=pk))
+    if not data:
+        return JsonResponse({'detail': 'No Project matches the given query.'}, status=404)
+    return JsonResponse(data[0])
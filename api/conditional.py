@@ -0,0 +1,112 @@
+import hashlib
+
+from django.db.models import Count, Max, Sum
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.http import http_date, quote_etag
+from django.views.decorators.http import condition
+
+VERSION_AGGREGATES = {
+    'count': Count('id', distinct=True),
+    'id_sum': Sum('id', distinct=True),
+    'last_modified': Max('updated_at'),
+}
+
+
+def version_from_stats(stats):
+    last_modified = stats['last_modified']
+    stamp = last_modified.timestamp() if last_modified else 0
+    return f"{stats['count']}-{stats['id_sum'] or 0}-{stamp}", last_modified
+
+
+def project_version(queryset):
+    """``(etag, last_modified)`` of a project queryset, from one aggregate query.
+
+    The count and the id sum catch removals, ``updated_at`` catches edits and
+    membership changes.
+    """
+    return version_from_stats(queryset.order_by().aggregate(**VERSION_AGGREGATES))
+
+
+async def aproject_version(queryset):
+    return version_from_stats(await queryset.order_by().aaggregate(**VERSION_AGGREGATES))
+
+
+def request_etag(etag, request):
+    # A página pedida (cursor/page_size) faz parte da representação
+    key = f"{etag}-{request.GET.urlencode()}"
+    return hashlib.md5(key.encode()).hexdigest()
+
+
+def validators(etag, last_modified, request, detail):
+    """``{'etag', 'last_modified'}`` to send, None for the ones to leave out."""
+    if not detail:
+        return {'etag': request_etag(etag, request), 'last_modified': None}
+    if last_modified is None:
+        # O projeto não existe: a view responde 404
+        return {'etag': None, 'last_modified': None}
+    return {'etag': request_etag(etag, request), 'last_modified': last_modified}
+
+
+def conditional_get(get_queryset, detail=False):
+    """Decorate a view ``get`` to answer ``If-None-Match`` (and, for
+    ``detail`` views, ``If-Modified-Since``).
+
+    ``get_queryset(view, request, **kwargs)`` returns the projects the
+    response depends on; their version is computed once per request and
+    a 304 is returned before anything is serialized. Responses are marked
+    ``no-cache`` so browsers always revalidate.
+
+    Lists get no ``Last-Modified``: when a project leaves the list (a member
+    removed, a project hidden) the newest ``updated_at`` stays the same or
+    goes back, and only the ETag's count and id sum notice. A detail view
+    whose project does not exist answers its 404 without validators.
+    """
+    def decorator(get):
+        def wrapper(view, request, *args, **kwargs):
+            versions = {}
+
+            def version(request, *args, **kwargs):
+                if not versions:
+                    etag, last_modified = project_version(get_queryset(view, request, **kwargs))
+                    versions.update(validators(etag, last_modified, request, detail))
+                return versions
+
+            @condition(
+                etag_func=lambda *a, **kw: version(*a, **kw)['etag'],
+                last_modified_func=lambda *a, **kw: version(*a, **kw)['last_modified'],
+            )
+            def view_func(request, *args, **kwargs):
+                return get(view, request, *args, **kwargs)
+
+            response = view_func(request, *args, **kwargs)
+            patch_cache_control(response, private=True, no_cache=True)
+            return response
+        return wrapper
+    return decorator
+
+
+def async_conditional_get(get_queryset, detail=False):
+    """``conditional_get`` for async function views.
+
+    ``get_queryset(request, user, **kwargs)`` returns the projects the
+    response depends on; the version aggregate runs through the async ORM.
+    """
+    def decorator(view_func):
+        async def wrapper(request, user, *args, **kwargs):
+            version = validators(*await aproject_version(get_queryset(request, user, **kwargs)), request, detail)
+            if version['etag'] is None:
+                return await view_func(request, user, *args, **kwargs)
+            etag = quote_etag(version['etag'])
+            last_modified = version['last_modified']
+            timestamp = int(last_modified.timestamp()) if last_modified else None
+
+            response = get_conditional_response(request, etag=etag, last_modified=timestamp)
+            if response is None:
+                response = await view_func(request, user, *args, **kwargs)
+            if timestamp and not response.has_header('Last-Modified'):
+                response.headers['Last-Modified'] = http_date(timestamp)
+            response.headers.setdefault('ETag', etag)
+            patch_cache_control(response, private=True, no_cache=True)
+            return response
+        return wrapper
+    return decorator
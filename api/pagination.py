@@ -0,0 +1,139 @@
+import json
+import operator
+from functools import reduce
+
+from django.conf import settings
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.db.models import Q
+from rest_framework import pagination
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import _reverse_ordering
+
+
+class CursorPagination(pagination.CursorPagination):
+    """Keyset pagination with the page sizes from the settings."""
+    ordering = 'id'
+    page_size = settings.API_PAGE_SIZE
+    page_size_query_param = 'page_size'
+
+    @property
+    def max_page_size(self):
+        return settings.API_MAX_PAGE_SIZE
+
+
+class OptInCursorPagination(CursorPagination):
+    """Keyset pagination on the primary key.
+
+    Only applied when the client sends ``cursor`` or ``page_size``, so the
+    existing callers keep receiving plain lists.
+    """
+
+    def paginate_queryset(self, queryset, request, view=None):
+        params = request.query_params
+        if self.cursor_query_param not in params and self.page_size_query_param not in params:
+            return None
+        return super().paginate_queryset(queryset, request, view)
+
+
+class KeysetPagination(CursorPagination):
+    """Keyset pagination on every ordering field, with ``id`` last.
+
+    DRF's cursor keeps only the first ordering field and, when it repeats
+    (many tasks due on the same day), falls back to an offset capped at
+    ``offset_cutoff``, past which pages repeat. Here the cursor holds the
+    values of all the fields and ``id`` breaks the ties, so every position
+    is unique and the next page is always a single indexed range.
+    """
+
+    def get_ordering(self, request, queryset, view):
+        ordering = super().get_ordering(request, queryset, view)
+        if ordering[-1].lstrip('-') not in ('id', 'pk'):
+            ordering += ('id',)
+        return ordering
+
+    def _get_position_from_instance(self, instance, ordering):
+        values = [
+            instance[field.lstrip('-')] if isinstance(instance, dict) else getattr(instance, field.lstrip('-'))
+            for field in ordering
+        ]
+        return json.dumps([str(value) for value in values])
+
+    def filter_after(self, queryset, position, reverse):
+        """The rows after ``position`` in the ordering, before it with ``reverse``.
+
+        ``(a, b) > (x, y)`` is ``a > x OR (a = x AND b > y)``, with ``<`` for
+        the descending fields.
+        """
+        try:
+            values = json.loads(position)
+        except ValueError:
+            raise NotFound(self.invalid_cursor_message)
+        if not isinstance(values, list) or len(values) != len(self.ordering):
+            raise NotFound(self.invalid_cursor_message)
+
+        names = [field.lstrip('-') for field in self.ordering]
+        conditions = []
+        for number, field in enumerate(self.ordering):
+            lookup = '__lt' if field.startswith('-') != reverse else '__gt'
+            equal = dict(zip(names[:number], values[:number]))
+            conditions.append(Q(**equal, **{names[number] + lookup: values[number]}))
+        try:
+            return queryset.filter(reduce(operator.or_, conditions))
+        except (ValueError, TypeError, DjangoValidationError):
+            raise NotFound(self.invalid_cursor_message)
+
+    def paginate_queryset(self, queryset, request, view=None):
+        # O mesmo de CursorPagination, trocando o filtro pelo primeiro campo
+        # pelo filter_after; as posições são únicas, então o offset fica em 0
+        self.request = request
+        self.page_size = self.get_page_size(request)
+        if not self.page_size:
+            return None
+
+        self.base_url = request.build_absolute_uri()
+        self.ordering = self.get_ordering(request, queryset, view)
+
+        self.cursor = self.decode_cursor(request)
+        if self.cursor is None:
+            (offset, reverse, current_position) = (0, False, None)
+        else:
+            (offset, reverse, current_position) = self.cursor
+
+        if reverse:
+            queryset = queryset.order_by(*_reverse_ordering(self.ordering))
+        else:
+            queryset = queryset.order_by(*self.ordering)
+
+        if current_position is not None:
+            queryset = self.filter_after(queryset, current_position, reverse)
+
+        results = list(queryset[offset:offset + self.page_size + 1])
+        self.page = list(results[:self.page_size])
+
+        if len(results) > len(self.page):
+            has_following_position = True
+            following_position = self._get_position_from_instance(results[-1], self.ordering)
+        else:
+            has_following_position = False
+            following_position = None
+
+        if reverse:
+            self.page = list(reversed(self.page))
+            self.has_next = (current_position is not None) or (offset > 0)
+            self.has_previous = has_following_position
+            if self.has_next:
+                self.next_position = current_position
+            if self.has_previous:
+                self.previous_position = following_position
+        else:
+            self.has_next = has_following_position
+            self.has_previous = (current_position is not None) or (offset > 0)
+            if self.has_next:
+                self.next_position = following_position
+            if self.has_previous:
+                self.previous_position = current_position
+
+        if (self.has_previous or self.has_next) and self.template is not None:
+            self.display_page_controls = True
+
+        return self.page
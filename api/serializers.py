@@ -1,8 +1,17 @@
-from teamflow.models import (Project,
-                             Task)
+from teamflow.models import (Job,
+                             Project,
+                             Task,
+                             TaskPriority,
+                             TaskStatus)
 
+from collections import defaultdict
+from operator import attrgetter
+
+from django.conf import settings
+from django.db import models
 from django.contrib.auth import get_user_model
 from rest_framework import serializers
+from teamflow.counters import empty_counts, task_counts
 
 
 class UserSerializer(serializers.ModelSerializer):
@@ -13,10 +22,138 @@ class UserSerializer(serializers.ModelSerializer):
         fields = ['email', 'username']
         
 
+def count_labels(counts):
+    return {status.label: count for status, count in counts.items()}
+
+
+class LabelChoiceField(serializers.Field):
+    """An integer choice (TaskStatus, TaskPriority) read and written by its label"""
+    default_error_messages = {
+        'invalid_choice': '"{input}" is not a valid choice.',
+    }
+
+    def __init__(self, choices, **kwargs):
+        self.choices = choices
+        super().__init__(**kwargs)
+
+    def to_representation(self, value):
+        return self.choices(value).label
+
+    def to_internal_value(self, data):
+        choice = self.choices.from_label(data)
+        if choice is None:
+            self.fail('invalid_choice', input=data)
+        return choice
+
+
+PROJECT_COLUMNS = ('id', 'name', 'description', 'start_date', 'due_date', 'created_by_id')
+
+
+def membership_rows(project_ids):
+    """``(project_id, user_id)`` of the given projects, from the through table."""
+    return Project.members.through.objects.filter(
+        project_id__in=project_ids
+    ).order_by('project_id', 'user_id').values_list('project_id', 'user_id')
+
+
+def project_dicts(rows, memberships, counts):
+    """Serialized projects from ``PROJECT_COLUMNS`` tuples, membership rows
+    and ``task_counts``; shared by the list serializer and the async views."""
+    members = defaultdict(list)
+    for project_id, user_id in memberships:
+        members[project_id].append(user_id)
+
+    return [
+        {
+            'id': project_id,
+            'name': str(name),
+            'description': str(description),
+            'start_date': start_date.isoformat(),
+            'due_date': due_date.isoformat(),
+            'created_by': created_by_id,
+            'members': members[project_id],
+            'task_counts': count_labels(counts.get(project_id) or empty_counts()),
+        }
+        for project_id, name, description, start_date, due_date, created_by_id in rows
+    ]
+
+
+class ProjectListSerializer(serializers.ListSerializer):
+    """Fast path for ``ProjectSerializer(many=True)``.
+
+    Reads the project columns as tuples (or with one attrgetter for an
+    already loaded page), loads the member ids of every project with a
+    single query on the through table and the task counters with another,
+    and builds the dicts directly, producing the same output as the
+    per-field DRF machinery.
+    """
+    columns = PROJECT_COLUMNS
+
+    def to_representation(self, data):
+        if isinstance(data, models.manager.BaseManager):
+            data = data.all()
+
+        if isinstance(data, models.QuerySet):
+            rows = list(data.values_list(*self.columns))
+            project_ids = data.values('id')
+        else:
+            get_row = attrgetter(*self.columns)
+            rows = [get_row(project) for project in data]
+            project_ids = [row[0] for row in rows]
+
+        if not rows:
+            return []
+        return project_dicts(rows, membership_rows(project_ids), task_counts(project_ids))
+
+
 class ProjectSerializer(serializers.ModelSerializer):
     """Serializer for Project"""
+    task_counts = serializers.SerializerMethodField()
+
+    class Meta:
+        model = Project
+        fields = ['id', 'name', 'description', 'start_date', 'due_date', 'created_by', 'members', 'task_counts']
+        list_serializer_class = ProjectListSerializer
+
+    def get_task_counts(self, obj):
+        # Contadores mantidos por teamflow.counters, em vez de contar as tarefas
+        counts = empty_counts()
+        for row in obj.task_counts.all():
+            counts[TaskStatus(row.status)] = row.count
+        return count_labels(counts)
+
+
+class TaskSerializer(serializers.ModelSerializer):
+    """Serializer for Task"""
+    status = LabelChoiceField(TaskStatus)
+    priority = LabelChoiceField(TaskPriority)
 
     class Meta:
-        model = Project()
-        fields = ['id', 'name', 'description', 'start_date', 'due_date', 'created_by', 'members']
+        model = Task
+        fields = ['id', 'title', 'description', 'status', 'priority', 'due_date', 'assigned_to', 'project']
+
+
+class AddMembersSerializer(serializers.Serializer):
+    """Serializer for a batch of member emails"""
+    emails = serializers.ListField(
+        child=serializers.EmailField(),
+        allow_empty=False,
+        max_length=settings.API_MAX_BATCH_SIZE,
+    )
 
+
+class BulkTaskStatusSerializer(serializers.Serializer):
+    """Serializer for a status change applied to many tasks"""
+    ids = serializers.ListField(
+        child=serializers.IntegerField(min_value=1),
+        allow_empty=False,
+        max_length=settings.API_MAX_BATCH_SIZE,
+    )
+    status = LabelChoiceField(TaskStatus)
+
+
+class JobSerializer(serializers.ModelSerializer):
+    """Serializer for the progress of a background job"""
+    class Meta:
+        model = Job
+        fields = ['id', 'kind', 'state', 'total', 'done', 'result', 'error', 'created_at', 'updated_at']
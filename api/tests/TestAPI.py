@@ -1,11 +1,21 @@
+import csv
+import json
+import time
+from django.conf import settings
 from django.test import TestCase
 from django.contrib.auth import get_user_model
 from rest_framework import status
+from rest_framework import serializers
+from rest_framework.renderers import JSONRenderer
 from rest_framework.test import APIClient
+from api.serializers import ProjectSerializer
 from django.utils import timezone
 from datetime import timedelta
-from teamflow.models import Project
+from teamflow.models import Job, Project, Task, TaskPriority, TaskStatus
+from teamflow.tests.TestQueryBudgets import OTHER_QUERY_BUDGETS, QUERY_BUDGETS
 from django.urls import reverse
+from django.utils.http import http_date
+from django.core.files.uploadedfile import SimpleUploadedFile
 
 def create_user(username=None, email='test@email.com'):
     """Create user for testing authenticated features"""
@@ -127,3 +137,654 @@ class TestAPI(TestCase):
         self.assertEqual(project['description'], self.project.description)
         self.assertEqual(project['start_date'], self.project.start_date)
         self.assertEqual(project['due_date'], self.project.due_date)
+
+
+class TestAPIPagination(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.user = create_user()
+        self.client.force_login(self.user)
+        for i in range(5):
+            create_user(email=f"user{i}@example.com")
+
+    def test_unpaginated_by_default(self):
+        response = self.client.get(reverse('return_all_users'))
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.json()), 6)
+
+    def test_cursor_pages_cover_all_rows(self):
+        url = reverse('return_all_users') + '?page_size=4'
+        emails = []
+        pages = 0
+        while url:
+            response = self.client.get(url)
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            data = response.json()
+            self.assertLessEqual(len(data['results']), 4)
+            emails += [user['email'] for user in data['results']]
+            url = data['next']
+            pages += 1
+
+        self.assertEqual(pages, 2)
+        expected = list(get_user_model().objects.order_by('id').values_list('email', flat=True))
+        self.assertEqual(emails, expected)
+
+    def test_page_size_capped(self):
+        with self.settings(API_MAX_PAGE_SIZE=2):
+            response = self.client.get(reverse('return_all_users'), {'page_size': 1000})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.json()['results']), 2)
+
+    def test_project_lists_paginated(self):
+        for _ in range(3):
+            project = create_project(self.user)
+            project.members.add(self.user)
+
+        for name in ['return_all_projects', 'return_user_projects']:
+            response = self.client.get(reverse(name), {'page_size': 2})
+            data = response.json()
+            self.assertEqual(len(data['results']), 2)
+            self.assertIsNotNone(data['next'])
+
+        response = self.client.get(reverse('project-members', kwargs={'pk': project.id}), {'page_size': 2})
+        self.assertEqual([user['email'] for user in response.json()['results']], [self.user.email])
+
+
+class TestSearchUsersAPI(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.user = create_user(username='Owner')
+        self.client.force_login(self.user)
+        self.project = create_project(self.user)
+        self.project.members.add(self.user)
+
+    def search(self, **params):
+        response = self.client.get(reverse('search_users'), params)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return [user['email'] for user in response.json()]
+
+    def test_prefix_match_on_username_and_email(self):
+        create_user(username='Alice', email='alice@example.com')
+        create_user(username='Bob', email='ALBERT@example.com')
+        create_user(username='Carol', email='carol@example.com')
+
+        self.assertEqual(set(self.search(q='al')), {'alice@example.com', 'ALBERT@example.com'})
+        self.assertEqual(self.search(q='bo'), ['ALBERT@example.com'])
+        self.assertEqual(self.search(q='arol'), [])
+
+    def test_members_excluded(self):
+        member = create_user(username='Alice', email='alice@example.com')
+        create_user(username='Alina', email='alina@example.com')
+        self.project.members.add(member)
+
+        self.assertEqual(self.search(q='ali', project=self.project.id), ['alina@example.com'])
+
+    def test_empty_query_returns_nothing(self):
+        self.assertEqual(self.search(q=''), [])
+
+    def test_results_limited(self):
+        get_user_model().objects.bulk_create([
+            get_user_model()(username=f'User{i}', email=f'user{i}@example.com') for i in range(10)
+        ])
+        with self.settings(API_SEARCH_LIMIT=3):
+            self.assertEqual(len(self.search(q='user')), 3)
+
+
+class TestAddProjectMembersAPI(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.user = create_user()
+        self.client.force_login(self.user)
+        self.project = create_project(self.user)
+        self.project.members.add(self.user)
+        self.url = reverse('project-members-add', kwargs={'pk': self.project.id})
+
+    def test_batch_results(self):
+        new_user = create_user(email="new@example.com")
+        member = create_user(email="member@example.com")
+        self.project.members.add(member)
+
+        payload = {'emails': ['NEW@example.com', 'member@example.com', 'missing@example.com']}
+        response = self.client.post(self.url, payload, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json()['results'], [
+            {'email': 'NEW@example.com', 'status': 'added'},
+            {'email': 'member@example.com', 'status': 'already_member'},
+            {'email': 'missing@example.com', 'status': 'not_found'},
+        ])
+        self.assertTrue(self.project.members.filter(pk=new_user.pk).exists())
+
+    def test_query_count_constant(self):
+        size = settings.API_SYNC_BATCH_SIZE
+        get_user_model().objects.bulk_create([
+            get_user_model()(username=f'User{i}', email=f'user{i}@example.com') for i in range(size)
+        ])
+        payload = {'emails': [f'user{i}@example.com' for i in range(size)]}
+
+        with self.assertNumQueries(QUERY_BUDGETS['project-members-add']):
+            response = self.client.post(self.url, payload, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(self.project.members.count(), size + 1)
+
+    def test_large_batch_runs_as_job(self):
+        size = settings.API_SYNC_BATCH_SIZE + 50
+        get_user_model().objects.bulk_create([
+            get_user_model()(username=f'User{i}', email=f'user{i}@example.com') for i in range(size)
+        ])
+        payload = {'emails': [f'user{i}@example.com' for i in range(size)] + ['missing@example.com']}
+
+        # Celery roda em modo eager nos testes; a tarefa é enfileirada no commit
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.post(self.url, payload, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_202_ACCEPTED)
+        self.assertEqual(self.project.members.count(), size + 1)
+
+        job = self.client.get(response.json()['url']).json()
+        self.assertEqual(job['state'], 'succeeded')
+        self.assertEqual((job['done'], job['total']), (size + 1, size + 1))
+        self.assertEqual(job['result']['results'][-1], {'email': 'missing@example.com', 'status': 'not_found'})
+
+    def test_not_creator_forbidden(self):
+        other = create_user(email="other@example.com")
+        self.client.force_login(other)
+
+        response = self.client.post(self.url, {'emails': [other.email]}, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+        self.assertFalse(self.project.members.filter(pk=other.pk).exists())
+
+    def test_invalid_payload(self):
+        response = self.client.post(self.url, {'emails': []}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+        response = self.client.post(self.url, {'emails': ['not-an-email']}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+
+
+def create_task(user, project):
+    return Task.objects.create(
+        title="Task",
+        description="Task Description",
+        status=TaskStatus.NOT_STARTED,
+        priority=TaskPriority.LOW,
+        due_date=project.due_date,
+        assigned_to=user,
+        project=project
+    )
+
+
+class TestBulkTaskStatusAPI(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.user = create_user()
+        self.client.force_login(self.user)
+        self.project = create_project(self.user)
+        self.project.members.add(self.user)
+        self.url = reverse('bulk_task_status')
+
+    def test_updates_owned_refuses_others(self):
+        other = create_user(email="other@example.com")
+        mine = [create_task(self.user, self.project) for _ in range(3)]
+        theirs = create_task(other, self.project)
+        missing_id = theirs.id + 100
+
+        payload = {'ids': [task.id for task in mine] + [theirs.id, missing_id], 'status': 'Concluded'}
+        response = self.client.post(self.url, payload, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json(), {
+            'updated': [task.id for task in mine],
+            'refused': [theirs.id, missing_id],
+        })
+        self.assertEqual(Task.objects.filter(status=TaskStatus.CONCLUDED).count(), 3)
+        theirs.refresh_from_db()
+        self.assertEqual(theirs.status, TaskStatus.NOT_STARTED)
+
+    def test_query_count_constant(self):
+        tasks = [create_task(self.user, self.project) for _ in range(50)]
+        payload = {'ids': [task.id for task in tasks], 'status': 'In Progress'}
+
+        with self.assertNumQueries(QUERY_BUDGETS['bulk_task_status']):
+            response = self.client.post(self.url, payload, format='json')
+
+        self.assertEqual(len(response.json()['updated']), 50)
+
+    def test_invalid_status(self):
+        task = create_task(self.user, self.project)
+        response = self.client.post(self.url, {'ids': [task.id], 'status': 'Done?'}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+
+class TestImportProjectTasksAPI(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.user = create_user()
+        self.client.force_login(self.user)
+        self.project = create_project(self.user)
+        self.project.members.add(self.user)
+        self.url = reverse('project-tasks-import', kwargs={'pk': self.project.id})
+
+    def upload(self, name, content, **data):
+        upload = SimpleUploadedFile(name, content.encode())
+        return self.client.post(self.url, {'file': upload, **data}, format='multipart')
+
+    def test_csv_upload(self):
+        content = (
+            "title,description,priority,due_date,assigned_to\n"
+            f"Task,Description,Low,{self.project.due_date},{self.user.email}\n"
+            f"Task,Description,Low,not-a-date,{self.user.email}\n"
+        )
+        response = self.upload('tasks.csv', content)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json(), {
+            'created': 1,
+            'error_count': 1,
+            'errors': [{'row': 3, 'error': "Invalid date format."}],
+        })
+
+    def test_format_field_and_unknown_format(self):
+        line = '{"title": "T", "description": "D", "priority": "Low", "due_date": "%s", "assigned_to": "%s"}\n'
+        response = self.upload('tasks.txt', line % (self.project.due_date, self.user.email), file_format='jsonl')
+        self.assertEqual(response.json()['created'], 1)
+
+        response = self.upload('tasks.txt', line)
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_unreadable_file_bad_request(self):
+        header = "title,description,priority,due_date,assigned_to\n"
+        upload = SimpleUploadedFile('tasks.csv', header.encode() + b'T\xff,D,Low,2024-07-15,x\n')
+        response = self.client.post(self.url, {'file': upload}, format='multipart')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertTrue(response.json()['detail'].startswith("Line 2: invalid UTF-8"))
+
+        response = self.upload('tasks.csv', header + 'T' * (csv.field_size_limit() + 1) + '\n')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertTrue(response.json()['detail'].startswith("Line 2: "))
+        self.assertEqual(response.json()['created'], 0)
+
+    def test_not_creator_forbidden(self):
+        other = create_user(email="other@example.com")
+        self.client.force_login(other)
+
+        response = self.upload('tasks.csv', "title\n")
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+
+class TestDashboardCacheStatsAPI(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.user = create_user()
+        self.client.force_login(self.user)
+
+    def test_admin_only(self):
+        response = self.client.get(reverse('dashboard_cache_stats'))
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+        self.user.is_staff = True
+        self.user.save()
+        response = self.client.get(reverse('dashboard_cache_stats'))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(set(response.json()), {'hits', 'misses'})
+
+
+class TestConditionalProjectsAPI(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.user = create_user()
+        self.client.force_login(self.user)
+        self.project = create_project(self.user)
+        self.project.members.add(self.user)
+
+    def assertRevalidates(self, url, change):
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        etag = response['ETag']
+        self.assertIn('no-cache', response['Cache-Control'])
+
+        # Nada é serializado
+        with self.assertNumQueries(OTHER_QUERY_BUDGETS['not_modified']):
+            response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(response.content, b'')
+
+        change()
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotEqual(response['ETag'], etag)
+
+    def test_specific_project(self):
+        url = reverse('return_specific_project', kwargs={'pk': self.project.id})
+
+        def rename():
+            self.project.name = "Renamed"
+            self.project.save()
+
+        self.assertRevalidates(url, rename)
+
+    def test_specific_project_membership_change(self):
+        url = reverse('return_specific_project', kwargs={'pk': self.project.id})
+        member = create_user(email="member@example.com")
+
+        self.assertRevalidates(url, lambda: self.project.members.add(member))
+
+    def test_specific_project_task_counts_change(self):
+        url = reverse('return_specific_project', kwargs={'pk': self.project.id})
+
+        self.assertRevalidates(url, lambda: create_task(self.user, self.project))
+        self.assertEqual(self.client.get(url).json()['task_counts']['Not Started'], 1)
+
+    def test_user_projects(self):
+        url = reverse('return_user_projects')
+        other = create_user(email="member@example.com")
+        joined = create_project(other)
+
+        self.assertRevalidates(url, lambda: self.user.joined_projects.add(joined))
+
+    def test_all_projects_deletion(self):
+        url = reverse('return_all_projects')
+        extra = create_project(self.user)
+
+        self.assertRevalidates(url, extra.delete)
+
+    def test_if_modified_since(self):
+        url = reverse('return_specific_project', kwargs={'pk': self.project.id})
+        last_modified = self.client.get(url)['Last-Modified']
+
+        response = self.client.get(url, HTTP_IF_MODIFIED_SINCE=last_modified)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+    def test_list_if_modified_since_after_member_removed(self):
+        url = reverse('return_user_projects')
+        other = create_user(email="member@example.com")
+        joined = create_project(other)
+        joined.members.add(other, self.user)
+
+        response = self.client.get(url)
+        self.assertEqual(len(response.json()), 2)
+        # Sair da lista não avança o maior updated_at: as listas só mandam ETag
+        self.assertFalse(response.has_header('Last-Modified'))
+
+        joined.members.remove(self.user)
+        response = self.client.get(url, HTTP_IF_MODIFIED_SINCE=http_date(time.time() + 60))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual([project['id'] for project in response.json()], [self.project.id])
+
+    def test_specific_project_if_modified_since_after_member_removed(self):
+        url = reverse('return_specific_project', kwargs={'pk': self.project.id})
+        member = create_user(email="member@example.com")
+        self.project.members.add(member)
+        Project.objects.filter(pk=self.project.id).update(updated_at=timezone.now() - timedelta(minutes=5))
+        last_modified = self.client.get(url)['Last-Modified']
+
+        self.project.members.remove(member)
+        response = self.client.get(url, HTTP_IF_MODIFIED_SINCE=last_modified)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotIn(member.id, response.json()['members'])
+
+    def test_missing_project_has_no_validators(self):
+        response = self.client.get(reverse('return_specific_project', kwargs={'pk': 999}))
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+        self.assertFalse(response.has_header('ETag'))
+        self.assertFalse(response.has_header('Last-Modified'))
+
+    def test_pages_have_distinct_etags(self):
+        create_project(self.user)
+        url = reverse('return_all_projects')
+
+        first = self.client.get(url, {'page_size': 1})
+        whole = self.client.get(url)
+        self.assertNotEqual(first['ETag'], whole['ETag'])
+
+
+class TestProjectListSerializer(TestCase):
+    def setUp(self):
+        self.users = [create_user(email=f"user{i}@example.com") for i in range(3)]
+        for i in range(5):
+            project = create_project(self.users[i % 3])
+            project.members.add(*self.users[:i % 3 + 1])
+            create_task(self.users[0], project)
+        Project.objects.create(
+            name="Ünicode ✓", description="", start_date="2024-01-01",
+            due_date="2024-12-31", created_by=self.users[0],
+        )
+
+    def test_output_identical_to_generic_serializer(self):
+        queryset = Project.objects.order_by('id')
+        generic = serializers.ListSerializer(child=ProjectSerializer(), instance=queryset).data
+
+        for data in (queryset, list(queryset)):
+            fast = ProjectSerializer(data, many=True).data
+            self.assertEqual(JSONRenderer().render(fast), JSONRenderer().render(generic))
+
+    def test_members_and_counts_loaded_in_one_query_each(self):
+        queryset = Project.objects.order_by('id')
+
+        # Projetos, membros e contadores de tarefas
+        with self.assertNumQueries(3):
+            ProjectSerializer(queryset, many=True).data
+
+
+class TestProjectSnapshotAPI(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.user = create_user()
+        self.client.force_login(self.user)
+        self.project = create_project(self.user)
+        self.project.members.add(self.user)
+        create_task(self.user, self.project)
+
+    def test_export_streams_and_import_restores(self):
+        url = reverse('export_project', kwargs={'pk': self.project.id})
+        response = self.client.get(url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response.streaming)
+        self.assertEqual(response['Content-Type'], 'application/x-ndjson')
+        content = b''.join(response.streaming_content)
+
+        response = self.client.post(
+            reverse('import_project'),
+            {'file': SimpleUploadedFile('project.ndjson', content)},
+            format='multipart',
+        )
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response.json()['tasks'], 1)
+        self.assertEqual(Task.objects.filter(project_id=response.json()['id']).count(), 1)
+
+    def test_export_json(self):
+        url = reverse('export_project', kwargs={'pk': self.project.id})
+        response = self.client.get(url, {'file_format': 'json'})
+
+        document = json.loads(b''.join(response.streaming_content))
+        self.assertEqual(document['project']['name'], self.project.name)
+
+    def test_export_not_member_forbidden(self):
+        other = create_user(email="other@example.com")
+        self.client.force_login(other)
+
+        response = self.client.get(reverse('export_project', kwargs={'pk': self.project.id}))
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+    def test_import_invalid_snapshot(self):
+        response = self.client.post(
+            reverse('import_project'),
+            {'file': SimpleUploadedFile('project.ndjson', b'{"type": "task"}\n')},
+            format='multipart',
+        )
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_import_bad_lines_report_line(self):
+        response = self.client.get(reverse('export_project', kwargs={'pk': self.project.id}))
+        lines = b''.join(response.streaming_content).splitlines(keepends=True)
+        bad_lines = {
+            b'{"type": "task", "title": null}\n': "Line 3: missing or invalid title",
+            '{"type": "member", "email": "ç"}\n'.encode('latin-1'): "Line 3: invalid UTF-8",
+        }
+        for bad_line, message in bad_lines.items():
+            content = b''.join(lines[:2] + [bad_line])
+            response = self.client.post(
+                reverse('import_project'),
+                {'file': SimpleUploadedFile('project.ndjson', content)},
+                format='multipart',
+            )
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+            self.assertIn(message, response.json()['detail'])
+        self.assertEqual(Project.objects.count(), 1)
+
+
+class TestTaskAPI(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.user = create_user()
+        self.other = create_user(email="other@example.com")
+        self.client.force_login(self.user)
+
+        self.own = create_project(self.user)
+        self.own.members.add(self.user, self.other)
+        self.joined = create_project(self.other)
+        self.joined.members.add(self.user, self.other)
+
+        self.own_mine = create_task(self.user, self.own)
+        self.own_theirs = create_task(self.other, self.own)
+        self.joined_mine = create_task(self.user, self.joined)
+        self.joined_theirs = create_task(self.other, self.joined)
+
+    def list_ids(self, **params):
+        response = self.client.get(reverse('task_list'), params)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return {task['id'] for task in response.json()['results']}
+
+    def test_visibility(self):
+        self.assertEqual(self.list_ids(), {self.own_mine.id, self.own_theirs.id, self.joined_mine.id})
+        self.assertEqual(self.list_ids(project=self.joined.id), {self.joined_mine.id})
+        self.assertEqual(self.list_ids(assigned_to=self.other.id), {self.own_theirs.id})
+        self.assertEqual(self.list_ids(assigned_to='me'), {self.own_mine.id, self.joined_mine.id})
+
+    def test_hidden_project_tasks_left_out(self):
+        Project.objects.filter(pk=self.joined.pk).update(hidden=True)
+        self.assertEqual(self.list_ids(assigned_to='me'), {self.own_mine.id})
+
+        url = reverse('task_detail', kwargs={'pk': self.joined_mine.id})
+        self.assertEqual(self.client.get(url).status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_filters(self):
+        Task.objects.filter(pk=self.joined_mine.pk).update(
+            priority=TaskPriority.HIGH, due_date=timezone.now().date() - timedelta(days=1)
+        )
+        Task.objects.filter(pk=self.own_mine.pk).update(status=TaskStatus.CONCLUDED)
+
+        self.assertEqual(self.list_ids(status='concluded'), {self.own_mine.id})
+        self.assertEqual(
+            self.list_ids(assigned_to='me', priority='High', overdue='true'),
+            {self.joined_mine.id},
+        )
+        today = timezone.now().date()
+        self.assertEqual(self.list_ids(due_before=today.isoformat()), {self.joined_mine.id})
+        self.assertEqual(
+            self.list_ids(due_after=today.isoformat(), project=self.own.id),
+            {self.own_mine.id, self.own_theirs.id},
+        )
+
+    def test_ordering_and_pages(self):
+        Task.objects.filter(pk=self.own_theirs.pk).update(due_date=timezone.now().date())
+        response = self.client.get(reverse('task_list'), {'page_size': 2})
+        data = response.json()
+        self.assertEqual([task['id'] for task in data['results']], [self.own_theirs.id, self.own_mine.id])
+        self.assertIsNotNone(data['next'])
+
+        response = self.client.get(reverse('task_list'), {'ordering': '-id'})
+        ids = [task['id'] for task in response.json()['results']]
+        self.assertEqual(ids, sorted(ids, reverse=True))
+
+    def walk(self, pages, **params):
+        ids, url = [], reverse('task_list')
+        for _ in range(pages):
+            data = self.client.get(url, params).json()
+            ids += [task['id'] for task in data['results']]
+            url, params = data['next'], {}
+            if url is None:
+                return ids, data
+        self.fail(f"Still a next page after {pages} pages")
+
+    def test_pages_past_offset_cutoff_on_one_date(self):
+        # Mais tarefas no mesmo dia que o offset_cutoff (1000) do cursor do DRF
+        Task.objects.bulk_create(
+            Task(title=f"Task {i}", description="D", status=TaskStatus.NOT_STARTED, priority=TaskPriority.LOW,
+                 due_date=self.own.due_date, assigned_to=self.user, project=self.own)
+            for i in range(1600)
+        )
+        expected = set(Task.objects.filter(project__in=[self.own, self.joined]).exclude(
+            pk=self.joined_theirs.pk).values_list('id', flat=True))
+
+        for ordering in (None, '-priority'):
+            with self.subTest(ordering=ordering):
+                params = {'page_size': 500, **({'ordering': ordering} if ordering else {})}
+                ids, last_page = self.walk(5, **params)
+                self.assertEqual(len(ids), len(expected))
+                self.assertEqual(set(ids), expected)
+
+                # E de volta a partir da última página
+                previous = self.client.get(last_page['previous']).json()
+                end = len(ids) - len(last_page['results'])
+                self.assertEqual([task['id'] for task in previous['results']], ids[end - 500:end])
+
+    def test_invalid_cursor(self):
+        # p=["abc"] e p=["x", "y"]: número de campos errado e valores que não são data e id
+        for cursor in ('cD1bImFiYyJd', 'cD1bIngiLCAieSJd'):
+            response = self.client.get(reverse('task_list'), {'cursor': cursor})
+            self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_invalid_params(self):
+        response = self.client.get(reverse('task_list'), {'due_after': '01/02/2024'})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+        response = self.client.get(reverse('task_list'), {'project': 'abc'})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+        response = self.client.get(reverse('task_list'), {'status': 'Done'})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_detail(self):
+        url = reverse('task_detail', kwargs={'pk': self.own_theirs.id})
+        data = self.client.get(url).json()
+        self.assertEqual(data['assigned_to'], self.other.id)
+        self.assertEqual((data['status'], data['priority']), ('Not Started', 'Low'))
+
+        url = reverse('task_detail', kwargs={'pk': self.joined_theirs.id})
+        self.assertEqual(self.client.get(url).status_code, status.HTTP_404_NOT_FOUND)
+
+
+class TestJobStatusAPI(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.user = create_user()
+        self.client.force_login(self.user)
+
+    def test_only_owner_sees_job(self):
+        job = Job.objects.create(kind='delete_project', created_by=self.user, total=10, done=4)
+
+        response = self.client.get(reverse('job_status', kwargs={'pk': job.id}))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json()['state'], 'pending')
+        self.assertEqual(response.json()['done'], 4)
+
+        self.client.force_login(create_user(email="other@example.com"))
+        response = self.client.get(reverse('job_status', kwargs={'pk': job.id}))
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_job_list(self):
+        deletion = Job.objects.create(kind='delete_project', created_by=self.user, total=10, done=4)
+        batch = Job.objects.create(kind='add_members', created_by=self.user)
+        Job.objects.create(kind='delete_project', created_by=create_user(email="other@example.com"))
+
+        response = self.client.get(reverse('job_list'))
+        self.assertEqual([job['id'] for job in response.json()], [batch.id, deletion.id])
+
+        response = self.client.get(reverse('job_list'), {'kind': 'delete_project'})
+        self.assertEqual(response.json(), [self.client.get(reverse('job_status', kwargs={'pk': deletion.id})).json()])
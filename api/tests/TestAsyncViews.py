@@ -0,0 +1,127 @@
+import json
+from datetime import timedelta
+
+from asgiref.sync import async_to_sync
+from django.contrib.auth import get_user_model
+from django.contrib.auth.models import AnonymousUser
+from django.test import AsyncRequestFactory, TestCase
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from api import async_views
+from teamflow.models import Project, Task, TaskPriority, TaskStatus
+
+
+def create_user(username='TestUsername', email='test@email.com'):
+    return get_user_model().objects.create_user(username=username, email=email, password='testpass123')
+
+
+def create_project(user, name="Test Project"):
+    today = timezone.now().date()
+    return Project.objects.create(
+        name=name,
+        description="Test Project Description",
+        start_date=today,
+        due_date=today + timedelta(days=2),
+        created_by=user
+    )
+
+
+def create_task(user, project):
+    return Task.objects.create(
+        title="Task",
+        description="Task Description",
+        status=TaskStatus.IN_PROGRESS,
+        priority=TaskPriority.HIGH,
+        due_date=project.due_date,
+        assigned_to=user,
+        project=project
+    )
+
+
+class TestAsyncReadViews(TestCase):
+    """The async views answer like the DRF views they replace under ASGI"""
+
+    def setUp(self):
+        self.client = APIClient()
+        self.user = create_user()
+        self.other = create_user(username='Other', email='other@example.com')
+        self.client.force_login(self.user)
+
+        self.project = create_project(self.user)
+        self.project.members.add(self.user, self.other)
+        create_task(self.other, self.project)
+        self.foreign = create_project(self.other, name="Foreign")
+        self.foreign.members.add(self.other)
+        self.factory = AsyncRequestFactory()
+
+    def call(self, view, url, user=None, **kwargs):
+        user = user or self.user
+        request = self.factory.get(url, headers=kwargs.pop('headers', None))
+
+        async def auser():
+            return user
+
+        request.user = user
+        request.auser = auser
+        return async_to_sync(view)(request, **kwargs)
+
+    def assertSameAsSync(self, view, url, **kwargs):
+        expected = self.client.get(url)
+        response = self.call(view, url, **kwargs)
+        self.assertEqual(response.status_code, expected.status_code)
+        self.assertEqual(json.loads(response.content), expected.json())
+        return response
+
+    def test_users(self):
+        self.assertSameAsSync(async_views.users, reverse('return_all_users'))
+
+    def test_projects(self):
+        self.assertSameAsSync(async_views.projects, reverse('return_all_projects'))
+
+    def test_user_projects(self):
+        response = self.assertSameAsSync(async_views.current_user_projects, reverse('return_user_projects'))
+        self.assertEqual([project['id'] for project in json.loads(response.content)], [self.project.id])
+
+    def test_project_detail(self):
+        url = reverse('return_specific_project', kwargs={'pk': self.project.id})
+        response = self.assertSameAsSync(async_views.project_detail, url, pk=self.project.id)
+        self.assertEqual(json.loads(response.content)['task_counts']['In Progress'], 1)
+
+    def test_missing_project(self):
+        url = reverse('return_specific_project', kwargs={'pk': 999})
+        self.assertSameAsSync(async_views.project_detail, url, pk=999)
+
+    def test_paginated_request_uses_sync_view(self):
+        url = reverse('return_all_projects') + '?page_size=1'
+        response = self.assertSameAsSync(async_views.projects, url)
+        self.assertEqual(len(json.loads(response.content)['results']), 1)
+
+    def test_anonymous_forbidden(self):
+        response = self.call(async_views.projects, reverse('return_all_projects'), user=AnonymousUser())
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+    def test_etag_matches_sync_view(self):
+        url = reverse('return_specific_project', kwargs={'pk': self.project.id})
+        etag = self.client.get(url)['ETag']
+
+        response = self.call(async_views.project_detail, url, pk=self.project.id)
+        self.assertEqual(response['ETag'], etag)
+        self.assertIn('no-cache', response['Cache-Control'])
+
+        # Só a consulta de versão
+        with self.assertNumQueries(1):
+            response = self.call(async_views.project_detail, url, pk=self.project.id,
+                                 headers={'If-None-Match': etag})
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+    def test_project_list_queries(self):
+        for number in range(10):
+            create_project(self.user, name=f"Project {number}").members.add(self.user)
+
+        # Versão, projetos, membros e contadores
+        with self.assertNumQueries(4):
+            response = self.call(async_views.projects, reverse('return_all_projects'))
+        self.assertEqual(len(json.loads(response.content)), 12)
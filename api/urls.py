@@ -1,12 +1,33 @@
+from django.conf import settings
 from django.urls import path
-from . import views
+from . import async_views, views
+
+
+def read_view(async_view, sync_view):
+    # Sob ASGI (settings.ASYNC_VIEWS) as leituras usam o ORM assíncrono
+    return async_view if settings.ASYNC_VIEWS else sync_view.as_view()
+
 
 urlpatterns = [
-    path('users/', views.ReturnUsersAPI.as_view(), name='return_all_users'),
+    path('users/', read_view(async_views.users, views.ReturnUsersAPI), name='return_all_users'),
+    path('users/search/', views.SearchUsersAPI.as_view(), name='search_users'),
 
-    path('projects/', views.ReturnProjectsAPI.as_view(), name='return_all_projects'),
-    path('projects/user/', views.ReturnUserProjectsAPI.as_view(), name='return_user_projects'),
-    path('projects/<int:pk>/', views.ReturnSpecificProjectAPI.as_view(), name='return_specific_project'),
+    path('projects/', read_view(async_views.projects, views.ReturnProjectsAPI), name='return_all_projects'),
+    path('projects/user/', read_view(async_views.current_user_projects, views.ReturnUserProjectsAPI), name='return_user_projects'),
+    path('projects/<int:pk>/', read_view(async_views.project_detail, views.ReturnSpecificProjectAPI), name='return_specific_project'),
+    path('projects/<int:pk>/export/', views.ExportProjectAPI.as_view(), name='export_project'),
+    path('projects/import/', views.ImportProjectAPI.as_view(), name='import_project'),
     
     path('project/<int:pk>/users/', views.ReturProjectUsersAPI.as_view(), name='project-members'),
+    path('project/<int:pk>/users/add/', views.AddProjectMembersAPI.as_view(), name='project-members-add'),
+    path('project/<int:pk>/tasks/import/', views.ImportProjectTasksAPI.as_view(), name='project-tasks-import'),
+
+    path('tasks/', views.TaskListAPI.as_view(), name='task_list'),
+    path('tasks/<int:pk>/', views.TaskDetailAPI.as_view(), name='task_detail'),
+    path('tasks/status/', views.BulkTaskStatusAPI.as_view(), name='bulk_task_status'),
+
+    path('jobs/', views.JobListAPI.as_view(), name='job_list'),
+    path('jobs/<int:pk>/', views.JobStatusAPI.as_view(), name='job_status'),
+
+    path('stats/dashboard-cache/', views.DashboardCacheStatsAPI.as_view(), name='dashboard_cache_stats'),
 ]
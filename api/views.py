@@ -1,41 +1,103 @@
-from rest_framework import generics, permissions
+from collections import Counter
+from datetime import date
+
+from rest_framework import filters, generics, permissions, status
+from rest_framework.exceptions import ValidationError
+from rest_framework.parsers import MultiPartParser
+from rest_framework.response import Response
+from rest_framework.views import APIView
+from django.conf import settings
 from django.contrib.auth import get_user_model
-from django.db import models
+from django.db import IntegrityError, models, transaction
 from django.db.models import Q
-from teamflow.models import (Project,
-                             Task)
+from django.http import StreamingHttpResponse
+from django.shortcuts import get_object_or_404
+from django.urls import reverse
+from django.utils import timezone
+from teamflow.models import (Job,
+                             Project,
+                             Task,
+                             TaskPriority,
+                             TaskStatus)
+from teamflow.counters import adjust_counts
+from teamflow.dashboard import cache_stats, invalidate_projects
+from teamflow.jobs import start_job
+from teamflow.memberships import add_members
+from teamflow.replicas import ReplicaReadMixin
+from teamflow import snapshots
+from teamflow.tasks import add_project_members
+from teamflow.task_import import FORMATS, decode_lines, format_from_name, import_tasks
 from . import serializers
+from .conditional import conditional_get
+from .pagination import KeysetPagination, OptInCursorPagination
 
 
-class ReturnUsersAPI(generics.ListAPIView):
+class ReturnUsersAPI(ReplicaReadMixin, generics.ListAPIView):
     queryset = get_user_model().objects.all()
     serializer_class = serializers.UserSerializer
     permission_classes = [permissions.IsAuthenticated]
+    pagination_class = OptInCursorPagination
+
+
+class SearchUsersAPI(ReplicaReadMixin, generics.ListAPIView):
+    """Prefix search on username/email for the member picker.
+
+    ``?q=`` is the prefix, ``?project=`` leaves out the members of that project.
+    """
+    serializer_class = serializers.UserSerializer
+    permission_classes = [permissions.IsAuthenticated]
 
+    def get_queryset(self):
+        query = self.request.query_params.get('q', '').strip()
+        if not query:
+            return get_user_model().objects.none()
+
+        project_id = self.request.query_params.get('project')
+        if not (project_id and project_id.isdigit()):
+            project_id = None
+
+        return get_user_model().objects.search_prefix(query, settings.API_SEARCH_LIMIT, project_id)
 
-class ReturnProjectsAPI(generics.ListAPIView):
+
+class ReturnProjectsAPI(ReplicaReadMixin, generics.ListAPIView):
     queryset = Project.objects.all()
     serializer_class = serializers.ProjectSerializer
     permission_classes = [permissions.IsAuthenticated]
+    pagination_class = OptInCursorPagination
+
+    @conditional_get(lambda view, request, **kwargs: Project.objects.all())
+    def get(self, request, *args, **kwargs):
+        return super().get(request, *args, **kwargs)
 
 
-class ReturnSpecificProjectAPI(generics.RetrieveAPIView):
+class ReturnSpecificProjectAPI(ReplicaReadMixin, generics.RetrieveAPIView):
     permission_classes = [permissions.IsAuthenticated]
     queryset = Project.objects.all()
     serializer_class = serializers.ProjectSerializer
     lookup_field = 'pk' 
 
+    @conditional_get(lambda view, request, **kwargs: Project.objects.filter(pk=kwargs['pk']), detail=True)
+    def get(self, request, *args, **kwargs):
+        return super().get(request, *args, **kwargs)
+
 
-class ReturnUserProjectsAPI(generics.ListAPIView):
+class ReturnUserProjectsAPI(ReplicaReadMixin, generics.ListAPIView):
     permission_classes = [permissions.IsAuthenticated]
+    pagination_class = OptInCursorPagination
     serializer_class = serializers.ProjectSerializer
 
     def get_queryset(self):
         user = self.request.user
         return Project.objects.filter(Q(created_by=user)| Q(members=user)).distinct()
+
+    @conditional_get(lambda view, request, **kwargs: Project.objects.filter(
+        Q(created_by=request.user) | Q(members=request.user)))
+    def get(self, request, *args, **kwargs):
+        return super().get(request, *args, **kwargs)
     
-class ReturProjectUsersAPI(generics.ListAPIView):
+class ReturProjectUsersAPI(ReplicaReadMixin, generics.ListAPIView):
     permission_classes = [permissions.IsAuthenticated]
+    pagination_class = OptInCursorPagination
     serializer_class = serializers.UserSerializer
 
     def get_queryset(self):
@@ -44,4 +106,288 @@ class ReturProjectUsersAPI(generics.ListAPIView):
             project = Project.objects.get(pk=project_id)
             return project.members.all()
         except Project.DoesNotExist:
-            return get_user_model().objects.none()
\ No newline at end of file
+            return get_user_model().objects.none()
+
+
+class AddProjectMembersAPI(APIView):
+    """Add a batch of users, by email, to a project.
+
+    Returns one result per email: ``added``, ``already_member`` or ``not_found``.
+    Batches larger than ``API_SYNC_BATCH_SIZE`` run in the background and
+    answer ``202`` with the job to poll; its result has the same shape.
+    """
+    permission_classes = [permissions.IsAuthenticated]
+
+    def post(self, request, pk):
+        project = get_object_or_404(Project, pk=pk)
+        if request.user.id != project.created_by_id:
+            return Response({'detail': 'Not allowed.'}, status=status.HTTP_403_FORBIDDEN)
+
+        serializer = serializers.AddMembersSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        emails = list(dict.fromkeys(serializer.validated_data['emails']))
+
+        if len(emails) > settings.API_SYNC_BATCH_SIZE:
+            job = start_job('add_members', request.user, add_project_members, project.id, emails, total=len(emails))
+            return Response(
+                {'job': job.id, 'url': reverse('job_status', kwargs={'pk': job.id})},
+                status=status.HTTP_202_ACCEPTED,
+            )
+
+        results = add_members(project, emails)
+        return Response({'results': results})
+
+
+class TaskPagination(KeysetPagination):
+    ordering = ('due_date', 'id')
+
+
+class TaskListAPI(ReplicaReadMixin, generics.ListAPIView):
+    """Tasks visible to the caller: every task of the projects they created
+    and the tasks assigned to them elsewhere.
+
+    Filters: ``project``, ``assigned_to`` (an id or ``me``), ``status``,
+    ``priority``, ``due_after``/``due_before`` (inclusive, YYYY-MM-DD) and
+    ``overdue=true`` (due before today and not concluded). Ordering with
+    ``?ordering=`` on ``due_date``, ``priority``, ``status`` or ``id``, with
+    ``id`` breaking ties.
+    Each filter combination is served by one of the Task indexes.
+    """
+    permission_classes = [permissions.IsAuthenticated]
+    serializer_class = serializers.TaskSerializer
+    pagination_class = TaskPagination
+    filter_backends = [filters.OrderingFilter]
+    ordering_fields = ['due_date', 'priority', 'status', 'id']
+
+    def get_date_param(self, name):
+        value = self.request.query_params.get(name)
+        if not value:
+            return None
+        try:
+            return date.fromisoformat(value)
+        except ValueError:
+            raise ValidationError({name: 'Invalid date format.'})
+
+    def get_int_param(self, name):
+        value = self.request.query_params.get(name)
+        if not value:
+            return None
+        if not value.isdigit():
+            raise ValidationError({name: 'Must be an id.'})
+        return int(value)
+
+    def get_choice_param(self, name, choices):
+        value = self.request.query_params.get(name, '').strip()
+        if not value:
+            return None
+        choice = choices.from_label(value)
+        if choice is None:
+            raise ValidationError({name: f'Must be one of: {", ".join(choices.labels)}.'})
+        return choice
+
+    def get_queryset(self):
+        user = self.request.user
+        params = self.request.query_params
+        tasks = Task.objects.all()
+
+        assigned_to = params.get('assigned_to')
+        if assigned_to == 'me':
+            assigned_to = user.id
+        else:
+            assigned_to = self.get_int_param('assigned_to')
+        project_id = self.get_int_param('project')
+
+        # A regra de visibilidade vira filtros simples sempre que possível,
+        # para o SQLite escolher um único índice em vez de um OR
+        if assigned_to == user.id:
+            tasks = tasks.filter(assigned_to=user)
+            if project_id is not None:
+                tasks = tasks.filter(project_id=project_id)
+        else:
+            created_ids = set(Project.objects.filter(created_by=user).values_list('id', flat=True))
+            if project_id is not None:
+                tasks = tasks.filter(project_id=project_id)
+                if project_id not in created_ids:
+                    tasks = tasks.filter(assigned_to=user)
+            else:
+                tasks = tasks.filter(Q(project_id__in=created_ids) | Q(assigned_to=user))
+            if assigned_to is not None:
+                tasks = tasks.filter(assigned_to_id=assigned_to)
+
+        task_status = self.get_choice_param('status', TaskStatus)
+        if task_status is not None:
+            tasks = tasks.filter(status=task_status)
+        priority = self.get_choice_param('priority', TaskPriority)
+        if priority is not None:
+            tasks = tasks.filter(priority=priority)
+
+        due_after = self.get_date_param('due_after')
+        if due_after:
+            tasks = tasks.filter(due_date__gte=due_after)
+        due_before = self.get_date_param('due_before')
+        if due_before:
+            tasks = tasks.filter(due_date__lte=due_before)
+        if params.get('overdue') == 'true':
+            tasks = tasks.filter(due_date__lt=timezone.now().date()).exclude(status=TaskStatus.CONCLUDED)
+
+        # Tarefas de projetos sendo excluídos (busca por chave primária no projeto)
+        return tasks.filter(project__hidden=False)
+
+
+class TaskDetailAPI(ReplicaReadMixin, generics.RetrieveAPIView):
+    permission_classes = [permissions.IsAuthenticated]
+    serializer_class = serializers.TaskSerializer
+
+    def get_queryset(self):
+        user = self.request.user
+        return Task.objects.filter(
+            Q(project__created_by=user) | Q(assigned_to=user), project__hidden=False
+        )
+
+
+class BulkTaskStatusAPI(APIView):
+    """Apply one status to many tasks owned by the caller.
+
+    Returns the ids that were updated and the ids that were refused
+    (not found or not assigned to the caller).
+    """
+    permission_classes = [permissions.IsAuthenticated]
+
+    def post(self, request):
+        serializer = serializers.BulkTaskStatusSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        ids = list(dict.fromkeys(serializer.validated_data['ids']))
+        new_status = serializer.validated_data['status']
+
+        owned_tasks = Task.objects.filter(id__in=ids, assigned_to=request.user)
+        with transaction.atomic():
+            rows = list(owned_tasks.values_list('id', 'project_id', 'status'))
+            updated = {task_id for task_id, _, _ in rows}
+            if updated:
+                # Um único UPDATE condicional, ainda restrito às tarefas do usuário
+                owned_tasks.filter(id__in=updated).update(status=new_status)
+                # update() não dispara post_save: os contadores mudam aqui, na mesma transação
+                deltas = Counter()
+                for _, project_id, old_status in rows:
+                    if old_status != new_status:
+                        deltas[(project_id, old_status)] -= 1
+                        deltas[(project_id, new_status)] += 1
+                adjust_counts(deltas)
+
+        invalidate_projects({project_id for _, project_id, _ in rows})
+
+        return Response({
+            'updated': [task_id for task_id in ids if task_id in updated],
+            'refused': [task_id for task_id in ids if task_id not in updated],
+        })
+
+
+class ImportProjectTasksAPI(APIView):
+    """Stream a CSV or JSONL file of tasks into a project.
+
+    The file goes in the ``file`` field; the format comes from its
+    extension or from a ``file_format`` field. Returns the number of
+    created tasks and the row-level errors.
+    """
+    permission_classes = [permissions.IsAuthenticated]
+    parser_classes = [MultiPartParser]
+
+    def post(self, request, pk):
+        project = get_object_or_404(Project, pk=pk)
+        if request.user.id != project.created_by_id:
+            return Response({'detail': 'Not allowed.'}, status=status.HTTP_403_FORBIDDEN)
+
+        upload = request.FILES.get('file')
+        if upload is None:
+            return Response({'detail': 'Missing file.'}, status=status.HTTP_400_BAD_REQUEST)
+
+        file_format = request.data.get('file_format') or format_from_name(upload.name)
+        if file_format not in FORMATS:
+            return Response({'detail': 'Unknown file format.'}, status=status.HTTP_400_BAD_REQUEST)
+
+        report = import_tasks(project, decode_lines(upload.file), file_format)
+        if report.failure:
+            return Response({'detail': report.failure, **report.as_dict()}, status=status.HTTP_400_BAD_REQUEST)
+        return Response(report.as_dict())
+
+
+class DashboardCacheStatsAPI(APIView):
+    """Hit and miss counters of the home page dashboard cache."""
+    permission_classes = [permissions.IsAdminUser]
+
+    def get(self, request):
+        return Response(cache_stats())
+
+
+class ExportProjectAPI(APIView):
+    """Stream a snapshot of a project (metadata, members and tasks).
+
+    ``?file_format=ndjson`` (default) or ``?file_format=json``.
+    """
+    permission_classes = [permissions.IsAuthenticated]
+
+    def get(self, request, pk):
+        project = get_object_or_404(Project.objects.select_related('created_by'), pk=pk)
+        if not project.members.filter(pk=request.user.pk).exists():
+            return Response({'detail': 'Not allowed.'}, status=status.HTTP_403_FORBIDDEN)
+
+        file_format = request.query_params.get('file_format', 'ndjson')
+        if file_format not in snapshots.FORMATS:
+            return Response({'detail': 'Unknown file format.'}, status=status.HTTP_400_BAD_REQUEST)
+
+        content_type = 'application/x-ndjson' if file_format == 'ndjson' else 'application/json'
+        response = StreamingHttpResponse(snapshots.export_project(project, file_format), content_type=content_type)
+        response['Content-Disposition'] = f'attachment; filename="project-{project.id}.{file_format}"'
+        return response
+
+
+class ImportProjectAPI(APIView):
+    """Restore a project snapshot as a new project owned by the caller."""
+    permission_classes = [permissions.IsAuthenticated]
+    parser_classes = [MultiPartParser]
+
+    def post(self, request):
+        upload = request.FILES.get('file')
+        if upload is None:
+            return Response({'detail': 'Missing file.'}, status=status.HTTP_400_BAD_REQUEST)
+
+        file_format = request.data.get('file_format') or 'ndjson'
+        if file_format not in snapshots.FORMATS:
+            return Response({'detail': 'Unknown file format.'}, status=status.HTTP_400_BAD_REQUEST)
+
+        try:
+            project, report = snapshots.import_snapshot(decode_lines(upload.file), file_format, owner=request.user)
+        except (ValueError, IntegrityError) as e:
+            return Response({'detail': f'Invalid snapshot: {e}'}, status=status.HTTP_400_BAD_REQUEST)
+
+        return Response({'id': project.id, **report}, status=status.HTTP_201_CREATED)
+
+
+class JobPagination(OptInCursorPagination):
+    ordering = '-id'
+
+
+class JobListAPI(generics.ListAPIView):
+    """Background jobs started by the caller, newest first.
+
+    ``?kind=`` keeps one kind of job, e.g. ``delete_project``.
+    """
+    serializer_class = serializers.JobSerializer
+    permission_classes = [permissions.IsAuthenticated]
+    pagination_class = JobPagination
+
+    def get_queryset(self):
+        jobs = Job.objects.filter(created_by=self.request.user).order_by('-id')
+        kind = self.request.query_params.get('kind')
+        if kind:
+            jobs = jobs.filter(kind=kind)
+        return jobs
+
+
+class JobStatusAPI(generics.RetrieveAPIView):
+    """Progress and result of a background job started by the caller."""
+    serializer_class = serializers.JobSerializer
+    permission_classes = [permissions.IsAuthenticated]
+
+    def get_queryset(self):
+        return Job.objects.filter(created_by=self.request.user)
@@ -0,0 +1,209 @@
+"""Throughput of the read API and home page under WSGI and under ASGI.
+
+Builds a throwaway SQLite database with synthetic projects, starts the
+same code with gunicorn (WSGI, sync views, threaded worker) and with
+uvicorn (ASGI, ``FinalProj.asgi`` with the async views), and sends
+concurrent GET requests as a logged in user, reporting requests per second
+and latency percentiles for every path. ``asgi*`` is uvicorn with the
+sync views (``TEAMFLOW_ASYNC_VIEWS=0``). Needs ``pip install gunicorn uvicorn``.
+
+Usage:
+    python benchmarks/asgi_api.py --projects 2000 --concurrency 50 --requests 2000
+"""
+import argparse
+import asyncio
+import os
+import random
+import shutil
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'FinalProj.settings')
+
+PATHS = ['/api/projects/', '/api/projects/user/', '/api/projects/1/', '/api/users/', '/']
+
+SETTINGS = """from FinalProj.settings import *
+
+DEBUG = False
+ALLOWED_HOSTS = ['*']
+DATABASES['default']['NAME'] = {path!r}
+"""
+
+
+def setup_database(path):
+    from django.conf import settings
+
+    settings.DATABASES['default']['NAME'] = path
+
+    import django
+
+    django.setup()
+
+
+def load_projects(count, members):
+    from django.db import connection, transaction
+    from teamflow.counters import rebuild_counts
+
+    rng = random.Random(42)
+    users = count // 10 + members
+    with transaction.atomic(), connection.cursor() as cursor:
+        cursor.executemany(
+            "INSERT INTO teamflow_user (id, password, is_superuser, username, first_name, last_name, "
+            "email, is_staff, is_active, date_joined) "
+            "VALUES (%s, '', 0, %s, '', '', %s, 0, 1, '2024-01-01 00:00:00')",
+            [(i, f'user{i}', f'user{i}@example.com') for i in range(1, users + 1)],
+        )
+        cursor.executemany(
+            "INSERT INTO teamflow_project (id, name, description, start_date, due_date, created_by_id, "
+            "updated_at, hidden) VALUES (%s, %s, 'Synthetic project', '2024-01-01', '2024-12-31', %s, "
+            "'2024-01-01 00:00:00', 0)",
+            [(i, f'Project {i}', 1 if i % 20 == 0 else rng.randint(2, users)) for i in range(1, count + 1)],
+        )
+        cursor.executemany(
+            "INSERT OR IGNORE INTO teamflow_project_members (project_id, user_id) VALUES (%s, %s)",
+            [(i, user_id) for i in range(1, count + 1)
+             for user_id in {1, *rng.sample(range(2, users + 1), members - 1)}],
+        )
+        cursor.executemany(
+            "INSERT INTO teamflow_task (title, description, status, priority, due_date, assigned_to_id, "
+            "project_id) VALUES ('Task', '', %s, %s, '2024-06-01', %s, %s)",
+            [(rng.randint(0, 2), rng.randint(0, 2), 1 if i % 3 == 0 else 2, i // 5 + 1)
+             for i in range(count * 5)],
+        )
+    rebuild_counts()
+    with connection.cursor() as cursor:
+        cursor.execute('ANALYZE')
+
+
+def session_cookie():
+    from django.conf import settings
+    from django.contrib.auth import BACKEND_SESSION_KEY, HASH_SESSION_KEY, SESSION_KEY
+    from django.contrib.sessions.backends.db import SessionStore
+    from teamflow.models import User
+
+    user = User.objects.get(pk=1)
+    session = SessionStore()
+    session[SESSION_KEY] = str(user.pk)
+    session[BACKEND_SESSION_KEY] = 'django.contrib.auth.backends.ModelBackend'
+    session[HASH_SESSION_KEY] = user.get_session_auth_hash()
+    session.save()
+    return f'{settings.SESSION_COOKIE_NAME}={session.session_key}'
+
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+def start_server(command, env, port):
+    server = subprocess.Popen(command, cwd=ROOT, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    deadline = time.monotonic() + 30
+    while time.monotonic() < deadline:
+        try:
+            socket.create_connection(('127.0.0.1', port), timeout=1).close()
+            return server
+        except OSError:
+            if server.poll() is not None:
+                break
+            time.sleep(0.2)
+    server.kill()
+    raise SystemExit(f'Server did not start: {" ".join(command)}')
+
+
+async def fetch(port, path, cookie):
+    reader, writer = await asyncio.open_connection('127.0.0.1', port)
+    writer.write(
+        f'GET {path} HTTP/1.1\r\nHost: localhost\r\nCookie: {cookie}\r\nConnection: close\r\n\r\n'.encode()
+    )
+    await writer.drain()
+    response = await reader.read()
+    writer.close()
+    return int(response.split(b' ', 2)[1])
+
+
+async def load(port, path, cookie, requests, concurrency):
+    latencies = []
+    errors = 0
+    remaining = iter(range(requests))
+
+    async def client():
+        nonlocal errors
+        for _ in remaining:
+            started = time.perf_counter()
+            if await fetch(port, path, cookie) != 200:
+                errors += 1
+            latencies.append(time.perf_counter() - started)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(client() for _ in range(concurrency)))
+    return time.perf_counter() - started, latencies, errors
+
+
+def run(name, command, env, port, cookie, args):
+    server = start_server(command, env, port)
+    try:
+        for path in PATHS:
+            # Aquecimento: conexões, caches e o import das views
+            asyncio.run(load(port, path, cookie, args.concurrency, args.concurrency))
+            elapsed, latencies, errors = asyncio.run(load(port, path, cookie, args.requests, args.concurrency))
+            latencies.sort()
+            p50 = statistics.median(latencies) * 1000
+            p95 = latencies[int(len(latencies) * 0.95) - 1] * 1000
+            print(f'{name:5} {path:22} {args.requests / elapsed:8.0f} req/s  '
+                  f'p50 {p50:7.1f}ms  p95 {p95:7.1f}ms  errors {errors}')
+    finally:
+        server.terminate()
+        server.wait()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--projects', type=int, default=2000)
+    parser.add_argument('--members', type=int, default=5)
+    parser.add_argument('--requests', type=int, default=2000)
+    parser.add_argument('--concurrency', type=int, default=50)
+    parser.add_argument('--threads', type=int, default=8, help='threads of the WSGI worker')
+    args = parser.parse_args()
+
+    for program in ('gunicorn', 'uvicorn'):
+        if shutil.which(program) is None:
+            raise SystemExit(f'{program} is not installed: pip install gunicorn uvicorn')
+
+    with tempfile.TemporaryDirectory() as tmp:
+        database = os.path.join(tmp, 'bench.sqlite3')
+        setup_database(database)
+
+        from django.core.management import call_command
+
+        call_command('migrate', verbosity=0)
+        load_projects(args.projects, args.members)
+        cookie = session_cookie()
+        print(f'{args.projects} projects, {args.concurrency} concurrent clients, one worker process each')
+
+        Path(tmp, 'bench_settings.py').write_text(SETTINGS.format(path=database))
+        env = dict(os.environ, PYTHONPATH=os.pathsep.join([tmp, str(ROOT)]), DJANGO_SETTINGS_MODULE='bench_settings')
+
+        port = free_port()
+        run('wsgi', ['gunicorn', 'FinalProj.wsgi:application', '--workers', '1', '--worker-class', 'gthread',
+                     '--threads', str(args.threads), '--bind', f'127.0.0.1:{port}', '--backlog', '2048'],
+            dict(env, TEAMFLOW_ASYNC_VIEWS='0'), port, cookie, args)
+
+        # Sob ASGI as views síncronas rodam numa thread compartilhada; a segunda
+        # rodada mostra o ganho das views assíncronas no mesmo servidor
+        for name, async_views in (('asgi', '1'), ('asgi*', '0')):
+            port = free_port()
+            run(name, ['uvicorn', 'FinalProj.asgi:application', '--workers', '1', '--port', str(port),
+                       '--no-access-log', '--backlog', '2048'],
+                dict(env, TEAMFLOW_ASYNC_VIEWS=async_views), port, cookie, args)
+
+
+if __name__ == '__main__':
+    main()
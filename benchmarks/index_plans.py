@@ -0,0 +1,164 @@
+"""Show the query plans of the hot Task/User filters before and after the
+0007 and 0010 index migrations, and the Task index sizes before and after
+the 0015 integer status/priority migration.
+
+Builds a throwaway SQLite database, migrates it to 0006, loads a synthetic
+dataset and prints ``EXPLAIN QUERY PLAN`` for each filter, then migrates
+forward (to 0013, still with text status/priority, and to the latest) and
+prints the plans again together with the query timings and the on-disk
+size of the task table and its indexes.
+
+Usage:
+    python benchmarks/index_plans.py --tasks 1000000
+"""
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+from datetime import date, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'FinalProj.settings')
+
+
+def setup_database(path):
+    from django.conf import settings
+
+    settings.DATABASES['default']['NAME'] = path
+
+    import django
+
+    django.setup()
+
+
+def load_dataset(tasks, users, projects):
+    from django.db import connection, transaction
+
+    start = date(2024, 1, 1)
+    rng = random.Random(42)
+    statuses = ['Not Started', 'In Progress', 'Concluded']
+    priorities = ['Low', 'Medium', 'High']
+
+    with transaction.atomic(), connection.cursor() as cursor:
+        cursor.executemany(
+            "INSERT INTO teamflow_user (id, password, is_superuser, username, first_name, last_name, "
+            "email, is_staff, is_active, date_joined) VALUES (%s, '', 0, %s, '', '', %s, 0, 1, %s)",
+            [(i, f'user{i}', f'User{i}@Example.com', '2024-01-01 00:00:00') for i in range(1, users + 1)],
+        )
+        cursor.executemany(
+            "INSERT INTO teamflow_project (id, name, description, start_date, due_date, created_by_id) "
+            "VALUES (%s, %s, '', %s, %s, %s)",
+            [(i, f'project{i}', start, start + timedelta(days=365), rng.randint(1, users))
+             for i in range(1, projects + 1)],
+        )
+        batch = []
+        for i in range(1, tasks + 1):
+            batch.append((
+                i, f'task{i}', rng.choice(statuses), rng.choice(priorities),
+                start + timedelta(days=rng.randint(0, 365)),
+                rng.randint(1, users), rng.randint(1, projects),
+            ))
+            if len(batch) == 50_000:
+                cursor.executemany(
+                    "INSERT INTO teamflow_task (id, title, description, status, priority, due_date, "
+                    "assigned_to_id, project_id) VALUES (%s, %s, '', %s, %s, %s, %s, %s)",
+                    batch,
+                )
+                batch = []
+        if batch:
+            cursor.executemany(
+                "INSERT INTO teamflow_task (id, title, description, status, priority, due_date, "
+                "assigned_to_id, project_id) VALUES (%s, %s, '', %s, %s, %s, %s, %s)",
+                batch,
+            )
+
+
+def hot_queries(labels):
+    from django.contrib.auth import get_user_model
+    from django.db.models import Value
+    from teamflow.models import Task, TaskPriority, TaskStatus
+
+    # Antes da 0015 status e prioridade são texto (Value evita a conversão para int)
+    def value(choice):
+        return Value(choice.label) if labels else choice
+
+    User = get_user_model()
+    return {
+        'task by project and assignee': Task.objects.filter(project_id=7, assigned_to_id=3),
+        'unfinished tasks of a member': Task.objects.filter(
+            project_id=7, assigned_to_id=3,
+            status__in=[value(TaskStatus.NOT_STARTED), value(TaskStatus.IN_PROGRESS)],
+        ),
+        'tasks due on a date': Task.objects.filter(due_date=date(2024, 6, 1)),
+        'tasks due in a range': Task.objects.filter(
+            due_date__gte=date(2024, 6, 1), due_date__lt=date(2024, 6, 8)
+        ),
+        'task api: project ordered by due date': Task.objects.filter(project_id=7).order_by('due_date', 'id')[:100],
+        'task api: my overdue high priority': Task.objects.filter(
+            assigned_to_id=3, priority=value(TaskPriority.HIGH), due_date__lt=date(2024, 6, 1)
+        ).order_by('due_date', 'id')[:100],
+        'task api: my tasks by status': Task.objects.filter(
+            assigned_to_id=3, status=value(TaskStatus.IN_PROGRESS)
+        ).order_by('due_date', 'id')[:100],
+        'user by email (login)': User.objects.with_email('USER3@example.com'),
+    }
+
+
+def report(label, labels=False):
+    from django.db import connection
+
+    with connection.cursor() as cursor:
+        cursor.execute('ANALYZE')
+
+    print(f'\n== {label}')
+    for name, queryset in hot_queries(labels).items():
+        plan = queryset.explain()
+        started = time.perf_counter()
+        list(queryset.values_list('pk', flat=True))
+        elapsed = (time.perf_counter() - started) * 1000
+        print(f'-- {name}: {elapsed:.2f} ms')
+        for line in plan.splitlines():
+            print(f'   {line}')
+
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT name, SUM(pgsize) FROM dbstat WHERE name = 'teamflow_task' OR name IN "
+            "(SELECT name FROM sqlite_master WHERE type = 'index' AND tbl_name = 'teamflow_task') "
+            "GROUP BY name ORDER BY name"
+        )
+        print('-- task table and index sizes')
+        for name, size in cursor.fetchall():
+            print(f'   {name}: {size / 2 ** 20:.1f} MiB')
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--tasks', type=int, default=1_000_000)
+    parser.add_argument('--users', type=int, default=20_000)
+    parser.add_argument('--projects', type=int, default=5_000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        setup_database(os.path.join(tmp, 'bench.sqlite3'))
+
+        from django.core.management import call_command
+
+        call_command('migrate', verbosity=0)
+        call_command('migrate', 'teamflow', '0006', verbosity=0)
+
+        started = time.perf_counter()
+        load_dataset(args.tasks, args.users, args.projects)
+        print(f'Loaded {args.tasks} tasks in {time.perf_counter() - started:.1f}s')
+
+        report('before 0007 (no indexes)', labels=True)
+        call_command('migrate', 'teamflow', '0013', verbosity=0)
+        report('after 0007-0013 (text status/priority)', labels=True)
+        call_command('migrate', 'teamflow', verbosity=0)
+        report('after 0015 (integer status/priority)')
+
+
+if __name__ == '__main__':
+    main()
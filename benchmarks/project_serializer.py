@@ -0,0 +1,114 @@
+"""Throughput of the project list serialization paths.
+
+Builds a throwaway SQLite database with synthetic projects and members and
+serializes the whole list with the generic DRF ``ModelSerializer`` path
+(with and without ``prefetch_related``) and with ``ProjectListSerializer``,
+checking that the rendered JSON is byte-identical.
+
+Usage:
+    python benchmarks/project_serializer.py --projects 10000
+"""
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+from datetime import date, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'FinalProj.settings')
+
+
+def setup_database(path):
+    from django.conf import settings
+
+    settings.DATABASES['default']['NAME'] = path
+
+    import django
+
+    django.setup()
+
+
+def load_dataset(projects, users, members_per_project):
+    from django.db import connection, transaction
+
+    rng = random.Random(42)
+    start = date(2024, 1, 1)
+    with transaction.atomic(), connection.cursor() as cursor:
+        cursor.executemany(
+            "INSERT INTO teamflow_user (id, password, is_superuser, username, first_name, last_name, "
+            "email, is_staff, is_active, date_joined) "
+            "VALUES (%s, '', 0, %s, '', '', %s, 0, 1, '2024-01-01 00:00:00')",
+            [(i, f'user{i}', f'user{i}@example.com') for i in range(1, users + 1)],
+        )
+        cursor.executemany(
+            "INSERT INTO teamflow_project (id, name, description, start_date, due_date, created_by_id, "
+            "updated_at, hidden) VALUES (%s, %s, %s, %s, %s, %s, '2024-01-01 00:00:00', 0)",
+            [(i, f'Project {i}', f'Description of project {i}', start, start + timedelta(days=90),
+              rng.randint(1, users)) for i in range(1, projects + 1)],
+        )
+        cursor.executemany(
+            "INSERT INTO teamflow_project_members (project_id, user_id) VALUES (%s, %s)",
+            [(i, user_id) for i in range(1, projects + 1)
+             for user_id in rng.sample(range(1, users + 1), members_per_project)],
+        )
+
+
+def measure(name, render, repeat):
+    best = None
+    output = None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        output = render()
+        elapsed = time.perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+    print(f'{name:<32} {best * 1000:9.1f} ms')
+    return best, output
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--projects', type=int, default=10_000)
+    parser.add_argument('--users', type=int, default=2_000)
+    parser.add_argument('--members', type=int, default=8)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        setup_database(os.path.join(tmp, 'bench.sqlite3'))
+
+        from django.core.management import call_command
+        from rest_framework import serializers
+        from rest_framework.renderers import JSONRenderer
+
+        from api.serializers import ProjectSerializer
+        from teamflow.models import Project
+
+        call_command('migrate', verbosity=0)
+        load_dataset(args.projects, args.users, args.members)
+
+        renderer = JSONRenderer()
+        queryset = Project.objects.order_by('id')
+
+        def generic(qs):
+            return lambda: renderer.render(
+                serializers.ListSerializer(child=ProjectSerializer(), instance=qs).data
+            )
+
+        generic_time, expected = measure('ModelSerializer (N+1)', generic(queryset), args.repeat)
+        prefetch_time, prefetched = measure(
+            'ModelSerializer + prefetch', generic(queryset.prefetch_related('members')), args.repeat
+        )
+        fast_time, fast = measure(
+            'ProjectListSerializer', lambda: renderer.render(ProjectSerializer(queryset, many=True).data),
+            args.repeat,
+        )
+
+        assert fast == expected == prefetched, 'outputs differ'
+        print(f'speedup: {generic_time / fast_time:.1f}x over N+1, {prefetch_time / fast_time:.1f}x over prefetch')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,204 @@
+"""Concurrent task status updates against SQLite, default vs tuned settings.
+
+Builds a throwaway SQLite database with synthetic projects and tasks and
+runs several processes that change task statuses through the
+``ChangeTaskStatus`` view and the bulk status API (which reads and then
+writes in one transaction) while other processes keep reading project task
+lists, first with Django's default SQLite settings (rollback journal,
+deferred transactions, 5s timeout) and then with ``SQLITE_OPTIONS`` from the
+settings (WAL, IMMEDIATE transactions, busy timeout and pragmas). Reports
+updates and reads per second, "database is locked" errors and whether the
+task counters still match the tasks.
+
+Usage:
+    python benchmarks/sqlite_writes.py --processes 8 --readers 4 --updates 300
+"""
+import argparse
+import multiprocessing
+import os
+import random
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'FinalProj.settings')
+
+
+def setup_database(path, options):
+    from django.conf import settings
+
+    settings.DATABASES['default']['NAME'] = path
+    settings.DATABASES['default']['OPTIONS'] = options
+
+    import django
+
+    django.setup()
+
+
+def load_tasks(projects, tasks):
+    from django.db import connection, transaction
+    from teamflow.counters import rebuild_counts
+
+    rng = random.Random(42)
+    with transaction.atomic(), connection.cursor() as cursor:
+        cursor.execute(
+            "INSERT INTO teamflow_user (id, password, is_superuser, username, first_name, last_name, "
+            "email, is_staff, is_active, date_joined) "
+            "VALUES (1, '', 0, 'bench', '', '', 'bench@example.com', 0, 1, '2024-01-01 00:00:00')"
+        )
+        cursor.executemany(
+            "INSERT INTO teamflow_project (id, name, description, start_date, due_date, created_by_id, "
+            "updated_at, hidden) VALUES (%s, %s, '', '2024-01-01', '2024-12-31', 1, '2024-01-01 00:00:00', 0)",
+            [(i, f'Project {i}') for i in range(1, projects + 1)],
+        )
+        cursor.executemany(
+            "INSERT INTO teamflow_task (id, title, description, status, priority, due_date, assigned_to_id, "
+            "project_id) VALUES (%s, 'Task', '', 0, 0, '2024-06-01', 1, %s)",
+            [(i, rng.randint(1, projects)) for i in range(1, tasks + 1)],
+        )
+    rebuild_counts()
+    connection.close()
+
+
+def worker(path, options, seed, tasks, updates, barrier, results):
+    setup_database(path, options)
+
+    from django.db import OperationalError, connection
+    from django.test import RequestFactory
+    from rest_framework.test import APIRequestFactory, force_authenticate
+    from api.views import BulkTaskStatusAPI
+    from teamflow.models import TaskStatus, User
+    from teamflow.views import ChangeTaskStatus
+
+    rng = random.Random(seed)
+    user = User.objects.get(pk=1)
+    change_status = RequestFactory()
+    bulk_status = APIRequestFactory()
+    bulk_view = BulkTaskStatusAPI.as_view()
+    done = errors = 0
+    barrier.wait()
+    started = time.perf_counter()
+    for number in range(updates):
+        status = rng.choice(list(TaskStatus)).label
+        try:
+            if number % 2:
+                request = bulk_status.post('/', {'ids': rng.sample(range(1, tasks + 1), 5), 'status': status},
+                                           format='json')
+                force_authenticate(request, user)
+                response = bulk_view(request)
+            else:
+                request = change_status.post('/', {'status': status})
+                request.user = user
+                response = ChangeTaskStatus(request, rng.randint(1, tasks))
+            assert response.status_code in (200, 302), response.status_code
+            done += 1
+        except OperationalError as e:
+            if 'locked' not in str(e):
+                raise
+            errors += 1
+    results.put(('write', done, errors, time.perf_counter() - started))
+    connection.close()
+
+
+def reader(path, options, seed, projects, barrier, stop, results):
+    setup_database(path, options)
+
+    from django.db import OperationalError, connection
+    from teamflow.counters import task_counts
+    from teamflow.models import Task
+
+    rng = random.Random(seed)
+    done = errors = 0
+    barrier.wait()
+    started = time.perf_counter()
+    while not stop.is_set():
+        try:
+            # Como a página de um projeto: as tarefas e os contadores
+            project_id = rng.randint(1, projects)
+            list(Task.objects.filter(project_id=project_id).order_by('id'))
+            task_counts([project_id])
+            done += 1
+        except OperationalError as e:
+            if 'locked' not in str(e):
+                raise
+            errors += 1
+    results.put(('read', done, errors, time.perf_counter() - started))
+    connection.close()
+
+
+def run(name, path, options, args):
+    context = multiprocessing.get_context('spawn')
+    barrier = context.Barrier(args.processes + args.readers)
+    stop = context.Event()
+    results = context.Queue()
+    processes = [
+        context.Process(target=worker, args=(path, options, seed, args.tasks, args.updates, barrier, results))
+        for seed in range(args.processes)
+    ] + [
+        context.Process(target=reader, args=(path, options, seed, args.projects, barrier, stop, results))
+        for seed in range(args.readers)
+    ]
+    for process in processes:
+        process.start()
+    outcomes = [results.get() for _ in range(args.processes)]
+    stop.set()
+    outcomes += [results.get() for _ in range(args.readers)]
+    for process in processes:
+        process.join()
+
+    elapsed = max(outcome[3] for outcome in outcomes if outcome[0] == 'write')
+    line = f'{name:8}'
+    for kind in ('write', 'read'):
+        done = sum(outcome[1] for outcome in outcomes if outcome[0] == kind)
+        errors = sum(outcome[2] for outcome in outcomes if outcome[0] == kind)
+        line += f'  {kind}s {done / elapsed:6.0f}/s, {errors} locked ({errors / max(done + errors, 1):.1%})'
+    print(f'{line}  {elapsed:5.1f}s  counters ok: {counters_match(path)}')
+
+
+def counters_match(path):
+    import sqlite3
+
+    with sqlite3.connect(path) as db:
+        tasks = set(db.execute(
+            "SELECT project_id, status, COUNT(*) FROM teamflow_task GROUP BY project_id, status"
+        ))
+        counters = set(db.execute(
+            "SELECT project_id, status, count FROM teamflow_projecttaskcount WHERE count > 0"
+        ))
+    return tasks == counters
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--processes', type=int, default=8)
+    parser.add_argument('--updates', type=int, default=300, help='updates per process')
+    parser.add_argument('--readers', type=int, default=4, help='processes reading while the others write')
+    parser.add_argument('--projects', type=int, default=20)
+    parser.add_argument('--tasks', type=int, default=10_000)
+    args = parser.parse_args()
+
+    from django.conf import settings
+
+    tuned = settings.SQLITE_OPTIONS
+    with tempfile.TemporaryDirectory() as tmp:
+        base = os.path.join(tmp, 'base.sqlite3')
+        setup_database(base, {})
+
+        from django.core.management import call_command
+
+        call_command('migrate', verbosity=0)
+        load_tasks(args.projects, args.tasks)
+        print(f'{args.processes} processes x {args.updates} status updates on {args.tasks} tasks, '
+              f'{args.readers} reading processes')
+
+        for name, options in (('default', {}), ('tuned', tuned)):
+            path = os.path.join(tmp, f'{name}.sqlite3')
+            shutil.copy(base, path)
+            run(name, path, options, args)
+
+
+if __name__ == '__main__':
+    main()
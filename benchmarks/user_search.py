@@ -0,0 +1,107 @@
+"""Latency of the member picker user search on a large user table.
+
+Builds a throwaway SQLite database with synthetic users and times
+``/api/users/search/`` queries against the LOWER(username)/LOWER(email)
+indexes, failing when the slowest query exceeds the budget.
+
+Usage:
+    python benchmarks/user_search.py --users 1000000 --budget-ms 50
+"""
+import argparse
+import os
+import random
+import statistics
+import string
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'FinalProj.settings')
+
+
+def setup_database(path):
+    from django.conf import settings
+
+    settings.DATABASES['default']['NAME'] = path
+    settings.ALLOWED_HOSTS = ['testserver']
+
+    import django
+
+    django.setup()
+
+
+def load_users(count):
+    from django.db import connection, transaction
+
+    rng = random.Random(42)
+    batch = []
+    with transaction.atomic(), connection.cursor() as cursor:
+        for i in range(1, count + 1):
+            name = ''.join(rng.choices(string.ascii_lowercase, k=8))
+            batch.append((i, name.capitalize(), f'{name}{i}@example.com'))
+            if len(batch) == 50_000 or i == count:
+                cursor.executemany(
+                    "INSERT INTO teamflow_user (id, password, is_superuser, username, first_name, last_name, "
+                    "email, is_staff, is_active, date_joined) "
+                    "VALUES (%s, '', 0, %s, '', '', %s, 0, 1, '2024-01-01 00:00:00')",
+                    batch,
+                )
+                batch = []
+        cursor.execute(
+            "INSERT INTO teamflow_project (id, name, description, start_date, due_date, created_by_id, "
+            "updated_at, hidden) VALUES (1, 'Bench', '', '2024-01-01', '2024-12-31', 1, '2024-01-01 00:00:00', 0)"
+        )
+        cursor.executemany(
+            "INSERT INTO teamflow_project_members (project_id, user_id) VALUES (1, %s)",
+            [(i,) for i in range(1, count + 1, 100)],
+        )
+        cursor.execute('ANALYZE')
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--users', type=int, default=1_000_000)
+    parser.add_argument('--queries', type=int, default=200)
+    parser.add_argument('--budget-ms', type=float, default=50.0)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        setup_database(os.path.join(tmp, 'bench.sqlite3'))
+
+        from django.core.management import call_command
+        from rest_framework.test import APIClient
+        from teamflow.models import User
+
+        call_command('migrate', verbosity=0)
+        started = time.perf_counter()
+        load_users(args.users)
+        print(f'Loaded {args.users} users in {time.perf_counter() - started:.1f}s')
+
+        from django.db.models.functions import Lower
+
+        print(User.objects.exclude(joined_projects=1).alias(key=Lower('username')).filter(
+            key__gte='ab', key__lt='ab\U0010ffff').order_by('key')[:20].explain())
+
+        client = APIClient()
+        client.force_authenticate(User.objects.get(pk=1))
+
+        rng = random.Random(7)
+        timings = []
+        for _ in range(args.queries):
+            prefix = ''.join(rng.choices(string.ascii_lowercase, k=rng.randint(1, 4)))
+            started = time.perf_counter()
+            response = client.get('/api/users/search/', {'q': prefix, 'project': 1})
+            timings.append((time.perf_counter() - started) * 1000)
+            assert response.status_code == 200, response.status_code
+
+        timings.sort()
+        p95 = timings[int(len(timings) * 0.95) - 1]
+        print(f'median {statistics.median(timings):.2f} ms, p95 {p95:.2f} ms, max {timings[-1]:.2f} ms')
+        if p95 > args.budget_ms:
+            sys.exit(f'p95 over the {args.budget_ms} ms budget')
+
+
+if __name__ == '__main__':
+    main()
@@ -1,11 +1,21 @@
 from django.contrib import admin
 from django.contrib.auth.admin import UserAdmin as BaseUserAdmin
+from django.db.models import Count, IntegerField, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+from django.urls import reverse
 from .models import (User,
                      Task,
                      Project)
+from .pagination import EstimatedCountPaginator
+
+# Resultados por busca dos campos de autocomplete de usuários
+AUTOCOMPLETE_LIMIT = 20
 
 class UserAdmin(BaseUserAdmin):
     ordering = ['id']
+    # Sem COUNT(*) da tabela inteira nas listas grandes (teamflow.pagination)
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
     list_display = ['username', 'email', 'first_name', 'last_name', 'is_staff']
     fieldsets = (
         (None, {'fields': ('username', 'email', 'password')}),
@@ -41,10 +51,23 @@ class UserAdmin(BaseUserAdmin):
         }),
     )
 
+    def get_search_results(self, request, queryset, search_term):
+        # O autocomplete de membros usa a busca por prefixo sobre os índices
+        # LOWER(username)/LOWER(email), em vez de icontains na tabela inteira
+        if search_term and request.path == reverse('admin:autocomplete'):
+            matches = User.objects.search_prefix(search_term, AUTOCOMPLETE_LIMIT)
+            return queryset.filter(pk__in=[user.pk for user in matches]), False
+        return super().get_search_results(request, queryset, search_term)
+
 
 class ProjectAdmin(admin.ModelAdmin):
     ordering = ['-start_date']
-    list_display = ['name', 'created_by', 'start_date', 'due_date', 'get_members']
+    list_display = ['name', 'created_by', 'start_date', 'due_date', 'member_count', 'hidden']
+    list_filter = ['hidden']
+    list_select_related = ['created_by']
+    search_fields = ['name']
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
     fieldsets = (
         (None, {'fields': ('name', 'description')}),
         ('Datas', {'fields': ('start_date', 'due_date')}),
@@ -52,14 +75,34 @@ class ProjectAdmin(admin.ModelAdmin):
         ('Membros', {'fields': ('members',)}),
     )
 
-    filter_horizontal = ('members',)
+    # Busca no servidor em vez de carregar todos os usuários no formulário
+    autocomplete_fields = ['created_by', 'members']
+
+    def get_queryset(self, request):
+        # Contagem por subconsulta só nas linhas da página; o COUNT(*) da paginação
+        # não a inclui
+        members = Project.members.through.objects.filter(project=OuterRef('pk')).order_by()
+        member_count = Subquery(
+            members.values('project').annotate(count=Count('*')).values('count'),
+            output_field=IntegerField(),
+        )
+        # Inclui os projetos ocultos (exclusão em andamento ou que falhou), que
+        # o gerenciador padrão esconde
+        queryset = Project.all_objects.annotate(member_count=Coalesce(member_count, 0))
+        ordering = self.get_ordering(request)
+        return queryset.order_by(*ordering) if ordering else queryset
 
-    def get_members(self, obj):
-        return ", ".join([member.username for member in obj.members.all()])
-    get_members.short_description = 'Members'
+    def member_count(self, obj):
+        return obj.member_count
+    member_count.admin_order_field = 'member_count'
+    member_count.short_description = 'Members'
 
 class TaskAdmin(admin.ModelAdmin):
     list_display = ['title', 'assigned_to', 'project_name']
+    list_select_related = ['assigned_to', 'project']
+    autocomplete_fields = ['assigned_to', 'project']
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
 
     def project_name(self, obj):
         return obj.project.name
@@ -0,0 +1,107 @@
+from collections import Counter
+
+from django.db.models import Case, Count, F, Value, When
+from django.utils import timezone
+
+from .models import Project, ProjectTaskCount, Task, TaskStatus
+
+REBUILD_BATCH_SIZE = 1000
+
+
+def create_counts(project):
+    """Start the counters of a new project at zero, one row per status."""
+    ProjectTaskCount.objects.bulk_create(
+        ProjectTaskCount(project=project, status=status) for status in TaskStatus
+    )
+
+
+def adjust_counts(deltas):
+    """Apply ``{(project_id, status): delta}`` to the counters.
+
+    Each counter is changed with ``count = count + delta``, so concurrent
+    writers don't lose updates; call it inside the transaction that writes
+    the tasks. The projects' ``updated_at`` is touched too, since the counts
+    are part of the project in the API (and of its ETag).
+    """
+    deltas = {key: delta for key, delta in deltas.items() if delta}
+    if not deltas:
+        return
+    project_ids = {project_id for project_id, _ in deltas}
+    # Um único UPDATE para todos os contadores, qualquer que seja o número de projetos
+    ProjectTaskCount.objects.filter(project_id__in=project_ids).update(count=F('count') + Case(
+        *[When(project_id=project_id, status=status, then=Value(delta))
+          for (project_id, status), delta in deltas.items()],
+        default=Value(0),
+    ))
+    Project.all_objects.filter(pk__in=project_ids).update(updated_at=timezone.now())
+
+
+def count_new_tasks(tasks):
+    """Deltas for a batch of newly created tasks."""
+    return Counter((task.project_id, task.status) for task in tasks)
+
+
+def empty_counts():
+    return dict.fromkeys(TaskStatus, 0)
+
+
+def count_rows(project_ids):
+    return ProjectTaskCount.objects.filter(project_id__in=project_ids).values_list('project_id', 'status', 'count')
+
+
+def group_counts(rows):
+    counts = {}
+    for project_id, status, count in rows:
+        counts.setdefault(project_id, empty_counts())[TaskStatus(status)] = count
+    return counts
+
+
+def task_counts(project_ids):
+    """``{project_id: {TaskStatus: count}}`` with every status, in TaskStatus
+    order. ``project_ids`` may be a list or a subquery."""
+    return group_counts(count_rows(project_ids))
+
+
+async def atask_counts(project_ids):
+    """``task_counts`` through the async ORM."""
+    return group_counts([row async for row in count_rows(project_ids)])
+
+
+def rebuild_counts(project_ids=None):
+    """Recompute the counters from the tasks with one GROUP BY query.
+
+    Rebuilds every project, or only ``project_ids``, and creates missing
+    counter rows. Returns the number of projects rebuilt.
+    """
+    tasks = Task.objects.all()
+    projects = Project.all_objects.order_by('id')
+    if project_ids is not None:
+        tasks = tasks.filter(project_id__in=project_ids)
+        projects = projects.filter(pk__in=project_ids)
+
+    counts = {
+        (project_id, status): count
+        for project_id, status, count in tasks.values_list('project_id', 'status').annotate(Count('id')).order_by()
+    }
+
+    rebuilt = 0
+    rows = []
+    for project_id in projects.values_list('id', flat=True).iterator(chunk_size=REBUILD_BATCH_SIZE):
+        rebuilt += 1
+        rows += [
+            ProjectTaskCount(project_id=project_id, status=status, count=counts.get((project_id, status), 0))
+            for status in TaskStatus
+        ]
+        if len(rows) >= REBUILD_BATCH_SIZE:
+            save_counts(rows)
+    save_counts(rows)
+    projects.update(updated_at=timezone.now())
+    return rebuilt
+
+
+def save_counts(rows):
+    # INSERT ... ON CONFLICT (project, status) DO UPDATE, criando as linhas que faltarem
+    ProjectTaskCount.objects.bulk_create(
+        rows, update_conflicts=True, unique_fields=['project', 'status'], update_fields=['count']
+    )
+    rows.clear()
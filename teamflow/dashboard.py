@@ -0,0 +1,212 @@
+from uuid import uuid4
+
+from django.conf import settings
+from django.core.cache import caches
+from django.db import transaction
+from django.db.models import Q
+
+from .models import Project, Task
+from .replicas import use_primary
+
+USER_KEY = 'dashboard:user:{}'
+PROJECT_KEY = 'dashboard:project:{}'
+HITS_KEY = 'dashboard:hits'
+MISSES_KEY = 'dashboard:misses'
+
+
+def user_projects(user):
+    return Project.objects.filter(members=user).select_related('created_by')
+
+
+def get_user_projects(user):
+    """Projects the user is a member of, with their creator loaded."""
+    return list(user_projects(user))
+
+
+def visible_tasks(user, projects):
+    created_ids = [project.id for project in projects if project.created_by_id == user.id]
+    joined_ids = [project.id for project in projects if project.created_by_id != user.id]
+
+    return Task.objects.filter(
+        Q(project_id__in=created_ids) | Q(project_id__in=joined_ids, assigned_to=user)
+    ).select_related('assigned_to').order_by('id')
+
+
+def group_tasks(projects, tasks):
+    project_tasks = {project: [] for project in projects}
+    projects_by_id = {project.id: project for project in projects}
+    for task in tasks:
+        project = projects_by_id[task.project_id]
+        task.project = project
+        project_tasks[project].append(task)
+    return project_tasks
+
+
+def get_project_tasks(user, projects=None):
+    """Build the home page project -> tasks mapping for a user.
+
+    Uses two queries no matter how many projects or tasks there are: one for
+    the projects the user is a member of (with their creator) and one for
+    every visible task (with its assignee). The creator of a project sees all
+    of its tasks, other members only see the tasks assigned to them.
+    """
+    if projects is None:
+        projects = get_user_projects(user)
+    if not projects:
+        return {}
+    return group_tasks(projects, visible_tasks(user, projects))
+
+
+async def aget_project_tasks(user, projects):
+    """``get_project_tasks`` through the async ORM."""
+    if not projects:
+        return {}
+    return group_tasks(projects, [task async for task in visible_tasks(user, projects)])
+
+
+def get_cache():
+    return caches[settings.DASHBOARD_CACHE]
+
+
+def project_keys(project_ids):
+    return {project_id: PROJECT_KEY.format(project_id) for project_id in project_ids}
+
+
+def missing_versions(keys, found):
+    return {key: uuid4().hex for key in keys.values() if key not in found}
+
+
+def project_versions(project_ids):
+    """Current version token of each project, creating the missing ones."""
+    cache = get_cache()
+    keys = project_keys(project_ids)
+    found = cache.get_many(keys.values())
+    missing = missing_versions(keys, found)
+    if missing:
+        cache.set_many(missing, None)
+        found.update(missing)
+    return {project_id: found[key] for project_id, key in keys.items()}
+
+
+async def aproject_versions(project_ids):
+    cache = get_cache()
+    keys = project_keys(project_ids)
+    found = await cache.aget_many(keys.values())
+    missing = missing_versions(keys, found)
+    if missing:
+        await cache.aset_many(missing, None)
+        found.update(missing)
+    return {project_id: found[key] for project_id, key in keys.items()}
+
+
+def count(key):
+    cache = get_cache()
+    cache.add(key, 0, None)
+    try:
+        cache.incr(key)
+    except ValueError:
+        # A chave foi removida entre o add e o incr
+        cache.set(key, 1, None)
+
+
+async def acount(key):
+    cache = get_cache()
+    await cache.aadd(key, 0, None)
+    try:
+        await cache.aincr(key)
+    except ValueError:
+        await cache.aset(key, 1, None)
+
+
+def is_current(entry, current):
+    return entry is not None and all(
+        current.get(PROJECT_KEY.format(project_id)) == version
+        for project_id, version in entry['versions'].items()
+    )
+
+
+def get_cached_project_tasks(user):
+    """``get_project_tasks`` behind a per-user cache entry.
+
+    The entry records the version token of every project it shows and is
+    only used while all of them are unchanged; writes to a project, its
+    tasks or its members replace the token (see ``teamflow.signals``).
+    """
+    cache = get_cache()
+    key = USER_KEY.format(user.pk)
+
+    entry = cache.get(key)
+    if entry is not None:
+        current = cache.get_many(PROJECT_KEY.format(project_id) for project_id in entry['versions'])
+        if is_current(entry, current):
+            count(HITS_KEY)
+            return entry['project_tasks']
+
+    count(MISSES_KEY)
+    # A entrada é preenchida pelo primário: uma réplica atrasada deixaria no
+    # cache dados antigos com a versão nova
+    with use_primary():
+        projects = get_user_projects(user)
+        # Versões lidas antes das tarefas: uma escrita no meio invalida a entrada
+        versions = project_versions([project.id for project in projects])
+        project_tasks = get_project_tasks(user, projects)
+    cache.set(key, {'versions': versions, 'project_tasks': project_tasks}, settings.DASHBOARD_CACHE_TIMEOUT)
+    return project_tasks
+
+
+async def aget_cached_project_tasks(user):
+    """``get_cached_project_tasks`` with the async cache and ORM methods."""
+    cache = get_cache()
+    key = USER_KEY.format(user.pk)
+
+    entry = await cache.aget(key)
+    if entry is not None:
+        current = await cache.aget_many(PROJECT_KEY.format(project_id) for project_id in entry['versions'])
+        if is_current(entry, current):
+            await acount(HITS_KEY)
+            return entry['project_tasks']
+
+    await acount(MISSES_KEY)
+    with use_primary():
+        projects = [project async for project in user_projects(user)]
+        versions = await aproject_versions([project.id for project in projects])
+        project_tasks = await aget_project_tasks(user, projects)
+    await cache.aset(key, {'versions': versions, 'project_tasks': project_tasks}, settings.DASHBOARD_CACHE_TIMEOUT)
+    return project_tasks
+
+
+def after_commit(invalidate):
+    """Run ``invalidate`` now and, inside a transaction, again once it commits.
+
+    A cache miss running alongside the transaction can read the new token
+    and then the old committed rows; the second run replaces that token
+    once the new rows are visible.
+    """
+    invalidate()
+    if transaction.get_connection().in_atomic_block:
+        transaction.on_commit(invalidate)
+
+
+def invalidate_projects(project_ids):
+    """Replace the version token of the given projects, now and on commit."""
+    project_ids = set(project_ids)
+    if project_ids:
+        after_commit(lambda: get_cache().set_many(
+            {PROJECT_KEY.format(project_id): uuid4().hex for project_id in project_ids}, None
+        ))
+
+
+def invalidate_users(user_ids):
+    """Drop the dashboard entries of the given users, now and on commit."""
+    user_ids = set(user_ids)
+    if user_ids:
+        after_commit(lambda: get_cache().delete_many([USER_KEY.format(user_id) for user_id in user_ids]))
+
+
+def cache_stats():
+    cache = get_cache()
+    stats = cache.get_many([HITS_KEY, MISSES_KEY])
+    return {
+        'hits': stats.get(HITS_KEY, 0),
+        'misses': stats.get(MISSES_KEY, 0),
+    }
@@ -0,0 +1,44 @@
+from contextlib import contextmanager
+
+from django.db import transaction
+from django.utils import timezone
+
+from .models import Job
+
+
+def start_job(kind, user, task, *args, total=0):
+    """Create a Job and queue ``task(job_id, *args)`` once it is committed.
+
+    Returns the pending Job; its progress is read back through
+    ``GET /api/jobs/<pk>/``.
+    """
+    job = Job.objects.create(kind=kind, created_by=user, total=total)
+    # O worker só deve ler o Job depois do commit
+    transaction.on_commit(lambda: task.delay(job.id, *args))
+    return job
+
+
+def set_progress(job, done, total=None):
+    job.done = done
+    if total is not None:
+        job.total = total
+    Job.objects.filter(pk=job.pk).update(done=done, total=job.total, updated_at=timezone.now())
+
+
+@contextmanager
+def running(job_id):
+    """Mark a job as running for the body of a task, then as succeeded or
+    failed. The body may set ``job.result``."""
+    job = Job.objects.get(pk=job_id)
+    job.state = 'running'
+    job.save(update_fields=['state', 'updated_at'])
+    try:
+        yield job
+    except Exception as e:
+        job.state = 'failed'
+        job.error = str(e)
+        job.save(update_fields=['state', 'error', 'updated_at'])
+        raise
+    job.state = 'succeeded'
+    job.done = max(job.done, job.total)
+    job.save(update_fields=['state', 'done', 'result', 'updated_at'])
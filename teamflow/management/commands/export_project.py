@@ -0,0 +1,27 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from teamflow.models import Project
+from teamflow.snapshots import FORMATS, export_project
+
+
+class Command(BaseCommand):
+    help = "Write a project snapshot (metadata, members and tasks) as NDJSON or JSON."
+
+    def add_arguments(self, parser):
+        parser.add_argument('project_id', type=int)
+        parser.add_argument('--format', choices=FORMATS, default='ndjson')
+        parser.add_argument('--output', help="Defaults to stdout.")
+
+    def handle(self, *args, **options):
+        try:
+            project = Project.objects.select_related('created_by').get(pk=options['project_id'])
+        except Project.DoesNotExist:
+            raise CommandError("Project not found.")
+
+        chunks = export_project(project, options['format'])
+        if options['output']:
+            with open(options['output'], 'w', encoding='utf-8') as output:
+                output.writelines(chunks)
+        else:
+            for chunk in chunks:
+                self.stdout.write(chunk, ending='')
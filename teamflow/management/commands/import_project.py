@@ -0,0 +1,32 @@
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+from django.db import IntegrityError
+
+from teamflow.snapshots import import_snapshot
+from teamflow.task_import import decode_lines
+
+
+class Command(BaseCommand):
+    help = "Restore an ndjson project snapshot written by export_project as a new project."
+
+    def add_arguments(self, parser):
+        parser.add_argument('path')
+        parser.add_argument('--owner', help="Email of the new creator. Defaults to the snapshot's creator.")
+
+    def handle(self, *args, **options):
+        owner = None
+        if options['owner']:
+            owner = get_user_model().objects.with_email(options['owner']).first()
+            if owner is None:
+                raise CommandError("Owner not found.")
+
+        with open(options['path'], 'rb') as stream:
+            try:
+                project, report = import_snapshot(decode_lines(stream), 'ndjson', owner=owner)
+            except (ValueError, IntegrityError) as e:
+                raise CommandError(f"Invalid snapshot: {e}")
+
+        self.stdout.write(self.style.SUCCESS(
+            f"Created project {project.id}: {report['members']} members, {report['tasks']} tasks "
+            f"({report['missing_users']} unknown members, {report['skipped_tasks']} tasks skipped)."
+        ))
@@ -0,0 +1,38 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from teamflow.models import Project
+from teamflow.task_import import FORMATS, decode_lines, format_from_name, import_tasks
+
+
+class Command(BaseCommand):
+    help = "Stream tasks from a CSV or JSONL file into a project."
+
+    def add_arguments(self, parser):
+        parser.add_argument('project_id', type=int)
+        parser.add_argument('path')
+        parser.add_argument('--format', choices=FORMATS, help="Defaults to the file extension.")
+        parser.add_argument('--batch-size', type=int, default=1000)
+
+    def handle(self, *args, **options):
+        try:
+            project = Project.objects.get(pk=options['project_id'])
+        except Project.DoesNotExist:
+            raise CommandError("Project not found.")
+
+        file_format = options['format'] or format_from_name(options['path'])
+        if file_format is None:
+            raise CommandError("Unknown file format, use --format.")
+
+        with open(options['path'], 'rb') as stream:
+            report = import_tasks(project, decode_lines(stream), file_format, batch_size=options['batch_size'])
+
+        for error in report.errors:
+            self.stderr.write(f"Row {error['row']}: {error['error']}")
+        if report.error_count > len(report.errors):
+            self.stderr.write(f"... {report.error_count - len(report.errors)} more errors")
+        if report.failure:
+            raise CommandError(f"{report.failure}. Created {report.created} tasks before it.")
+
+        self.stdout.write(self.style.SUCCESS(
+            f"Created {report.created} tasks, {report.error_count} rows with errors."
+        ))
@@ -0,0 +1,14 @@
+from django.core.management.base import BaseCommand
+
+from teamflow.counters import rebuild_counts
+
+
+class Command(BaseCommand):
+    help = "Recompute the per-project task status counters from the tasks."
+
+    def add_arguments(self, parser):
+        parser.add_argument('project_ids', nargs='*', type=int, help="Defaults to every project.")
+
+    def handle(self, *args, **options):
+        rebuilt = rebuild_counts(options['project_ids'] or None)
+        self.stdout.write(self.style.SUCCESS(f"Rebuilt the task counters of {rebuilt} projects."))
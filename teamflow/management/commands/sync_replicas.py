@@ -0,0 +1,27 @@
+import sqlite3
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import DEFAULT_DB_ALIAS, connections
+
+
+class Command(BaseCommand):
+    help = "Copy the SQLite primary into the SQLite replica files, to try the replica router locally."
+
+    def handle(self, *args, **options):
+        if not settings.DATABASE_REPLICAS:
+            raise CommandError("No replicas configured: set TEAMFLOW_DB_REPLICAS.")
+
+        primary = connections[DEFAULT_DB_ALIAS]
+        if primary.vendor != 'sqlite':
+            raise CommandError("Only SQLite databases can be copied; use the database's own replication.")
+
+        primary.ensure_connection()
+        for alias in settings.DATABASE_REPLICAS:
+            connections[alias].close()
+            # API de backup do SQLite: cópia consistente mesmo com o primário em uso
+            with sqlite3.connect(settings.DATABASES[alias]['NAME']) as replica:
+                primary.connection.backup(replica)
+            replica.close()
+            self.stdout.write(f"Copied {DEFAULT_DB_ALIAS} into {alias}.")
+        self.stdout.write(self.style.SUCCESS(f"Synced {len(settings.DATABASE_REPLICAS)} replicas."))
@@ -0,0 +1,44 @@
+from django.contrib.auth import get_user_model
+from django.db.models.functions import Lower
+
+from .models import Project
+
+
+def add_members(project, emails):
+    """Add the users with the given emails to ``project``.
+
+    Returns one ``{'email', 'status'}`` result per email, with status
+    ``added``, ``already_member`` or ``not_found``. Uses one query for the
+    users, one for the existing memberships and one batch insert.
+    """
+    emails = list(dict.fromkeys(emails))
+
+    users = get_user_model().objects.alias(email_lower=Lower('email')).filter(
+        email_lower__in=[email.lower() for email in emails]
+    ).only('id', 'email')
+    users_by_email = {user.email.lower(): user for user in users}
+
+    existing = set(
+        Project.members.through.objects.filter(
+            project=project, user_id__in=[user.id for user in users_by_email.values()]
+        ).values_list('user_id', flat=True)
+    )
+
+    results = []
+    new_ids = []
+    for email in emails:
+        user = users_by_email.get(email.lower())
+        if user is None:
+            results.append({'email': email, 'status': 'not_found'})
+        elif user.id in existing:
+            results.append({'email': email, 'status': 'already_member'})
+        else:
+            existing.add(user.id)
+            new_ids.append(user.id)
+            results.append({'email': email, 'status': 'added'})
+
+    if new_ids:
+        # Um único INSERT em lote na tabela intermediária (e os sinais m2m_changed)
+        project.members.add(*new_ids)
+
+    return results
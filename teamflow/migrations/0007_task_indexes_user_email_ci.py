@@ -0,0 +1,39 @@
+# Generated by Django 5.2.18 on 2026-10-18 04:25
+
+import django.db.models.functions.text
+import teamflow.models
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('auth', '0012_alter_user_first_name_max_length'),
+        ('teamflow', '0006_delete_comment'),
+    ]
+
+    operations = [
+        migrations.AlterModelManagers(
+            name='user',
+            managers=[
+                ('objects', teamflow.models.UserManager()),
+            ],
+        ),
+        migrations.AlterField(
+            model_name='project',
+            name='description',
+            field=models.TextField(max_length=255),
+        ),
+        migrations.AddIndex(
+            model_name='task',
+            index=models.Index(fields=['project', 'assigned_to', 'status'], name='task_project_assignee_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='task',
+            index=models.Index(fields=['due_date'], name='task_due_date_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='user',
+            index=models.Index(django.db.models.functions.text.Lower('email'), name='user_email_ci_idx'),
+        ),
+    ]
@@ -0,0 +1,19 @@
+# Generated by Django 5.2.18 on 2026-10-18 04:28
+
+import django.db.models.functions.text
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('auth', '0012_alter_user_first_name_max_length'),
+        ('teamflow', '0007_task_indexes_user_email_ci'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='user',
+            index=models.Index(django.db.models.functions.text.Lower('username'), name='user_username_ci_idx'),
+        ),
+    ]
@@ -0,0 +1,49 @@
+# Generated by Django 5.2.18 on 2026-10-18 05:03
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.db.models import Count
+
+STATUSES = ['Not Started', 'In Progress', 'Concluded']
+
+
+def fill_counts(apps, schema_editor):
+    Project = apps.get_model('teamflow', 'Project')
+    Task = apps.get_model('teamflow', 'Task')
+    ProjectTaskCount = apps.get_model('teamflow', 'ProjectTaskCount')
+
+    counts = {
+        (project_id, status): count
+        for project_id, status, count in Task.objects.values_list('project_id', 'status').annotate(Count('id')).order_by()
+    }
+    ProjectTaskCount.objects.bulk_create(
+        (
+            ProjectTaskCount(project_id=project_id, status=status, count=counts.get((project_id, status), 0))
+            for project_id in Project.objects.values_list('id', flat=True).iterator()
+            for status in STATUSES
+        ),
+        batch_size=1000,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('teamflow', '0012_project_hidden'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ProjectTaskCount',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('status', models.CharField(max_length=255)),
+                ('count', models.IntegerField(default=0)),
+                ('project', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='task_counts', to='teamflow.project')),
+            ],
+            options={
+                'constraints': [models.UniqueConstraint(fields=('project', 'status'), name='project_task_count_unique')],
+            },
+        ),
+        migrations.RunPython(fill_counts, migrations.RunPython.noop),
+    ]
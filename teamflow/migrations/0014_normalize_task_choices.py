@@ -0,0 +1,68 @@
+from django.db import migrations
+from django.db.models import Count
+
+# Nomes aceitos para cada código, comparados sem maiúsculas, espaços extras ou "_"
+STATUSES = {'not started': 0, 'in progress': 1, 'concluded': 2}
+PRIORITIES = {'low': 0, 'medium': 1, 'high': 2}
+STATUS_LABELS = ['Not Started', 'In Progress', 'Concluded']
+PRIORITY_LABELS = ['Low', 'Medium', 'High']
+
+
+def normalize(value):
+    return ' '.join(str(value).replace('_', ' ').lower().split())
+
+
+def to_codes(model, field, codes, default):
+    # Um UPDATE por grafia distinta; valores desconhecidos ficam com o padrão
+    for value in list(model.objects.values_list(field, flat=True).distinct()):
+        code = codes.get(normalize(value), default)
+        model.objects.filter(**{field: value}).update(**{field: str(code)})
+
+
+def to_labels(model, field, labels):
+    for code, label in enumerate(labels):
+        model.objects.filter(**{field: str(code)}).update(**{field: label})
+
+
+def forwards(apps, schema_editor):
+    Project = apps.get_model('teamflow', 'Project')
+    Task = apps.get_model('teamflow', 'Task')
+    ProjectTaskCount = apps.get_model('teamflow', 'ProjectTaskCount')
+
+    to_codes(Task, 'status', STATUSES, 0)
+    to_codes(Task, 'priority', PRIORITIES, 0)
+
+    # Recontados com as grafias já unificadas (antes só a grafia exata era contada)
+    counts = {
+        (project_id, status): count
+        for project_id, status, count in Task.objects.values_list('project_id', 'status').annotate(Count('id')).order_by()
+    }
+    ProjectTaskCount.objects.all().delete()
+    ProjectTaskCount.objects.bulk_create(
+        (
+            ProjectTaskCount(project_id=project_id, status=str(code), count=counts.get((project_id, str(code)), 0))
+            for project_id in Project.objects.values_list('id', flat=True).iterator()
+            for code in STATUSES.values()
+        ),
+        batch_size=1000,
+    )
+
+
+def backwards(apps, schema_editor):
+    Task = apps.get_model('teamflow', 'Task')
+    ProjectTaskCount = apps.get_model('teamflow', 'ProjectTaskCount')
+
+    to_labels(Task, 'status', STATUS_LABELS)
+    to_labels(Task, 'priority', PRIORITY_LABELS)
+    to_labels(ProjectTaskCount, 'status', STATUS_LABELS)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('teamflow', '0013_project_task_count'),
+    ]
+
+    operations = [
+        migrations.RunPython(forwards, backwards),
+    ]
@@ -1,7 +1,43 @@
 from django.db import models
-from django.contrib.auth.models import AbstractUser
+from django.db.models.functions import Lower
+from django.contrib.auth.models import AbstractUser, UserManager as BaseUserManager
 
 
+class UserManager(BaseUserManager):
+    def with_email(self, email):
+        # Busca de email sem diferenciar maiúsculas, atendida pelo índice LOWER(email)
+        return self.alias(email_lower=Lower('email')).filter(email_lower=email.lower())
+
+    def get_by_natural_key(self, username):
+        # O email exato primeiro; sem ele, a busca sem diferenciar maiúsculas só vale
+        # se achar uma conta (contas antigas podem diferir só nas maiúsculas)
+        user = self.filter(email=username).first()
+        if user is None:
+            matches = list(self.with_email(username)[:2])
+            if len(matches) != 1:
+                raise self.model.DoesNotExist(f"No single user with email {username}.")
+            user = matches[0]
+        return user
+
+    def search_prefix(self, prefix, limit, exclude_project=None):
+        # Um intervalo [prefixo, prefixo + maior caractere) sobre LOWER(...) por campo,
+        # percorrido na ordem do índice de expressão, então o custo depende só do limite
+        prefix = prefix.lower()
+        upper = prefix + '\U0010ffff'
+
+        users = self.get_queryset()
+        if exclude_project is not None:
+            users = users.exclude(joined_projects=exclude_project)
+
+        found = {}
+        for field in ('username', 'email'):
+            matches = users.alias(key=Lower(field)).filter(
+                key__gte=prefix, key__lt=upper
+            ).order_by('key')[:limit]
+            for user in matches:
+                found.setdefault(user.pk, user)
+        return list(found.values())[:limit]
+
 
 class User(AbstractUser):
     email = models.EmailField(unique=True)
@@ -9,6 +45,20 @@ class User(AbstractUser):
     USERNAME_FIELD = 'email'
     REQUIRED_FIELDS = []
 
+    objects = UserManager()
+
+    class Meta(AbstractUser.Meta):
+        indexes = [
+            models.Index(Lower('email'), name='user_email_ci_idx'),
+            models.Index(Lower('username'), name='user_username_ci_idx'),
+        ]
+
+class VisibleProjectManager(models.Manager):
+    def get_queryset(self):
+        # Projetos sendo excluídos em segundo plano somem de todas as telas e da API
+        return super().get_queryset().filter(hidden=False)
+
+
 class Project(models.Model):
     name = models.CharField(max_length=255)
     description = models.TextField(max_length=255)
@@ -16,12 +66,108 @@ class Project(models.Model):
     due_date = models.DateField()
     created_by = models.ForeignKey(User, on_delete=models.CASCADE, related_name='created_projects')
     members = models.ManyToManyField(User, related_name='joined_projects')
+    # Atualizado também quando os membros mudam (ver teamflow.signals)
+    updated_at = models.DateTimeField(auto_now=True)
+    # Marcado ao pedir a exclusão; as tarefas e membros são removidos em lotes (ver teamflow.tasks)
+    hidden = models.BooleanField(default=False)
+
+    objects = VisibleProjectManager()
+    all_objects = models.Manager()
+
+class LabelChoices(models.IntegerChoices):
+    @classmethod
+    def from_label(cls, label):
+        """The choice whose label matches ``label`` ignoring case, spaces
+        and underscores ("not started", "NOT_STARTED"), or None."""
+        key = normalize_label(label)
+        for choice in cls:
+            if normalize_label(choice.label) == key:
+                return choice
+        return None
+
+
+def normalize_label(label):
+    return ' '.join(str(label).replace('_', ' ').lower().split())
+
+
+# Guardados como inteiros; os nomes só aparecem nas telas, na API e nos arquivos
+class TaskStatus(LabelChoices):
+    NOT_STARTED = 0, 'Not Started'
+    IN_PROGRESS = 1, 'In Progress'
+    CONCLUDED = 2, 'Concluded'
+
+
+class TaskPriority(LabelChoices):
+    LOW = 0, 'Low'
+    MEDIUM = 1, 'Medium'
+    HIGH = 2, 'High'
+
 
 class Task(models.Model):
     title = models.CharField(max_length=255)
     description = models.TextField(max_length=1024)
-    status = models.CharField(max_length=255)
-    priority = models.CharField(max_length=255)
+    status = models.PositiveSmallIntegerField(choices=TaskStatus.choices, default=TaskStatus.NOT_STARTED)
+    priority = models.PositiveSmallIntegerField(choices=TaskPriority.choices)
     due_date = models.DateField()
     assigned_to = models.ForeignKey(User, on_delete=models.CASCADE)
     project = models.ForeignKey(Project, on_delete=models.CASCADE)
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        task = super().from_db(db, field_names, values)
+        # Projeto e status carregados, para os contadores saberem de onde a tarefa saiu
+        task._loaded = (task.__dict__.get('project_id'), task.__dict__.get('status'))
+        return task
+
+    def refresh_from_db(self, using=None, fields=None, from_queryset=None):
+        super().refresh_from_db(using, fields, from_queryset)
+        # Os campos relidos passam a ser os carregados; sem isso um save depois de
+        # refresh_from_db tiraria dos contadores o status de antes
+        loaded = list(getattr(self, '_loaded', (None, None)))
+        for position, field in enumerate(('project_id', 'status')):
+            if fields is None or field in fields or field.removesuffix('_id') in fields:
+                loaded[position] = self.__dict__.get(field)
+        self._loaded = tuple(loaded)
+
+    class Meta:
+        indexes = [
+            # (project, assigned_to) e (project, assigned_to, status)
+            models.Index(fields=['project', 'assigned_to', 'status'], name='task_project_assignee_idx'),
+            models.Index(fields=['due_date'], name='task_due_date_idx'),
+            # Filtros da API de tarefas, todos terminando em due_date para intervalos e ordenação
+            models.Index(fields=['project', 'due_date'], name='task_project_due_idx'),
+            models.Index(fields=['project', 'status', 'due_date'], name='task_project_status_due_idx'),
+            models.Index(fields=['assigned_to', 'due_date'], name='task_assignee_due_idx'),
+            models.Index(fields=['assigned_to', 'status', 'due_date'], name='task_assignee_status_due_idx'),
+            models.Index(fields=['assigned_to', 'priority', 'due_date'], name='task_assignee_priority_due_idx'),
+        ]
+
+
+
+class ProjectTaskCount(models.Model):
+    """Number of tasks of a project in one status (see teamflow.counters)."""
+    project = models.ForeignKey(Project, on_delete=models.CASCADE, related_name='task_counts')
+    status = models.PositiveSmallIntegerField(choices=TaskStatus.choices)
+    count = models.IntegerField(default=0)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=['project', 'status'], name='project_task_count_unique'),
+        ]
+
+JOB_STATES = ['pending', 'running', 'succeeded', 'failed']
+
+class Job(models.Model):
+    """Progress of a Celery task started from a request (see teamflow.jobs)."""
+    kind = models.CharField(max_length=64)
+    state = models.CharField(max_length=16, default='pending')
+    created_by = models.ForeignKey(User, on_delete=models.CASCADE, related_name='jobs')
+    total = models.PositiveIntegerField(default=0)
+    done = models.PositiveIntegerField(default=0)
+    result = models.JSONField(null=True, blank=True)
+    error = models.TextField(blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return f"{self.kind} #{self.pk} ({self.state})"
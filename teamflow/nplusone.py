@@ -0,0 +1,153 @@
+import logging
+import os
+import re
+import sys
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.template.base import Node
+
+from .timing import install_execute_wrapper
+
+logger = logging.getLogger('teamflow.nplusone')
+
+# Consultas vistas na requisição ou no teste atual (detect_nplusone); mutável,
+# para que as consultas feitas em outra thread (sync_to_async) também entrem
+_tracker = ContextVar('nplusone_tracker', default=None)
+
+LITERALS = re.compile(r"'(?:[^']|'')*'|\b\d+(?:\.\d+)?\b")
+IN_LISTS = re.compile(r'\(\s*%s(?:\s*,\s*%s)*\s*\)')
+SKIPPED_FILES = (__file__, os.path.join(os.path.dirname(__file__), 'timing.py'))
+
+
+class NPlusOneError(AssertionError):
+    pass
+
+
+def fingerprint(sql):
+    """The shape of a query: literals and ``IN`` lists of any length look the same."""
+    sql = IN_LISTS.sub('(%s, ...)', LITERALS.sub('%s', sql))
+    return ' '.join(sql.split())
+
+
+def is_project_file(filename):
+    return (filename.startswith(str(settings.BASE_DIR))
+            and 'site-packages' not in filename
+            and filename not in SKIPPED_FILES)
+
+
+def call_site():
+    """Where the current query comes from: the template line being rendered,
+    if any, and the innermost line of project code."""
+    template = code = None
+    frame = sys._getframe(1)
+    while frame is not None and code is None:
+        if template is None and frame.f_code.co_name == 'render_annotated':
+            node = frame.f_locals.get('self')
+            if isinstance(node, Node) and node.origin is not None:
+                template = f'{node.origin.template_name or node.origin.name}:{node.token.lineno}'
+        filename = frame.f_code.co_filename
+        if is_project_file(filename):
+            code = f'{os.path.relpath(filename, settings.BASE_DIR)}:{frame.f_lineno} in {frame.f_code.co_name}'
+        frame = frame.f_back
+
+    code = code or '<unknown>'
+    return f'{template} (from {code})' if template else code
+
+
+class QueryTracker:
+    """Counts the SELECTs by shape and call site."""
+
+    def __init__(self):
+        self.queries = Counter()
+        self.examples = {}
+
+    def record(self, sql):
+        key = (fingerprint(sql), call_site())
+        self.queries[key] += 1
+        self.examples.setdefault(key, sql)
+
+    def repeated(self, threshold=None):
+        """``(count, call site, sql)`` of the queries run ``threshold`` or more times."""
+        threshold = threshold or settings.NPLUSONE_THRESHOLD
+        return [
+            (count, site, self.examples[shape, site])
+            for (shape, site), count in self.queries.most_common()
+            if count >= threshold
+        ]
+
+    def report(self, scope):
+        repeated = self.repeated()
+        if not repeated:
+            return None
+        lines = [f'N+1 queries in {scope}:']
+        lines += [f'  {count} x {site}: {sql}' for count, site, sql in repeated]
+        return '\n'.join(lines)
+
+
+def tracking_execute(execute, sql, params, many, context):
+    tracker = _tracker.get()
+    if tracker is not None and sql.lstrip()[:6].upper() == 'SELECT':
+        tracker.record(sql)
+    return execute(sql, params, many, context)
+
+
+@contextmanager
+def detect_nplusone(scope='block', raise_errors=None):
+    """Watch the queries run in the block for N+1 patterns.
+
+    Queries of the same shape run ``NPLUSONE_THRESHOLD`` or more times from
+    the same place (a line of Python or of a template) are logged on
+    ``teamflow.nplusone`` and, with ``raise_errors`` (by default
+    ``settings.NPLUSONE_RAISE``), raise ``NPlusOneError`` at the end of the
+    block, which fails the test around it. Nested blocks report to the
+    outermost one.
+    """
+    if _tracker.get() is not None:
+        yield _tracker.get()
+        return
+    install_execute_wrapper(tracking_execute)
+    tracker = QueryTracker()
+    token = _tracker.set(tracker)
+    try:
+        yield tracker
+    finally:
+        _tracker.reset(token)
+
+    report = tracker.report(scope)
+    if report:
+        logger.warning(report)
+        if settings.NPLUSONE_RAISE if raise_errors is None else raise_errors:
+            raise NPlusOneError(report)
+
+
+class NPlusOneMiddleware:
+    """``detect_nplusone`` around every request, in development and tests.
+
+    Only installed with ``settings.NPLUSONE_DETECTION``; with
+    ``NPLUSONE_RAISE`` a request with N+1 queries fails, and so does the
+    test that made it.
+    """
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        if not settings.NPLUSONE_DETECTION:
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        with detect_nplusone(f'{request.method} {request.path}'):
+            return self.get_response(request)
+
+    async def __acall__(self, request):
+        with detect_nplusone(f'{request.method} {request.path}'):
+            return await self.get_response(request)
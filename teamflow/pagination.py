@@ -0,0 +1,60 @@
+from django.conf import settings
+from django.core.paginator import Paginator
+from django.db import connections
+from django.db.models import Sum
+from django.utils.functional import cached_property
+
+from .models import ProjectTaskCount, Task
+
+
+def is_unfiltered(queryset):
+    """True when ``queryset`` has no filters beyond its model's default manager,
+    or none at all (``Project.all_objects``)."""
+    model = queryset.model
+    return queryset.query.where in (model._default_manager.all().query.where, model._base_manager.all().query.where)
+
+
+def table_estimate(queryset):
+    """Row count of the table from the ANALYZE statistics (``sqlite_stat1``),
+    or None when there are none."""
+    connection = connections[queryset.db]
+    if connection.vendor != 'sqlite':
+        return None
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT name FROM sqlite_master WHERE type = 'table' AND name = 'sqlite_stat1'")
+        if cursor.fetchone() is None:
+            return None
+        cursor.execute("SELECT stat FROM sqlite_stat1 WHERE tbl = %s LIMIT 1", [queryset.model._meta.db_table])
+        row = cursor.fetchone()
+    # A primeira coluna de stat é o número de linhas da tabela
+    return int(row[0].split()[0]) if row else None
+
+
+def estimate_count(queryset):
+    """Cheap row count of an unfiltered queryset, or None.
+
+    Tasks are counted from the per-project counters (teamflow.counters),
+    which are kept exact; other tables use the ANALYZE statistics, which
+    are as recent as the last ``ANALYZE``.
+    """
+    if not is_unfiltered(queryset):
+        return None
+    if queryset.model is Task:
+        return ProjectTaskCount.objects.using(queryset.db).aggregate(total=Sum('count'))['total'] or 0
+    return table_estimate(queryset)
+
+
+class EstimatedCountPaginator(Paginator):
+    """Paginator that skips the ``COUNT(*)`` of large unfiltered lists.
+
+    Above ``settings.ESTIMATED_COUNT_THRESHOLD`` rows the count comes from
+    ``estimate_count``; smaller or filtered lists are counted exactly.
+    """
+
+    @cached_property
+    def count(self):
+        if hasattr(self.object_list, 'query'):
+            estimate = estimate_count(self.object_list)
+            if estimate is not None and estimate >= settings.ESTIMATED_COUNT_THRESHOLD:
+                return estimate
+        return super().count
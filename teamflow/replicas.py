@@ -0,0 +1,160 @@
+import random
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import wraps
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, connections
+
+PIN_COOKIE = 'teamflow_primary'
+SAFE_METHODS = ('GET', 'HEAD', 'OPTIONS')
+
+# Réplica usada pelas leituras das views marcadas; uma só por requisição,
+# para que as consultas vejam o mesmo ponto da replicação
+_replica = ContextVar('replica', default=None)
+# Estado da requisição atual (ReplicaPinMiddleware): o cliente escreveu há pouco
+# (cookie) ou esta requisição escreveu, e as leituras seguintes vão para o primário.
+# Um dict mutável, para que as escritas feitas em outra thread (sync_to_async) apareçam
+_request = ContextVar('replica_request', default=None)
+
+
+def replicas():
+    return settings.DATABASE_REPLICAS
+
+
+@contextmanager
+def use_replicas():
+    """Let the reads in the block go to one replica (unless pinned)."""
+    token = _replica.set(random.choice(replicas()) if replicas() else None)
+    try:
+        yield
+    finally:
+        _replica.reset(token)
+
+
+@contextmanager
+def use_primary():
+    """Send the reads in the block to the primary, e.g. to fill a cache."""
+    token = _replica.set(None)
+    try:
+        yield
+    finally:
+        _replica.reset(token)
+
+
+class ReplicaRouter:
+    """Route reads to ``settings.DATABASE_REPLICAS`` inside ``replica_reads`` views.
+
+    Everything else reads and writes on the primary: views that are not
+    marked, requests from clients that wrote recently (see
+    ``ReplicaPinMiddleware``), the rest of a request after its first write
+    and anything inside a transaction on the primary. Migrations only run
+    on the primary; replicas get their data by replication.
+    """
+
+    def db_for_read(self, model, **hints):
+        replica = _replica.get()
+        state = _request.get()
+        if state and (state['pinned'] or state['wrote']):
+            return DEFAULT_DB_ALIAS
+        if replica and not connections[DEFAULT_DB_ALIAS].in_atomic_block:
+            return replica
+        return DEFAULT_DB_ALIAS
+
+    def db_for_write(self, model, **hints):
+        state = _request.get()
+        if state is not None:
+            state['wrote'] = True
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+        # Réplicas têm os mesmos dados do primário
+        databases = {DEFAULT_DB_ALIAS, *replicas()}
+        if obj1._state.db in databases and obj2._state.db in databases:
+            return True
+        return None
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        return db == DEFAULT_DB_ALIAS
+
+
+def replica_reads(view_func):
+    """Mark a read-only view (sync or async): its GET queries may use a replica.
+
+    Put it below ``login_required`` so the user is loaded from the primary.
+    """
+    if iscoroutinefunction(view_func):
+        async def wrapper(request, *args, **kwargs):
+            if request.method not in SAFE_METHODS:
+                return await view_func(request, *args, **kwargs)
+            with use_replicas():
+                return await view_func(request, *args, **kwargs)
+        markcoroutinefunction(wrapper)
+    else:
+        def wrapper(request, *args, **kwargs):
+            if request.method not in SAFE_METHODS:
+                return view_func(request, *args, **kwargs)
+            with use_replicas():
+                return view_func(request, *args, **kwargs)
+    return wraps(view_func)(wrapper)
+
+
+class ReplicaReadMixin:
+    """``replica_reads`` for DRF class-based views."""
+
+    def dispatch(self, request, *args, **kwargs):
+        return replica_reads(super().dispatch)(request, *args, **kwargs)
+
+
+class ReplicaPinMiddleware:
+    """Read-your-writes for clients: after a request that wrote to the
+    primary, set a cookie that keeps the client's reads on the primary for
+    ``REPLICA_PIN_SECONDS``, longer than the replication lag."""
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        token = self.start(request)
+        try:
+            response = self.get_response(request)
+            return self.finish(request, response)
+        finally:
+            _request.reset(token)
+
+    async def __acall__(self, request):
+        token = self.start(request)
+        try:
+            response = await self.get_response(request)
+            return self.finish(request, response)
+        finally:
+            _request.reset(token)
+
+    def start(self, request):
+        return _request.set({
+            'pinned': self.pinned_until(request) > time.time(),
+            'wrote': request.method not in SAFE_METHODS,
+        })
+
+    def finish(self, request, response):
+        # Só uma escrita renova o prazo; leituras com o cookie não o estendem
+        if _request.get()['wrote'] and replicas():
+            response.set_cookie(
+                PIN_COOKIE, str(int(time.time() + settings.REPLICA_PIN_SECONDS)),
+                max_age=settings.REPLICA_PIN_SECONDS, httponly=True, samesite='Lax',
+            )
+        return response
+
+    def pinned_until(self, request):
+        try:
+            return int(request.COOKIES.get(PIN_COOKIE, 0))
+        except ValueError:
+            return 0
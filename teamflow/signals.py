@@ -0,0 +1,89 @@
+from django.db.models import Q
+from django.db.models.signals import m2m_changed, post_delete, post_save
+from django.dispatch import receiver
+from django.utils import timezone
+
+from .counters import adjust_counts, create_counts, rebuild_counts
+from .dashboard import invalidate_projects, invalidate_users
+from .models import Project, Task, User
+
+
+@receiver(post_save, sender=Task)
+@receiver(post_delete, sender=Task)
+def task_changed(sender, instance, **kwargs):
+    # Uma tarefa movida de projeto também sai do projeto carregado (Task.from_db).
+    # Registrado antes de count_saved_task, que atualiza _loaded
+    loaded = getattr(instance, '_loaded', None)
+    invalidate_projects({instance.project_id, *(loaded[:1] if loaded else ())} - {None})
+
+
+@receiver(post_save, sender=Task)
+def count_saved_task(sender, instance, created, **kwargs):
+    current = (instance.project_id, instance.status)
+    loaded = getattr(instance, '_loaded', None)
+    if created:
+        adjust_counts({current: 1})
+    elif loaded is None or None in loaded:
+        # Tarefa salva sem ter sido carregada (ou com projeto ou status adiados): recontar o projeto
+        rebuild_counts([instance.project_id])
+    elif loaded != current:
+        adjust_counts({loaded: -1, current: 1})
+    instance._loaded = current
+
+
+@receiver(post_delete, sender=Task)
+def count_deleted_task(sender, instance, **kwargs):
+    adjust_counts({(instance.project_id, instance.status): -1})
+
+
+@receiver(post_save, sender=Project)
+def create_project_counts(sender, instance, created, raw=False, **kwargs):
+    # Fixtures trazem seus próprios contadores (ou use rebuild_task_counts)
+    if created and not raw:
+        create_counts(instance)
+
+
+@receiver(post_save, sender=Project)
+@receiver(post_delete, sender=Project)
+def project_changed(sender, instance, **kwargs):
+    invalidate_projects([instance.pk])
+
+
+@receiver(post_save, sender=User)
+def user_changed(sender, instance, created, update_fields=None, raw=False, **kwargs):
+    # Nome e email aparecem como criador e responsável nos painéis em cache dos outros
+    # membros; saves só do last_login (a cada login) não mudam nada disso
+    if created or raw or (update_fields is not None and not {'username', 'email'} & set(update_fields)):
+        return
+    invalidate_projects(
+        Project.all_objects.filter(Q(members=instance) | Q(created_by=instance)).values_list('id', flat=True)
+    )
+
+
+@receiver(m2m_changed, sender=Project.members.through)
+def project_members_changed(sender, instance, action, reverse, pk_set, **kwargs):
+    # Antes do clear os membros ainda podem ser consultados
+    if action == 'pre_clear':
+        if reverse:
+            invalidate_users([instance.pk])
+        else:
+            invalidate_users(instance.members.values_list('id', flat=True))
+    elif action in ('post_add', 'post_remove'):
+        if reverse:
+            invalidate_users([instance.pk])
+        else:
+            invalidate_users(pk_set)
+
+
+@receiver(m2m_changed, sender=Project.members.through)
+def touch_projects_on_members_change(sender, instance, action, reverse, pk_set, **kwargs):
+    # Mudanças de membros também contam como alteração do projeto (ETag/Last-Modified da API)
+    if not reverse and action in ('post_add', 'post_remove', 'post_clear'):
+        projects = Project.objects.filter(pk=instance.pk)
+    elif reverse and action in ('post_add', 'post_remove'):
+        projects = Project.objects.filter(pk__in=pk_set)
+    elif reverse and action == 'pre_clear':
+        projects = Project.objects.filter(members=instance)
+    else:
+        return
+    projects.update(updated_at=timezone.now())
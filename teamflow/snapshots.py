@@ -0,0 +1,219 @@
+import json
+from datetime import date
+
+from django.contrib.auth import get_user_model
+from django.db import transaction
+from django.db.models import F
+from django.db.models.functions import Lower
+
+from .counters import adjust_counts, count_new_tasks
+from .dashboard import invalidate_projects, invalidate_users
+from .models import Project, Task, TaskPriority, TaskStatus
+
+FORMATS = ['ndjson', 'json']
+CHUNK_SIZE = 2000
+TASK_FIELDS = ['title', 'description', 'status', 'priority', 'due_date']
+# Campos obrigatórios (texto) de cada tipo de registro na importação
+RECORD_FIELDS = {
+    'project': ['name', 'description', 'start_date', 'due_date', 'created_by'],
+    'member': ['email'],
+    'task': TASK_FIELDS + ['assigned_to'],
+}
+DATE_FIELDS = {'project': ['start_date', 'due_date'], 'member': [], 'task': ['due_date']}
+
+
+def dumps(value):
+    return json.dumps(value, default=lambda v: v.isoformat() if isinstance(v, date) else str(v))
+
+
+def project_record(project):
+    return {
+        'name': project.name,
+        'description': project.description,
+        'start_date': project.start_date,
+        'due_date': project.due_date,
+        'created_by': project.created_by.email,
+    }
+
+
+def member_records(project):
+    members = project.members.order_by('id').values('email', 'username')
+    return members.iterator(chunk_size=CHUNK_SIZE)
+
+
+def task_records(project):
+    tasks = Task.objects.filter(project=project).order_by('id').values(
+        *TASK_FIELDS, assigned_to_email=F('assigned_to__email')
+    )
+    for task in tasks.iterator(chunk_size=CHUNK_SIZE):
+        task['assigned_to'] = task.pop('assigned_to_email')
+        # Os arquivos guardam os nomes, não os códigos inteiros
+        task['status'] = TaskStatus(task['status']).label
+        task['priority'] = TaskPriority(task['priority']).label
+        yield task
+
+
+def export_project(project, file_format='ndjson'):
+    """Yield a project snapshot as text chunks, one record at a time.
+
+    ``ndjson`` writes one ``{"type": ..., ...}`` object per line; ``json``
+    writes a single ``{"project": ..., "members": [...], "tasks": [...]}``
+    document. Members and tasks are read with chunked ``.iterator()``.
+    """
+    if file_format == 'ndjson':
+        yield dumps({'type': 'project', **project_record(project)}) + '\n'
+        for member in member_records(project):
+            yield dumps({'type': 'member', **member}) + '\n'
+        for task in task_records(project):
+            yield dumps({'type': 'task', **task}) + '\n'
+    elif file_format == 'json':
+        yield '{"project": ' + dumps(project_record(project))
+        for name, records in (('members', member_records(project)), ('tasks', task_records(project))):
+            yield f', "{name}": ['
+            for number, record in enumerate(records):
+                yield (', ' if number else '') + dumps(record)
+            yield ']'
+        yield '}\n'
+    else:
+        raise ValueError(f"Unknown format: {file_format}")
+
+
+def read_snapshot(lines, file_format='ndjson'):
+    """Yield ``(type, record)`` pairs from an NDJSON snapshot, one line at a time.
+
+    Only ``ndjson`` is read back: a ``json`` document would have to be
+    parsed whole. Every record is checked for its fields, and dates are
+    parsed, so a bad line raises ``ValueError`` with its number before
+    anything is written for it.
+    """
+    if file_format != 'ndjson':
+        raise ValueError(f"Only ndjson snapshots can be imported, not {file_format}.")
+    for number, line in enumerate(lines, start=1):
+        if not line.strip():
+            continue
+        try:
+            record = json.loads(line)
+        except ValueError as e:
+            raise ValueError(f"Line {number}: invalid JSON ({e})")
+        if not isinstance(record, dict):
+            raise ValueError(f"Line {number}: expected an object")
+        record_type = record.pop('type', None)
+        if record_type not in RECORD_FIELDS:
+            raise ValueError(f"Line {number}: unknown record type {record_type!r}")
+        for field in RECORD_FIELDS[record_type]:
+            if not isinstance(record.get(field), str):
+                raise ValueError(f"Line {number}: missing or invalid {field}")
+        for field in DATE_FIELDS[record_type]:
+            try:
+                record[field] = date.fromisoformat(record[field])
+            except ValueError:
+                raise ValueError(f"Line {number}: invalid date in {field}")
+        yield record_type, record
+
+
+def import_snapshot(lines, file_format='ndjson', owner=None, batch_size=CHUNK_SIZE):
+    """Restore an NDJSON snapshot as a new project and return it with a report.
+
+    Members and assignees are matched to existing users by email; tasks of
+    users that don't exist, or with an unknown status or priority, are
+    skipped. The project is created by ``owner``
+    or, when not given, by the user with the snapshot's creator email.
+    Memberships and tasks are written with ``bulk_create`` in batches.
+    """
+    User = get_user_model()
+    records = read_snapshot(lines, file_format)
+
+    record_type, metadata = next(records, (None, None))
+    if record_type != 'project':
+        raise ValueError("Snapshot must start with the project record.")
+
+    if owner is None:
+        owner = User.objects.with_email(metadata['created_by']).first()
+        if owner is None:
+            raise ValueError(f"Creator {metadata['created_by']} does not exist.")
+
+    report = {'members': 0, 'tasks': 0, 'missing_users': 0, 'skipped_tasks': 0}
+    user_ids = {}
+
+    def resolve(emails):
+        missing = {email.lower() for email in emails} - user_ids.keys()
+        if missing:
+            found = User.objects.alias(email_lower=Lower('email')).filter(
+                email_lower__in=missing
+            ).values_list('email', 'id')
+            user_ids.update({email.lower(): user_id for email, user_id in found})
+            user_ids.update({email: None for email in missing - user_ids.keys()})
+
+    with transaction.atomic():
+        project = Project.objects.create(
+            name=metadata['name'],
+            description=metadata['description'],
+            start_date=metadata['start_date'],
+            due_date=metadata['due_date'],
+            created_by=owner,
+        )
+        member_ids = {owner.id}
+        Membership = Project.members.through
+        Membership.objects.create(project=project, user=owner)
+
+        members, tasks = [], []
+
+        def flush_members():
+            resolve(member['email'] for member in members)
+            new_rows = []
+            for member in members:
+                user_id = user_ids[member['email'].lower()]
+                if user_id is None:
+                    report['missing_users'] += 1
+                elif user_id not in member_ids:
+                    member_ids.add(user_id)
+                    new_rows.append(Membership(project=project, user_id=user_id))
+            Membership.objects.bulk_create(new_rows)
+            report['members'] += len(new_rows)
+            members.clear()
+
+        def flush_tasks():
+            resolve(task['assigned_to'] for task in tasks)
+            new_rows = []
+            for task in tasks:
+                user_id = user_ids[task['assigned_to'].lower()]
+                status = TaskStatus.from_label(task['status'])
+                priority = TaskPriority.from_label(task['priority'])
+                if user_id is None or status is None or priority is None:
+                    report['skipped_tasks'] += 1
+                    continue
+                new_rows.append(Task(
+                    title=task['title'],
+                    description=task['description'],
+                    status=status,
+                    priority=priority,
+                    due_date=task['due_date'],
+                    assigned_to_id=user_id,
+                    project=project,
+                ))
+            Task.objects.bulk_create(new_rows)
+            adjust_counts(count_new_tasks(new_rows))
+            report['tasks'] += len(new_rows)
+            tasks.clear()
+
+        for record_type, record in records:
+            if record_type == 'member':
+                members.append(record)
+                if len(members) >= batch_size:
+                    flush_members()
+            elif record_type == 'task':
+                if members:
+                    flush_members()
+                tasks.append(record)
+                if len(tasks) >= batch_size:
+                    flush_tasks()
+        if members:
+            flush_members()
+        if tasks:
+            flush_tasks()
+
+    # bulk_create não dispara os sinais do cache da página inicial (os contadores
+    # de tarefas já foram ajustados a cada lote)
+    invalidate_users(member_ids)
+    invalidate_projects([project.id])
+    return project, report
@@ -16,6 +16,7 @@ async function fetchProjects() {
                     <p><strong>Description:</strong> ${project.description}</p>
                     <p><strong>Start Date:</strong> ${project.start_date}</p>
                     <p><strong>Due Date:</strong> ${project.due_date}</p>
+                    <p><strong>Tasks:</strong> ${project.task_counts['Not Started']} not started / ${project.task_counts['In Progress']} in progress / ${project.task_counts['Concluded']} done</p>
                 </div>
                 <hr>
             `;
@@ -19,14 +19,19 @@ document.addEventListener('DOMContentLoaded', function() {
         assignTaskForm.style.display = 'none';
     });
 
-    // Fetch users from API
-    fetch('/api/users/')
-        .then(response => response.json())
-        .then(data => {
-            window.users = data;
-            updateDropdown(data);
-        })
-        .catch(error => console.error('Error fetching users:', error));
+    // Search users on the server, leaving out the current members
+    let searchTimeout = null;
+
+    function searchUsers(query) {
+        if (!query) {
+            updateDropdown([]);
+            return;
+        }
+        fetch(`/api/users/search/?q=${encodeURIComponent(query)}&project=${project.id}`)
+            .then(response => response.json())
+            .then(data => updateDropdown(data))
+            .catch(error => console.error('Error searching users:', error));
+    }
 
     function updateDropdown(users) {
         memberSelect.innerHTML = '';
@@ -39,43 +44,49 @@ document.addEventListener('DOMContentLoaded', function() {
     }
 
     memberSearchInput.addEventListener('input', function() {
-        const query = memberSearchInput.value.toLowerCase();
-        const filteredUsers = window.users.filter(user => 
-            user.username.toLowerCase().includes(query)
-        );
-        updateDropdown(filteredUsers);
+        const query = memberSearchInput.value.trim();
+        clearTimeout(searchTimeout);
+        searchTimeout = setTimeout(() => searchUsers(query), 250);
     });
 
-    // Handle adding selected members
+    // Handle adding selected members, all of them in a single request
     document.getElementById('add-selected-members').addEventListener('click', function() {
-        const selectedOptions = memberSelect.selectedOptions;
-        const projectId = project.id;
+        const emails = Array.from(memberSelect.selectedOptions).map(option => option.value);
+        if (emails.length === 0) {
+            return;
+        }
 
-        Array.from(selectedOptions).forEach(option => {
-            const email = option.value;
-            
-            const form = document.createElement('form');
-            form.method = 'POST';
-            form.action = `/projects/${projectId}/members/add/${email}/`; // Ensure this is the correct endpoint
-            
-            const csrfInput = document.createElement('input');
-            csrfInput.type = 'hidden';
-            csrfInput.name = 'csrfmiddlewaretoken';
-            csrfInput.value = getCookie('csrftoken'); 
-            form.appendChild(csrfInput);
-            
-            // Adding the user email as data (if necessary for the backend)
-            const emailInput = document.createElement('input');
-            emailInput.type = 'hidden';
-            emailInput.name = 'email'; // Ensure backend expects 'email'
-            emailInput.value = email;
-            form.appendChild(emailInput);
-            
-            document.body.appendChild(form);
-            form.submit();
-        });
+        fetch(`/api/project/${project.id}/users/add/`, {
+            method: 'POST',
+            headers: {
+                'Content-Type': 'application/json',
+                'X-CSRFToken': getCookie('csrftoken'),
+            },
+            body: JSON.stringify({ emails: emails }),
+        })
+            .then(response => response.json())
+            // Lotes grandes viram um job em segundo plano: espera ele terminar
+            .then(data => data.job ? waitForJob(data.url) : data)
+            .then(data => {
+                (data.results || [])
+                    .filter(result => result.status !== 'added')
+                    .forEach(result => console.warn(`${result.email}: ${result.status}`));
+                window.location.reload();
+            })
+            .catch(error => console.error('Error adding members:', error));
     });
 
+    function waitForJob(url) {
+        return fetch(url)
+            .then(response => response.json())
+            .then(job => {
+                if (job.state === 'succeeded' || job.state === 'failed') {
+                    return job.result || {};
+                }
+                return new Promise(resolve => setTimeout(resolve, 1000)).then(() => waitForJob(url));
+            });
+    }
+
     function getCookie(name) {
         let cookieValue = null;
         if (document.cookie && document.cookie !== '') {
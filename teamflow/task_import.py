@@ -0,0 +1,184 @@
+import csv
+import json
+from datetime import datetime
+
+from django.db import transaction
+
+from .counters import adjust_counts, count_new_tasks
+from .dashboard import invalidate_projects
+from .models import Task, TaskPriority, TaskStatus
+
+REQUIRED_FIELDS = ['title', 'description', 'priority', 'due_date', 'assigned_to']
+FORMATS = ['csv', 'jsonl']
+
+
+class ImportReport:
+    """Result of a task import: created rows and row-level errors.
+
+    Only the first ``max_errors`` errors are kept so memory stays bounded
+    on large files; ``error_count`` always has the full total.
+    """
+
+    def __init__(self, max_errors=1000):
+        self.created = 0
+        self.error_count = 0
+        self.errors = []
+        self.max_errors = max_errors
+        # Erro que interrompeu a leitura do arquivo (UTF-8 ou CSV inválido)
+        self.failure = None
+
+    def add_error(self, row, message):
+        self.error_count += 1
+        if len(self.errors) < self.max_errors:
+            self.errors.append({'row': row, 'error': message})
+
+    def as_dict(self):
+        return {
+            'created': self.created,
+            'error_count': self.error_count,
+            'errors': self.errors,
+        }
+
+
+def format_from_name(name):
+    """Guess the import format from a file name, or None."""
+    name = name.lower()
+    if name.endswith('.csv'):
+        return 'csv'
+    if name.endswith(('.jsonl', '.ndjson')):
+        return 'jsonl'
+    return None
+
+
+def decode_lines(stream):
+    """Decode the lines of a binary file as UTF-8, with or without a BOM.
+
+    Raises ``ValueError`` with the line number on invalid bytes, instead of
+    the ``UnicodeDecodeError`` of a ``TextIOWrapper`` somewhere in the file.
+    """
+    for number, line in enumerate(stream, start=1):
+        try:
+            yield line.decode('utf-8-sig' if number == 1 else 'utf-8')
+        except UnicodeDecodeError as e:
+            raise ValueError(f"Line {number}: invalid UTF-8 ({e.reason})")
+
+
+def read_rows(lines, file_format):
+    """Yield ``(row_number, dict_or_error)`` from an iterable of text lines.
+
+    A file that can't be read on (bad CSV quoting, invalid UTF-8) raises
+    ``ValueError`` with the line number.
+    """
+    if file_format == 'csv':
+        reader = csv.DictReader(lines)
+        while True:
+            try:
+                row = next(reader)
+            except StopIteration:
+                return
+            except csv.Error as e:
+                # O line_num do DictReader só avança depois de uma linha lida
+                raise ValueError(f"Line {reader.reader.line_num}: {e}")
+            yield reader.line_num, row
+    elif file_format == 'jsonl':
+        for number, line in enumerate(lines, start=1):
+            if not line.strip():
+                continue
+            try:
+                row = json.loads(line)
+            except ValueError as e:
+                yield number, f"Invalid JSON: {e}"
+                continue
+            if not isinstance(row, dict):
+                yield number, "Invalid JSON: expected an object"
+                continue
+            yield number, row
+    else:
+        raise ValueError(f"Unknown format: {file_format}")
+
+
+def build_task(row, project, member_ids):
+    """Validate one row and return an unsaved Task, or an error message."""
+    values = {field: str(row.get(field) or '').strip() for field in REQUIRED_FIELDS + ['status']}
+
+    missing = [field for field in REQUIRED_FIELDS if not values[field]]
+    if missing:
+        return f"Missing field: {', '.join(missing)}"
+
+    try:
+        due_date = datetime.strptime(values['due_date'], "%Y-%m-%d").date()
+    except ValueError:
+        return "Invalid date format."
+
+    if due_date < project.start_date or due_date > project.due_date:
+        return "Due date out of range"
+
+    priority = TaskPriority.from_label(values['priority'])
+    if priority is None:
+        return f"Invalid priority: {values['priority']}"
+
+    status = TaskStatus.from_label(values['status']) if values['status'] else TaskStatus.NOT_STARTED
+    if status is None:
+        return f"Invalid status: {values['status']}"
+
+    user_id = member_ids.get(values['assigned_to'].lower())
+    if user_id is None:
+        return "User is not in the project"
+
+    return Task(
+        title=values['title'],
+        description=values['description'],
+        status=status,
+        priority=priority,
+        due_date=due_date,
+        assigned_to_id=user_id,
+        project=project,
+    )
+
+
+def import_tasks(project, lines, file_format, batch_size=1000, max_errors=1000):
+    """Stream tasks from ``lines`` into ``project``.
+
+    Rows are validated against the project members (loaded once) and date
+    range, and valid rows are inserted with ``bulk_create`` every
+    ``batch_size`` rows, so memory does not grow with the file size.
+    Invalid rows are skipped and reported. If the file can't be read past
+    some line, the rows before it are still imported and the error is in
+    ``report.failure``.
+    """
+    member_ids = {
+        email.lower(): user_id
+        for email, user_id in project.members.values_list('email', 'id')
+    }
+    report = ImportReport(max_errors=max_errors)
+    batch = []
+
+    def flush():
+        with transaction.atomic():
+            Task.objects.bulk_create(batch)
+            # bulk_create não dispara post_save: os contadores mudam na mesma transação
+            adjust_counts(count_new_tasks(batch))
+        report.created += len(batch)
+        batch.clear()
+
+    try:
+        for number, row in read_rows(lines, file_format):
+            # Linhas inválidas chegam como mensagem de erro
+            task = row if isinstance(row, str) else build_task(row, project, member_ids)
+            if isinstance(task, str):
+                report.add_error(number, task)
+                continue
+            batch.append(task)
+            if len(batch) >= batch_size:
+                flush()
+    except ValueError as e:
+        report.failure = str(e)
+
+    if batch:
+        flush()
+
+    # bulk_create não dispara post_save
+    if report.created:
+        invalidate_projects([project.id])
+
+    return report
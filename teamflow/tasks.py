@@ -0,0 +1,65 @@
+import time
+
+from celery import shared_task
+from django.conf import settings
+from django.db import transaction
+
+from .jobs import running, set_progress
+from .memberships import add_members
+from .models import Project, Task
+
+MEMBERS_CHUNK_SIZE = 200
+
+
+def delete_in_batches(queryset, batch_size, pause, on_batch):
+    """Delete the rows of ``queryset`` ``batch_size`` at a time, each batch in
+    its own short transaction, calling ``on_batch(count)`` after each one."""
+    while True:
+        with transaction.atomic():
+            ids = list(queryset.order_by('pk').values_list('pk', flat=True)[:batch_size])
+            if ids:
+                # DELETE direto, sem o Collector carregar as linhas nem disparar sinais
+                queryset.model.objects.filter(pk__in=ids)._raw_delete(queryset.db)
+        if not ids:
+            return
+        on_batch(len(ids))
+        if len(ids) == batch_size and pause:
+            time.sleep(pause)
+
+
+@shared_task
+def delete_project(job_id, project_id):
+    """Remove a hidden project: its tasks and memberships in bounded batches,
+    then the project row itself."""
+    with running(job_id) as job:
+        project = Project.all_objects.filter(pk=project_id, hidden=True).first()
+        if project is None:
+            job.result = {'deleted': False}
+            return
+
+        tasks = Task.objects.filter(project_id=project_id)
+        memberships = Project.members.through.objects.filter(project_id=project_id)
+        set_progress(job, 0, total=tasks.count() + memberships.count())
+
+        def on_batch(count):
+            set_progress(job, job.done + count)
+
+        for queryset in (tasks, memberships):
+            delete_in_batches(
+                queryset, settings.PROJECT_DELETE_BATCH_SIZE, settings.PROJECT_DELETE_PAUSE, on_batch
+            )
+
+        # Sem tarefas nem membros o Collector só apaga a linha do projeto (e avisa o cache)
+        project.delete()
+        job.result = {'deleted': True}
+
+
+@shared_task
+def add_project_members(job_id, project_id, emails):
+    with running(job_id) as job:
+        project = Project.objects.get(pk=project_id)
+        results = []
+        for start in range(0, len(emails), MEMBERS_CHUNK_SIZE):
+            results += add_members(project, emails[start:start + MEMBERS_CHUNK_SIZE])
+            set_progress(job, min(start + MEMBERS_CHUNK_SIZE, len(emails)))
+        job.result = {'results': results}
@@ -0,0 +1,154 @@
+from datetime import timedelta
+
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+from teamflow.models import Project, Task, TaskPriority, TaskStatus
+from teamflow.pagination import EstimatedCountPaginator
+from teamflow.tests.TestQueryBudgets import OTHER_QUERY_BUDGETS
+
+PROJECT_CHANGELIST = reverse('admin:teamflow_project_changelist')
+TASK_CHANGELIST = reverse('admin:teamflow_task_changelist')
+AUTOCOMPLETE = reverse('admin:autocomplete')
+
+
+class AdminDataMixin:
+    def add_projects(self, count, members=3):
+        today = timezone.now().date()
+        for _ in range(count):
+            users = [
+                get_user_model().objects.create(username=f'User {self.users + i}',
+                                                email=f'user{self.users + i}@example.com')
+                for i in range(members)
+            ]
+            self.users += members
+            project = Project.objects.create(
+                name="Project", description="Description", start_date=today,
+                due_date=today + timedelta(days=2), created_by=users[0],
+            )
+            project.members.add(*users)
+            for user in users:
+                Task.objects.create(
+                    title="Task", description="Description", status=TaskStatus.NOT_STARTED,
+                    priority=TaskPriority.LOW, due_date=project.due_date, assigned_to=user, project=project,
+                )
+
+
+class TestAdminChangelists(AdminDataMixin, TestCase):
+    """The admin changelists load the page with a fixed number of queries"""
+
+    def setUp(self):
+        self.admin = get_user_model().objects.create_superuser(
+            username='Admin', email='admin@example.com', password='testpass123'
+        )
+        self.client.force_login(self.admin)
+        self.users = 0
+
+    def assertConstantQueries(self, url):
+        self.add_projects(2)
+        with self.assertNumQueries(OTHER_QUERY_BUDGETS['admin_changelist']):
+            self.assertEqual(self.client.get(url).status_code, 200)
+
+        self.add_projects(10)
+        with self.assertNumQueries(OTHER_QUERY_BUDGETS['admin_changelist']):
+            return self.client.get(url)
+
+    def test_project_changelist(self):
+        response = self.assertConstantQueries(PROJECT_CHANGELIST)
+        self.assertContains(response, '<td class="field-member_count">3</td>', count=12, html=True)
+
+    def test_project_changelist_sorted_by_member_count(self):
+        self.add_projects(1, members=5)
+        response = self.assertConstantQueries(PROJECT_CHANGELIST + '?o=5')
+        self.assertEqual(response.context['cl'].result_list[0].member_count, 3)
+
+    def test_hidden_projects_listed(self):
+        self.add_projects(2)
+        project = Project.objects.first()
+        project.hidden = True
+        project.save(update_fields=['hidden'])
+
+        response = self.client.get(PROJECT_CHANGELIST, {'hidden__exact': '1'})
+        self.assertEqual([p.id for p in response.context['cl'].result_list], [project.id])
+        response = self.client.get(reverse('admin:teamflow_project_change', args=[project.id]))
+        self.assertEqual(response.status_code, 200)
+
+    def test_task_changelist(self):
+        response = self.assertConstantQueries(TASK_CHANGELIST)
+        self.assertContains(response, 'user35@example.com')
+
+    def test_project_form_uses_autocomplete(self):
+        self.add_projects(5)
+        project = Project.objects.first()
+        response = self.client.get(reverse('admin:teamflow_project_change', args=[project.id]))
+
+        self.assertContains(response, 'admin-autocomplete')
+        # Só os membros atuais vão para o formulário, não todos os usuários
+        self.assertNotContains(response, 'user14@example.com')
+
+    def test_member_autocomplete_searches_prefix(self):
+        self.add_projects(5)
+        response = self.client.get(AUTOCOMPLETE, {
+            'term': 'user1',
+            'app_label': 'teamflow',
+            'model_name': 'project',
+            'field_name': 'members',
+        })
+
+        self.assertEqual(response.status_code, 200)
+        emails = {result['text'] for result in response.json()['results']}
+        self.assertEqual(emails, {'user1@example.com'} | {f'user{i}@example.com' for i in range(10, 15)})
+
+
+@override_settings(ESTIMATED_COUNT_THRESHOLD=10)
+class TestEstimatedCountPaginator(AdminDataMixin, TestCase):
+    def setUp(self):
+        self.users = 0
+        self.add_projects(5)
+
+    def count(self, queryset):
+        with CaptureQueriesContext(connection) as queries:
+            count = EstimatedCountPaginator(queryset, 100).count
+        return count, ' '.join(query['sql'] for query in queries)
+
+    def test_tasks_counted_from_counters(self):
+        count, sql = self.count(Task.objects.order_by('id'))
+        self.assertEqual(count, 15)
+        self.assertNotIn('FROM "teamflow_task"', sql)
+
+    def test_filtered_list_counted_exactly(self):
+        user = get_user_model().objects.get(email='user0@example.com')
+        count, sql = self.count(Task.objects.filter(assigned_to=user).order_by('id'))
+        self.assertEqual(count, 1)
+        self.assertIn('FROM "teamflow_task"', sql)
+
+    def test_users_estimated_from_statistics(self):
+        with connection.cursor() as cursor:
+            cursor.execute('ANALYZE')
+        get_user_model().objects.create(username='New', email='new@example.com')
+
+        # A estimativa é a do último ANALYZE
+        count, sql = self.count(get_user_model().objects.order_by('id'))
+        self.assertEqual(count, 15)
+        self.assertNotIn('FROM "teamflow_user"', sql)
+
+    def test_all_projects_estimated(self):
+        with connection.cursor() as cursor:
+            cursor.execute('ANALYZE')
+        with override_settings(ESTIMATED_COUNT_THRESHOLD=5):
+            count, sql = self.count(Project.all_objects.order_by('id'))
+        self.assertEqual(count, 5)
+        self.assertNotIn('FROM "teamflow_project"', sql)
+
+    def test_without_statistics_counts_exactly(self):
+        count, _ = self.count(get_user_model().objects.order_by('id'))
+        self.assertEqual(count, 15)
+
+    def test_small_lists_counted_exactly(self):
+        with override_settings(ESTIMATED_COUNT_THRESHOLD=100):
+            count, sql = self.count(Task.objects.order_by('id'))
+        self.assertEqual(count, 15)
+        self.assertIn('FROM "teamflow_task"', sql)
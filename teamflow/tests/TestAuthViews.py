@@ -111,6 +111,22 @@ class TestRegisterView(TestCase):
 
         self.assertTrue(get_user_model().objects.filter(email=user.email).exists())
 
+    def test_email_exists_different_case_error(self):
+        create_user()
+
+        payload = {
+            'username': 'Test Username',
+            'email': 'Test@Email.com',
+            'password': 'Testpass123',
+            'confirm_password': 'Testpass123'
+        }
+
+        response = self.client.post(REGISTER_URL, payload)
+
+        self.assertRedirects(response, REGISTER_URL)
+        self.assertTrue(check_message(response, "Email already registered."))
+        self.assertEqual(get_user_model().objects.count(), 1)
+
     def test_authenticated_user_redirected(self):
         user = create_user()
 
@@ -157,6 +173,35 @@ class TestLoginView(TestCase):
         self.assertEqual(response.status_code, 302)
         self.assertRedirects(response, HOME_URL)
 
+    def test_login_email_case_insensitive(self):
+        create_user()
+
+        payload = {
+            'email': 'TEST@Email.com',
+            'password': 'testpass123'
+        }
+
+        response = self.client.post(LOGIN_URL, payload)
+
+        self.assertEqual(response.status_code, 302)
+        self.assertRedirects(response, HOME_URL)
+
+    def test_login_case_variant_duplicates(self):
+        # Contas de antes do índice LOWER(email) podem diferir só nas maiúsculas
+        for email in ('A@x.com', 'a@x.com'):
+            user = get_user_model().objects.create(username=email, email=email)
+            user.set_password('testpass123')
+            user.save()
+
+        response = self.client.post(LOGIN_URL, {'email': 'a@x.com', 'password': 'testpass123'})
+        self.assertRedirects(response, HOME_URL)
+        self.assertEqual(int(self.client.session['_auth_user_id']), user.id)
+
+        self.client.logout()
+        response = self.client.post(LOGIN_URL, {'email': 'A@X.COM', 'password': 'testpass123'})
+        self.assertRedirects(response, LOGIN_URL)
+        self.assertTrue(check_message(response, "Invalid username and/or password."))
+
     def test_login_wrong_email_error(self):
         user = create_user()
 
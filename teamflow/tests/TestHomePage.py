@@ -0,0 +1,292 @@
+from asgiref.sync import async_to_sync
+from django.test import AsyncRequestFactory, TestCase
+from django.core.cache import cache
+from django.db import transaction
+from django.urls import reverse
+from django.contrib.auth import get_user_model
+from teamflow.models import Project, Task, TaskPriority, TaskStatus
+from teamflow.dashboard import cache_stats, get_cached_project_tasks
+from teamflow.views import AsyncHomePage
+from teamflow.tests.TestQueryBudgets import OTHER_QUERY_BUDGETS, QUERY_BUDGETS
+from datetime import timedelta
+from django.utils import timezone
+
+
+def create_user(username=None, email='test@email.com'):
+    """Create user for testing authenticated features"""
+    if username is None:
+        username = 'TestUsername'
+    else:
+        username=username
+
+    password = 'testpass123'
+    
+    new_user = get_user_model().objects.create(
+        username=username,
+        email=email
+    )
+    new_user.set_password(password)
+    new_user.save()
+
+    return new_user
+
+def create_project(user):
+    today = timezone.now().date()
+    after_tomorrow = today + timedelta(days=2)
+
+    new_project = Project.objects.create(
+        name="Test Project",
+        description="Test Project Description",
+        start_date=today,
+        due_date=after_tomorrow,
+        created_by=user
+    )
+
+    return new_project
+
+def create_task(user, project, title="Task"):
+    new_task = Task.objects.create(
+        title=title,
+        description="Task Description",
+        status=TaskStatus.NOT_STARTED,
+        priority=TaskPriority.LOW,
+        due_date=timezone.now().date() + timedelta(days=2),
+        assigned_to=user,
+        project=project
+    )
+
+    return new_task
+
+
+HOME_URL = reverse('home')
+
+# Sessão, usuário, projetos e tarefas
+
+
+class TestHomePage(TestCase):
+    """Tests for the home page dashboard"""
+
+    def setUp(self):
+        cache.clear()
+        self.user = create_user()
+        self.other = create_user(username='Other', email='other@example.com')
+        self.client.force_login(self.user)
+
+    def add_projects(self, count):
+        for _ in range(count):
+            own = create_project(self.user)
+            own.members.add(self.user, self.other)
+            create_task(self.user, own)
+            create_task(self.other, own)
+
+            joined = create_project(self.other)
+            joined.members.add(self.user, self.other)
+            create_task(self.user, joined)
+            create_task(self.other, joined)
+
+    def test_creator_sees_all_member_sees_own(self):
+        own = create_project(self.user)
+        own.members.add(self.user, self.other)
+        own_task = create_task(self.user, own, title="Mine")
+        other_task = create_task(self.other, own, title="Theirs")
+
+        joined = create_project(self.other)
+        joined.members.add(self.user, self.other)
+        assigned = create_task(self.user, joined, title="Assigned")
+        hidden = create_task(self.other, joined, title="Hidden")
+
+        not_member = create_project(self.other)
+        not_member.members.add(self.other)
+        create_task(self.other, not_member)
+
+        response = self.client.get(HOME_URL)
+        self.assertEqual(response.status_code, 200)
+
+        project_tasks = response.context['project_tasks']
+        self.assertEqual(set(project_tasks), {own, joined})
+        self.assertEqual(project_tasks[own], [own_task, other_task])
+        self.assertEqual(project_tasks[joined], [assigned])
+        self.assertNotIn(hidden, project_tasks[joined])
+
+    def test_project_without_tasks_listed(self):
+        project = create_project(self.user)
+        project.members.add(self.user)
+
+        response = self.client.get(HOME_URL)
+        self.assertEqual(response.context['project_tasks'], {project: []})
+        self.assertContains(response, "No tasks for this project.")
+
+    def test_query_count_constant(self):
+        self.add_projects(2)
+        with self.assertNumQueries(QUERY_BUDGETS['home']):
+            self.client.get(HOME_URL)
+
+        self.add_projects(20)
+        with self.assertNumQueries(QUERY_BUDGETS['home']):
+            response = self.client.get(HOME_URL)
+        self.assertEqual(len(response.context['project_tasks']), 44)
+
+
+class TestHomePageCache(TestCase):
+    """Tests for the per-user dashboard cache"""
+
+    def setUp(self):
+        cache.clear()
+        self.user = create_user()
+        self.other = create_user(username='Other', email='other@example.com')
+        self.client.force_login(self.user)
+
+        self.project = create_project(self.user)
+        self.project.members.add(self.user, self.other)
+        self.task = create_task(self.other, self.project)
+
+    def get_home(self):
+        return self.client.get(HOME_URL).context['project_tasks']
+
+    def test_hit_uses_only_session_queries(self):
+        self.get_home()
+
+        with self.assertNumQueries(OTHER_QUERY_BUDGETS['home_cached']):
+            project_tasks = self.get_home()
+
+        self.assertEqual(project_tasks[self.project], [self.task])
+        self.assertEqual(cache_stats(), {'hits': 1, 'misses': 1})
+
+    def test_task_changes_invalidate(self):
+        self.get_home()
+
+        new_task = create_task(self.user, self.project)
+        self.assertEqual(self.get_home()[self.project], [self.task, new_task])
+
+        self.task.status = TaskStatus.CONCLUDED
+        self.task.save()
+        self.assertEqual(self.get_home()[self.project][0].status, TaskStatus.CONCLUDED)
+
+        new_task.delete()
+        self.assertEqual(self.get_home()[self.project], [self.task])
+        self.assertEqual(cache_stats(), {'hits': 0, 'misses': 4})
+
+    def test_task_moved_invalidates_both_projects(self):
+        other_project = create_project(self.user)
+        other_project.members.add(self.user, self.other)
+        self.get_home()
+
+        task = Task.objects.get(pk=self.task.pk)
+        task.project = other_project
+        task.save()
+
+        project_tasks = self.get_home()
+        self.assertEqual(project_tasks[self.project], [])
+        self.assertEqual(project_tasks[other_project], [self.task])
+
+    def test_user_rename_invalidates(self):
+        self.get_home()
+
+        self.other.username = 'Renamed'
+        self.other.save()
+        self.assertEqual(self.get_home()[self.project][0].assigned_to.username, 'Renamed')
+
+        # Um login só grava o last_login
+        self.other.last_login = timezone.now()
+        self.other.save(update_fields=['last_login'])
+        self.get_home()
+        self.assertEqual(cache_stats(), {'hits': 1, 'misses': 2})
+
+    def test_entry_filled_before_commit_invalidated(self):
+        self.get_home()
+
+        with self.captureOnCommitCallbacks(execute=True):
+            with transaction.atomic():
+                self.task.status = TaskStatus.CONCLUDED
+                self.task.save()
+                # Outra requisição enche o cache antes do commit: com o token novo,
+                # mas (fora deste teste) com as linhas antigas
+                get_cached_project_tasks(self.user)
+                self.assertEqual(cache_stats(), {'hits': 0, 'misses': 2})
+
+        # O token trocado de novo no commit descarta essa entrada
+        self.get_home()
+        self.assertEqual(cache_stats(), {'hits': 0, 'misses': 3})
+
+    def test_project_changes_invalidate(self):
+        self.get_home()
+
+        self.project.name = 'Renamed'
+        self.project.save()
+        self.assertEqual(list(self.get_home())[0].name, 'Renamed')
+
+        self.project.delete()
+        self.assertEqual(self.get_home(), {})
+
+    def test_membership_changes_invalidate(self):
+        self.get_home()
+
+        joined = create_project(self.other)
+        joined.members.add(self.user)
+        self.assertIn(joined, self.get_home())
+
+        self.user.joined_projects.remove(joined)
+        self.assertNotIn(joined, self.get_home())
+
+        self.project.members.clear()
+        self.assertEqual(self.get_home(), {})
+
+    def test_other_users_not_invalidated(self):
+        self.get_home()
+
+        unrelated = create_project(self.other)
+        unrelated.members.add(self.other)
+        create_task(self.other, unrelated)
+
+        self.get_home()
+        self.assertEqual(cache_stats(), {'hits': 1, 'misses': 1})
+
+
+class TestAsyncHomePage(TestCase):
+    """Tests for the async home page served under ASGI"""
+
+    def setUp(self):
+        cache.clear()
+        self.user = create_user()
+        self.other = create_user(username='Other', email='other@example.com')
+
+        self.project = create_project(self.user)
+        self.project.members.add(self.user, self.other)
+        create_task(self.user, self.project, title="Mine")
+        create_task(self.other, self.project, title="Theirs")
+
+        joined = create_project(self.other)
+        joined.name = "Joined"
+        joined.save()
+        joined.members.add(self.user, self.other)
+        create_task(self.other, joined, title="Hidden")
+
+    def get_home(self):
+        request = AsyncRequestFactory().get(HOME_URL)
+
+        async def auser():
+            return self.user
+
+        request.user = self.user
+        request.auser = auser
+        return async_to_sync(AsyncHomePage)(request)
+
+    def test_renders_visible_tasks(self):
+        response = self.get_home()
+        self.assertContains(response, "Mine")
+        self.assertContains(response, "Theirs")
+        self.assertContains(response, "Joined")
+        self.assertNotContains(response, "Hidden")
+
+    def test_shares_cache_with_sync_page(self):
+        self.client.force_login(self.user)
+        self.client.get(HOME_URL)
+
+        # Só a leitura do cache
+        with self.assertNumQueries(0):
+            self.get_home()
+        self.assertEqual(cache_stats(), {'hits': 1, 'misses': 1})
+
+        create_task(self.user, self.project, title="New")
+        self.assertContains(self.get_home(), "New")
+        self.assertEqual(cache_stats(), {'hits': 1, 'misses': 2})
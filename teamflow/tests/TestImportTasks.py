@@ -0,0 +1,125 @@
+import csv
+import os
+import tempfile
+from datetime import date
+from io import BytesIO, StringIO
+from django.test import TestCase
+from django.core.management import call_command
+from django.contrib.auth import get_user_model
+from teamflow.models import Project, Task, TaskStatus
+from teamflow.task_import import decode_lines, import_tasks
+
+
+def create_user(username=None, email='test@email.com'):
+    """Create user for testing authenticated features"""
+    if username is None:
+        username = 'TestUsername'
+    else:
+        username=username
+
+    new_user = get_user_model().objects.create(
+        username=username,
+        email=email
+    )
+
+    return new_user
+
+def create_project(user):
+    new_project = Project.objects.create(
+        name="Test Project",
+        description="Test Project Description",
+        start_date=date(2024, 7, 10),
+        due_date=date(2024, 8, 1),
+        created_by=user
+    )
+    new_project.members.add(user)
+
+    return new_project
+
+
+CSV_ROWS = """title,description,priority,due_date,assigned_to,status
+Task 1,Description,Low,2024-07-15,test@email.com,
+Task 2,Description,High,2024-07-20,TEST@email.com,In Progress
+Task 3,Description,Low,2024-09-01,test@email.com,
+Task 4,Description,Low,2024-07-15,outsider@example.com,
+Task 5,,Low,2024-07-15,test@email.com,
+Task 6,Description,Urgent,2024-07-15,test@email.com,
+"""
+
+
+class TestImportTasks(TestCase):
+    """Tests for the streaming task import"""
+
+    def setUp(self):
+        self.user = create_user()
+        create_user(email='outsider@example.com')
+        self.project = create_project(self.user)
+
+    def test_csv_import_reports_row_errors(self):
+        report = import_tasks(self.project, StringIO(CSV_ROWS), 'csv')
+
+        self.assertEqual(report.created, 2)
+        self.assertEqual(report.error_count, 4)
+        self.assertEqual(report.errors, [
+            {'row': 4, 'error': "Due date out of range"},
+            {'row': 5, 'error': "User is not in the project"},
+            {'row': 6, 'error': "Missing field: description"},
+            {'row': 7, 'error': "Invalid priority: Urgent"},
+        ])
+        task = Task.objects.get(title='Task 2')
+        self.assertEqual(task.status, TaskStatus.IN_PROGRESS)
+        self.assertEqual(task.assigned_to, self.user)
+        self.assertEqual(Task.objects.get(title='Task 1').status, TaskStatus.NOT_STARTED)
+
+    def test_jsonl_import_in_batches(self):
+        lines = [
+            '{"title": "Task %d", "description": "D", "priority": "Low", '
+            '"due_date": "2024-07-15", "assigned_to": "test@email.com"}\n' % i
+            for i in range(25)
+        ]
+        lines.insert(3, 'not json\n')
+
+        # Membros, mais por lote de 10 o INSERT, o contador e o updated_at do projeto
+        # (com SAVEPOINT/RELEASE do atomic)
+        with self.assertNumQueries(1 + 3 * 5):
+            report = import_tasks(self.project, iter(lines), 'jsonl', batch_size=10)
+
+        self.assertEqual(report.created, 25)
+        self.assertEqual(report.error_count, 1)
+        self.assertEqual(report.errors[0]['row'], 4)
+        self.assertEqual(Task.objects.filter(project=self.project).count(), 25)
+
+    def test_errors_capped(self):
+        lines = ['{}\n'] * 5
+        report = import_tasks(self.project, iter(lines), 'jsonl', max_errors=2)
+
+        self.assertEqual(report.error_count, 5)
+        self.assertEqual(len(report.errors), 2)
+
+    def test_unreadable_file_stops_with_line(self):
+        # Um campo acima de csv.field_size_limit() é um csv.Error
+        rows = CSV_ROWS.splitlines(keepends=True)[:3] + ['x' * (csv.field_size_limit() + 1) + '\n']
+        report = import_tasks(self.project, iter(rows), 'csv')
+
+        # As linhas antes da quebrada ficam importadas
+        self.assertEqual(report.created, 2)
+        self.assertTrue(report.failure.startswith("Line 4: "), report.failure)
+
+    def test_decode_lines(self):
+        stream = BytesIO('\ufefftitle\nTarefa ç\n'.encode() + b'\xff\n')
+        lines = decode_lines(stream)
+
+        self.assertEqual([next(lines), next(lines)], ['title\n', 'Tarefa ç\n'])
+        with self.assertRaisesMessage(ValueError, "Line 3: invalid UTF-8"):
+            next(lines)
+
+    def test_management_command(self):
+        with tempfile.NamedTemporaryFile('w', suffix='.csv', delete=False) as f:
+            f.write(CSV_ROWS)
+        self.addCleanup(os.remove, f.name)
+
+        out, err = StringIO(), StringIO()
+        call_command('import_tasks', self.project.id, f.name, stdout=out, stderr=err)
+
+        self.assertIn("Created 2 tasks, 4 rows with errors.", out.getvalue())
+        self.assertIn("Row 4: Due date out of range", err.getvalue())
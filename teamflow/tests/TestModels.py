@@ -1,6 +1,6 @@
 from django.test import TestCase
 from django.contrib.auth import get_user_model
-from teamflow.models import Project, Task
+from teamflow.models import Project, Task, TaskPriority, TaskStatus
 from datetime import datetime
 
 
@@ -38,8 +38,8 @@ def create_task(user, project):
     task = Task.objects.create(
             title = 'TestTitle',
             description = 'Test Description',
-            status = 'Done',
-            priority = 'Big',
+            status = TaskStatus.CONCLUDED,
+            priority = TaskPriority.HIGH,
             due_date = '2024-08-10',
             assigned_to = user,
             project = project
@@ -102,8 +102,8 @@ class TestModels(TestCase):
         Task.objects.create(
             title = 'TestTitle',
             description = 'Test Description',
-            status = 'Done',
-            priority = 'Big',
+            status = TaskStatus.CONCLUDED,
+            priority = TaskPriority.HIGH,
             due_date = '2024-08-10',
             assigned_to = user,
             project = project
@@ -113,4 +113,13 @@ class TestModels(TestCase):
         self.assertEqual(num_of_tasks, 1)
         
         task = Task.objects.get(title='TestTitle', project=project)
-        self.assertEqual(task.assigned_to, user)
\ No newline at end of file
+        self.assertEqual(task.assigned_to, user)
+        self.assertEqual(task.get_status_display(), 'Concluded')
+
+    def test_choice_from_label(self):
+        """Labels are matched ignoring case, spaces and underscores"""
+        self.assertEqual(TaskStatus.from_label('Not Started'), TaskStatus.NOT_STARTED)
+        self.assertEqual(TaskStatus.from_label(' not  started '), TaskStatus.NOT_STARTED)
+        self.assertEqual(TaskStatus.from_label('IN_PROGRESS'), TaskStatus.IN_PROGRESS)
+        self.assertEqual(TaskPriority.from_label('high'), TaskPriority.HIGH)
+        self.assertIsNone(TaskStatus.from_label('Done'))
@@ -0,0 +1,104 @@
+from datetime import timedelta
+
+from django.contrib.auth import get_user_model
+from django.http import HttpResponse
+from django.template import engines
+from django.test import RequestFactory, TestCase, override_settings
+from django.urls import reverse
+from django.utils import timezone
+from teamflow.models import Project, Task, TaskPriority, TaskStatus
+from teamflow.nplusone import NPlusOneError, NPlusOneMiddleware, detect_nplusone, fingerprint
+
+
+def creators(projects):
+    # Uma consulta por projeto sem select_related
+    return [project.created_by.email for project in projects]
+
+
+@override_settings(NPLUSONE_THRESHOLD=3)
+class TestNPlusOneDetector(TestCase):
+    def setUp(self):
+        today = timezone.now().date()
+        for i in range(4):
+            user = get_user_model().objects.create(username=f'User {i}', email=f'user{i}@example.com')
+            project = Project.objects.create(
+                name="Project", description="Description", start_date=today,
+                due_date=today + timedelta(days=2), created_by=user,
+            )
+            project.members.add(user)
+            Task.objects.create(
+                title="Task", description="Description", status=TaskStatus.NOT_STARTED,
+                priority=TaskPriority.LOW, due_date=project.due_date, assigned_to=user, project=project,
+            )
+        self.user = user
+        self.project = project
+
+    def test_fingerprint(self):
+        self.assertEqual(
+            fingerprint("SELECT * FROM t WHERE id = 12 AND name = 'it''s'"),
+            fingerprint("SELECT * FROM t WHERE id = 7 AND name = 'other'"),
+        )
+        self.assertEqual(
+            fingerprint('SELECT * FROM t WHERE id IN (%s, %s, %s)'),
+            fingerprint('SELECT * FROM t WHERE id IN (%s)'),
+        )
+        self.assertNotEqual(fingerprint('SELECT a FROM t'), fingerprint('SELECT b FROM t'))
+
+    def test_reports_python_call_site(self):
+        with self.assertLogs('teamflow.nplusone') as logs, self.assertRaises(NPlusOneError) as error:
+            with detect_nplusone('test', raise_errors=True):
+                creators(Project.objects.all())
+
+        report = str(error.exception)
+        self.assertIn(f'4 x teamflow/tests/TestNPlusOne.py:{creators.__code__.co_firstlineno + 2} in ', report)
+        self.assertIn('FROM "teamflow_user"', report)
+        self.assertEqual(logs.output[0].split(':', 2)[2], report)
+
+    def test_reports_template_line(self):
+        template = engines['django'].from_string(
+            '{% for project in projects %}\n'
+            '{{ project.created_by.email }}\n'
+            '{% endfor %}'
+        )
+        with self.assertLogs('teamflow.nplusone'), self.assertRaises(NPlusOneError) as error:
+            with detect_nplusone('test', raise_errors=True):
+                template.render({'projects': Project.objects.all()})
+
+        self.assertIn('4 x <unknown source>:2 (from teamflow/tests/TestNPlusOne.py:', str(error.exception))
+
+    def test_joined_queries_pass(self):
+        with detect_nplusone('test', raise_errors=True) as tracker:
+            creators(Project.objects.select_related('created_by'))
+            # Abaixo do limite
+            creators(Project.objects.all()[:2])
+        self.assertEqual(tracker.repeated(), [])
+
+    def test_log_only(self):
+        with self.assertLogs('teamflow.nplusone'):
+            with detect_nplusone('test', raise_errors=False):
+                creators(Project.objects.all())
+
+    @override_settings(NPLUSONE_DETECTION=True, NPLUSONE_RAISE=True)
+    def test_middleware_fails_request(self):
+        def view(request):
+            return HttpResponse(', '.join(creators(Project.objects.all())))
+
+        middleware = NPlusOneMiddleware(view)
+        with self.assertLogs('teamflow.nplusone'), self.assertRaises(NPlusOneError) as error:
+            middleware(RequestFactory().get('/projects/'))
+        self.assertIn('N+1 queries in GET /projects/:', str(error.exception))
+
+    @override_settings(NPLUSONE_DETECTION=True, NPLUSONE_RAISE=True)
+    def test_pages_have_no_nplusone(self):
+        for i in range(4):
+            member = get_user_model().objects.create(username=f'Member {i}', email=f'member{i}@example.com')
+            self.project.members.add(member)
+            Task.objects.create(
+                title="Task", description="Description", status=TaskStatus.IN_PROGRESS,
+                priority=TaskPriority.HIGH, due_date=self.project.due_date, assigned_to=member,
+                project=self.project,
+            )
+        self.client.force_login(self.user)
+
+        for url in (reverse('home'), reverse('single_project', args=[self.project.id])):
+            self.assertEqual(self.client.get(url).status_code, 200)
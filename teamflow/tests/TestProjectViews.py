@@ -1,8 +1,9 @@
-from django.test import TestCase
+from django.test import TestCase, override_settings
 from django.urls import reverse
 from django.contrib.auth import get_user_model
 from django.contrib.messages import get_messages
-from teamflow.models import Project
+from teamflow.models import Job, Project, Task, TaskPriority, TaskStatus
+from teamflow.tests.TestQueryBudgets import QUERY_BUDGETS
 from datetime import timedelta, date
 from django.utils import timezone
 
@@ -234,6 +235,44 @@ class TestProjectsPage(TestCase):
         self.assertTrue(check_message(response, "Project not found."))
         self.assertRedirects(response, reverse('home'))
 
+    def add_members_with_tasks(self, count):
+        offset = self.project.members.count()
+        for i in range(offset, offset + count):
+            member = get_user_model().objects.create(username=f'Member{i}', email=f'member{i}@example.com')
+            self.project.members.add(member)
+            for _ in range(2):
+                Task.objects.create(
+                    title="Task",
+                    description="Task Description",
+                    status=TaskStatus.NOT_STARTED,
+                    priority=TaskPriority.LOW,
+                    due_date="2024-07-20",
+                    assigned_to=member,
+                    project=self.project,
+                )
+
+    def test_members_with_tasks_grouped(self):
+        self.add_members_with_tasks(3)
+        response = self.client.get(reverse('single_project', args=[self.project.id]))
+
+        members_with_tasks = response.context['members_with_tasks']
+        self.assertEqual(len(members_with_tasks), 4)
+        for entry in members_with_tasks:
+            expected = list(Task.objects.filter(project=self.project, assigned_to=entry['member']).order_by('id'))
+            self.assertEqual(entry['tasks'], expected)
+
+    def test_query_count_constant(self):
+        url = reverse('single_project', args=[self.project.id])
+        self.add_members_with_tasks(2)
+        with self.assertNumQueries(QUERY_BUDGETS['single_project']):
+            self.client.get(url)
+
+        self.add_members_with_tasks(20)
+        with self.assertNumQueries(QUERY_BUDGETS['single_project']):
+            response = self.client.get(url)
+        self.assertEqual(len(response.context['members_with_tasks']), 23)
+        self.assertContains(response, f"{Task.objects.filter(project=self.project).count()} not started / 0 in progress / 0 done")
+
 
 
 class TestDeleteProject(TestCase):
@@ -278,7 +317,81 @@ class TestDeleteProject(TestCase):
         self.assertTrue(check_message(response, "Not allowed"))
 
     def test_delete_success(self):
-        response = self.client.post(delete_project_page(self.project.id))
+        # Celery roda em modo eager nos testes; a tarefa é enfileirada no commit
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.post(delete_project_page(self.project.id))
         self.assertEqual(response.status_code, 302)
-        self.assertRedirects(response, reverse('projects')) 
-        self.assertTrue(check_message(response, "Project Deleted"))
\ No newline at end of file
+        self.assertRedirects(response, reverse('projects'))
+        job = Job.objects.get(kind='delete_project')
+        job_url = reverse('job_status', args=[job.id])
+        self.assertTrue(check_message(response, f"Project is being deleted. Progress: {job_url}"))
+
+        self.assertFalse(Project.all_objects.filter(pk=self.project.id).exists())
+        # O progresso pela URL da mensagem
+        progress = self.client.get(job_url).json()
+        self.assertEqual(progress['state'], 'succeeded')
+        self.assertEqual(progress['done'], progress['total'])
+        self.assertEqual(progress['result'], {'deleted': True})
+
+    @override_settings(PROJECT_DELETE_BATCH_SIZE=2, PROJECT_DELETE_PAUSE=0)
+    def test_delete_in_batches(self):
+        member = create_user(email="member@example.com")
+        self.project.members.add(member)
+        Task.objects.bulk_create([
+            Task(title=f"Task {i}", description="Description", status=TaskStatus.NOT_STARTED, priority=TaskPriority.LOW,
+                 due_date=date(2024, 7, 20), assigned_to=member, project=self.project)
+            for i in range(5)
+        ])
+        other_project = create_project(member)
+        other_project.members.add(member, self.user)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.post(delete_project_page(self.project.id))
+
+        self.assertFalse(Task.objects.filter(project_id=self.project.id).exists())
+        self.assertFalse(Project.members.through.objects.filter(project_id=self.project.id).exists())
+        self.assertEqual(other_project.members.count(), 2)
+        job = Job.objects.get(kind='delete_project')
+        self.assertEqual((job.done, job.total), (7, 7))
+
+    def test_project_hidden_before_deletion(self):
+        # Sem executar os callbacks de commit a tarefa não roda
+        self.client.post(delete_project_page(self.project.id))
+
+        self.assertTrue(Project.all_objects.get(pk=self.project.id).hidden)
+        self.assertFalse(Project.objects.filter(pk=self.project.id).exists())
+        self.assertEqual(Job.objects.get(kind='delete_project').state, 'pending')
+
+        response = self.client.get(reverse('single_project', args=[self.project.id]))
+        self.assertTrue(check_message(response, "Project not found."))
+        response = self.client.post(delete_project_page(self.project.id))
+        self.assertTrue(check_message(response, "Error: Project not found"))
+
+class TestRemoveMember(TestCase):
+    """Test for Remove member View"""
+    def setUp(self):
+        self.user = create_user()
+        self.client.force_login(self.user)
+        self.member = create_user(email="member@example.com")
+
+        self.project = create_project(self.user)
+        self.project.members.add(self.user, self.member)
+        self.task = Task.objects.create(
+            title="Task", description="Description", status=TaskStatus.IN_PROGRESS,
+            priority=TaskPriority.LOW, due_date=date(2024, 7, 20),
+            assigned_to=self.member, project=self.project,
+        )
+        self.url = reverse('remove_member', kwargs={'project_id': self.project.id, 'member_id': self.member.id})
+
+    def test_unfinished_tasks_block_removal(self):
+        response = self.client.post(self.url)
+        self.assertTrue(check_message(response, "Cannot remove member: they have unfinished tasks."))
+        self.assertTrue(self.project.members.filter(pk=self.member.pk).exists())
+
+    def test_remove_after_tasks_concluded(self):
+        self.task.status = TaskStatus.CONCLUDED
+        self.task.save()
+
+        response = self.client.post(self.url)
+        self.assertTrue(check_message(response, "Member removed successfully."))
+        self.assertFalse(self.project.members.filter(pk=self.member.pk).exists())
@@ -0,0 +1,269 @@
+from datetime import timedelta
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import URLPattern, reverse
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+import api.urls
+import teamflow.urls
+from teamflow import snapshots
+from teamflow.counters import rebuild_counts
+from teamflow.models import Job, Project, Task, TaskPriority, TaskStatus
+
+# Consultas de cada URL de teamflow.urls e api.urls, as mesmas com N e com 10N
+# projetos, membros e tarefas. Inclui as da sessão e do usuário (2 por requisição autenticada);
+# medidas com as views síncronas (ASYNC_VIEWS desligado)
+QUERY_BUDGETS = {
+    # teamflow.urls
+    'home': 4,
+    'login': 13,
+    'logout': 4,
+    'register': 6,
+    'projects': 2,
+    'create_project': 7,
+    'single_project': 6,
+    'assign_task': 11,
+    'add_member': 9,
+    'remove_member': 8,
+    'update_status': 8,
+    # api.urls
+    'return_all_users': 3,
+    'search_users': 4,
+    'return_all_projects': 6,
+    'return_user_projects': 6,
+    'return_specific_project': 6,
+    'export_project': 6,
+    'import_project': 12,
+    'project-members': 4,
+    'project-members-add': 8,
+    'project-tasks-import': 9,
+    'task_list': 4,
+    'task_detail': 3,
+    'bulk_task_status': 8,
+    'job_list': 3,
+    'job_status': 3,
+    'dashboard_cache_stats': 2,
+    # Por último: apaga o projeto usado pelos outros, com a exclusão em lotes do
+    # on_commit (um lote de tarefas e um de membros)
+    'delete_project': 33,
+}
+
+# Outros caminhos, medidos nos testes de cada área, que importam daqui
+OTHER_QUERY_BUDGETS = {
+    # Sessão, usuário, COUNT(*) filtrado, COUNT(*) total e a página
+    'admin_changelist': 5,
+    # 304 de uma URL com ETag: sessão, usuário e a consulta de versão
+    'not_modified': 3,
+    # Página inicial com o painel no cache: sessão e usuário
+    'home_cached': 2,
+}
+
+N = 2
+PASSWORD = 'testpass123'
+
+
+class World:
+    """An owner with ``size`` projects of ``size`` members, each member with
+    two tasks per project, plus the extra users the write requests need."""
+
+    def __init__(self, size, prefix):
+        User = get_user_model()
+        today = timezone.now().date()
+        self.prefix = prefix
+        self.owner = User(username=f'{prefix} owner', email=f'{prefix}.owner@example.com', is_staff=True)
+        self.owner.set_password(PASSWORD)
+        self.owner.save()
+
+        people = User.objects.bulk_create(
+            User(username=f'{prefix} user {i}', email=f'{prefix}.user{i}@example.com') for i in range(size * size)
+        )
+        self.outsiders = User.objects.bulk_create(
+            User(username=f'{prefix} outsider {i}', email=f'{prefix}.outsider{i}@example.com') for i in range(4)
+        )
+        self.idle_member = User.objects.create(username=f'{prefix} idle', email=f'{prefix}.idle@example.com')
+
+        self.projects = []
+        tasks = []
+        for number in range(size):
+            project = Project.objects.create(
+                name=f'{prefix} project {number}', description="Description", start_date=today,
+                due_date=today + timedelta(days=30), created_by=self.owner,
+            )
+            members = [self.owner, *people[number * size:(number + 1) * size]]
+            project.members.add(*members)
+            tasks += [
+                Task(title=f'Task {i}', description="Description", status=TaskStatus.NOT_STARTED,
+                     priority=TaskPriority.LOW, due_date=project.due_date, assigned_to=member, project=project)
+                for member in members for i in range(2)
+            ]
+            self.projects.append(project)
+        Task.objects.bulk_create(tasks)
+        rebuild_counts([project.id for project in self.projects])
+
+        self.project = self.projects[0]
+        self.project.members.add(self.idle_member)
+        self.owner_tasks = list(Task.objects.filter(assigned_to=self.owner).order_by('id'))
+        self.job = Job.objects.create(kind='add_members', state='succeeded', created_by=self.owner)
+
+
+@override_settings(PROJECT_DELETE_PAUSE=0)
+class TestQueryBudgets(TestCase):
+    """Every URL runs a fixed number of queries, whatever the amount of data"""
+
+    def setUp(self):
+        self.client = APIClient()
+        # Um snapshot pequeno e fixo para a importação
+        sample = World(1, 'sample')
+        self.snapshot = b''.join(
+            line.encode() if isinstance(line, str) else line
+            for line in snapshots.export_project(sample.project, 'ndjson')
+        )
+
+    def test_every_url_has_a_budget(self):
+        names = {
+            pattern.name
+            for module in (teamflow.urls, api.urls)
+            for pattern in module.urlpatterns
+            if isinstance(pattern, URLPattern)
+        }
+        self.assertEqual(names, set(QUERY_BUDGETS))
+
+    def test_query_counts_constant(self):
+        counts = {name: [] for name in QUERY_BUDGETS}
+        for size, prefix in ((N, 'small'), (10 * N, 'large')):
+            world = World(size, prefix)
+            for name in QUERY_BUDGETS:
+                counts[name].append(self.count_queries(name, world))
+
+        for name, budget in QUERY_BUDGETS.items():
+            with self.subTest(url=name):
+                self.assertEqual(counts[name], [budget, budget])
+
+    def count_queries(self, name, world):
+        self.client.force_login(world.owner)
+        cache.clear()
+        request = getattr(self, f'request_{name.replace("-", "_")}')
+        with CaptureQueriesContext(connection) as queries:
+            response = request(world)
+            if response.streaming:
+                b''.join(response.streaming_content)
+        self.assertLess(response.status_code, 400, f'{name}: {response.status_code}')
+        return len(queries)
+
+    # teamflow.urls
+
+    def request_home(self, world):
+        return self.client.get(reverse('home'))
+
+    def request_login(self, world):
+        self.client.logout()
+        return self.client.post(reverse('login'), {'email': world.owner.email, 'password': PASSWORD})
+
+    def request_logout(self, world):
+        return self.client.get(reverse('logout'))
+
+    def request_register(self, world):
+        self.client.logout()
+        return self.client.post(reverse('register'), {
+            'username': f'{world.prefix} new', 'email': f'{world.prefix}.new@example.com',
+            'password': PASSWORD, 'confirm_password': PASSWORD,
+        })
+
+    def request_projects(self, world):
+        return self.client.get(reverse('projects'))
+
+    def request_create_project(self, world):
+        today = timezone.now().date()
+        return self.client.post(reverse('create_project'), {
+            'name': 'New project', 'description': 'Description',
+            'start_date': f'{today:%Y-%m-%d}', 'due_date': f'{today + timedelta(days=5):%Y-%m-%d}',
+        })
+
+    def request_single_project(self, world):
+        return self.client.get(reverse('single_project', args=[world.project.id]))
+
+    def request_assign_task(self, world):
+        return self.client.post(reverse('assign_task', args=[world.project.id]), {
+            'title': 'New task', 'description': 'Description', 'priority': 'High',
+            'due_date': f'{world.project.due_date:%Y-%m-%d}', 'assigned_to': world.owner.email,
+        })
+
+    def request_add_member(self, world):
+        return self.client.post(reverse('add_member', args=[world.project.id, world.outsiders[0].email]))
+
+    def request_remove_member(self, world):
+        return self.client.post(reverse('remove_member', args=[world.project.id, world.idle_member.id]))
+
+    def request_update_status(self, world):
+        return self.client.post(reverse('update_status', args=[world.owner_tasks[0].id]), {'status': 'In Progress'})
+
+    def request_delete_project(self, world):
+        # A exclusão em lotes roda no on_commit (Celery no modo eager), que o
+        # TestCase só executa aqui; um lote só nos dois tamanhos
+        with self.captureOnCommitCallbacks(execute=True):
+            return self.client.post(reverse('delete_project', args=[world.project.id]))
+
+    # api.urls
+
+    def request_return_all_users(self, world):
+        return self.client.get(reverse('return_all_users'))
+
+    def request_search_users(self, world):
+        return self.client.get(reverse('search_users'), {'q': world.prefix, 'project': world.project.id})
+
+    def request_return_all_projects(self, world):
+        return self.client.get(reverse('return_all_projects'))
+
+    def request_return_user_projects(self, world):
+        return self.client.get(reverse('return_user_projects'))
+
+    def request_return_specific_project(self, world):
+        return self.client.get(reverse('return_specific_project', args=[world.project.id]))
+
+    def request_export_project(self, world):
+        return self.client.get(reverse('export_project', args=[world.project.id]))
+
+    def request_import_project(self, world):
+        upload = SimpleUploadedFile('project.ndjson', self.snapshot)
+        return self.client.post(reverse('import_project'), {'file': upload})
+
+    def request_project_members(self, world):
+        return self.client.get(reverse('project-members', args=[world.project.id]))
+
+    def request_project_members_add(self, world):
+        emails = [user.email for user in world.outsiders[1:]]
+        return self.client.post(reverse('project-members-add', args=[world.project.id]), {'emails': emails},
+                                format='json')
+
+    def request_project_tasks_import(self, world):
+        rows = ''.join(
+            f'Imported {i},Description,High,{world.project.due_date:%Y-%m-%d},{world.owner.email}\n' for i in range(3)
+        )
+        upload = SimpleUploadedFile('tasks.csv', f'title,description,priority,due_date,assigned_to\n{rows}'.encode())
+        return self.client.post(reverse('project-tasks-import', args=[world.project.id]), {'file': upload})
+
+    def request_task_list(self, world):
+        return self.client.get(reverse('task_list'))
+
+    def request_task_detail(self, world):
+        return self.client.get(reverse('task_detail', args=[world.owner_tasks[0].id]))
+
+    def request_bulk_task_status(self, world):
+        # Tarefas do dono em todos os projetos: os contadores de todos mudam
+        ids = [task.id for task in world.owner_tasks]
+        return self.client.post(reverse('bulk_task_status'), {'ids': ids, 'status': 'Concluded'}, format='json')
+
+    def request_job_list(self, world):
+        return self.client.get(reverse('job_list'))
+
+    def request_job_status(self, world):
+        return self.client.get(reverse('job_status', args=[world.job.id]))
+
+    def request_dashboard_cache_stats(self, world):
+        return self.client.get(reverse('dashboard_cache_stats'))
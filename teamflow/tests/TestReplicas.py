@@ -0,0 +1,127 @@
+import time
+from datetime import timedelta
+
+from django.contrib.auth import get_user_model
+from django.db import transaction
+from django.http import HttpResponse
+from django.test import RequestFactory, SimpleTestCase, TestCase, override_settings
+from django.urls import reverse
+from django.utils import timezone
+from teamflow.models import Project, Task, TaskPriority, TaskStatus
+from teamflow.replicas import (PIN_COOKIE,
+                               ReplicaPinMiddleware,
+                               ReplicaRouter,
+                               replica_reads,
+                               use_primary,
+                               use_replicas)
+
+REPLICAS = ['replica1', 'replica2']
+
+
+def create_user(username='TestUsername', email='test@email.com'):
+    return get_user_model().objects.create_user(username=username, email=email, password='testpass123')
+
+
+def create_task(user):
+    today = timezone.now().date()
+    project = Project.objects.create(
+        name="Test Project",
+        description="Test Project Description",
+        start_date=today,
+        due_date=today + timedelta(days=2),
+        created_by=user
+    )
+    project.members.add(user)
+    return Task.objects.create(
+        title="Task",
+        description="Task Description",
+        status=TaskStatus.NOT_STARTED,
+        priority=TaskPriority.LOW,
+        due_date=project.due_date,
+        assigned_to=user,
+        project=project
+    )
+
+
+def read_database(request):
+    """View that answers with the alias the router picks for a read"""
+    return HttpResponse(ReplicaRouter().db_for_read(Project))
+
+
+@override_settings(DATABASE_REPLICAS=REPLICAS, REPLICA_PIN_SECONDS=5)
+class TestReplicaRouter(SimpleTestCase):
+    """Routing decisions only; TestCase would run everything inside a transaction"""
+
+    def setUp(self):
+        self.router = ReplicaRouter()
+        self.factory = RequestFactory()
+        self.middleware = ReplicaPinMiddleware(replica_reads(read_database))
+
+    def test_reads_use_primary_outside_marked_views(self):
+        self.assertEqual(self.router.db_for_read(Project), 'default')
+        self.assertEqual(self.router.db_for_write(Project), 'default')
+
+    def test_marked_view_reads_from_one_replica(self):
+        with use_replicas():
+            replica = self.router.db_for_read(Project)
+            self.assertIn(replica, REPLICAS)
+            self.assertEqual({self.router.db_for_read(Task) for _ in range(20)}, {replica})
+
+            with use_primary():
+                self.assertEqual(self.router.db_for_read(Project), 'default')
+
+    @override_settings(DATABASE_REPLICAS=[])
+    def test_without_replicas(self):
+        with use_replicas():
+            self.assertEqual(self.router.db_for_read(Project), 'default')
+
+    def test_get_uses_replica(self):
+        response = self.middleware(self.factory.get('/'))
+        self.assertIn(response.content.decode(), REPLICAS)
+        self.assertNotIn(PIN_COOKIE, response.cookies)
+
+    def test_post_pins_client_to_primary(self):
+        response = self.middleware(self.factory.post('/'))
+        self.assertEqual(response.content, b'default')
+        self.assertEqual(response.cookies[PIN_COOKIE]['max-age'], 5)
+
+    def test_pinned_client_reads_primary(self):
+        request = self.factory.get('/')
+        request.COOKIES[PIN_COOKIE] = str(int(time.time()) + 5)
+        response = self.middleware(request)
+        self.assertEqual(response.content, b'default')
+        # Ler não renova o prazo
+        self.assertNotIn(PIN_COOKIE, response.cookies)
+
+        request.COOKIES[PIN_COOKIE] = str(int(time.time()) - 1)
+        self.assertIn(self.middleware(request).content.decode(), REPLICAS)
+
+    def test_write_in_request_moves_later_reads_to_primary(self):
+        def write_then_read(request):
+            self.router.db_for_write(Project)
+            return read_database(request)
+
+        middleware = ReplicaPinMiddleware(replica_reads(write_then_read))
+        response = middleware(self.factory.get('/'))
+        self.assertEqual(response.content, b'default')
+        self.assertIn(PIN_COOKIE, response.cookies)
+
+    def test_migrations_only_on_primary(self):
+        self.assertTrue(self.router.allow_migrate('default', 'teamflow'))
+        self.assertFalse(self.router.allow_migrate('replica1', 'teamflow'))
+
+
+@override_settings(DATABASE_REPLICAS=REPLICAS)
+class TestReplicaRouterRequests(TestCase):
+    def test_transaction_reads_primary(self):
+        with use_replicas(), transaction.atomic():
+            self.assertEqual(ReplicaRouter().db_for_read(Project), 'default')
+
+    def test_view_write_sets_cookie(self):
+        user = create_user()
+        task = create_task(user)
+        self.client.force_login(user)
+
+        response = self.client.post(reverse('update_status', args=[task.id]), {'status': 'In Progress'})
+        self.assertRedirects(response, reverse('home'), fetch_redirect_response=False)
+        self.assertIn(PIN_COOKIE, response.cookies)
@@ -0,0 +1,20 @@
+from django.conf import settings
+from django.db import connection
+from django.test import TestCase
+
+
+class TestSQLiteSettings(TestCase):
+    """The SQLite options are applied to every connection"""
+
+    def test_pragmas(self):
+        with connection.cursor() as cursor:
+            cursor.execute('PRAGMA busy_timeout')
+            self.assertEqual(cursor.fetchone()[0], settings.SQLITE_BUSY_TIMEOUT * 1000)
+            cursor.execute('PRAGMA synchronous')
+            # NORMAL
+            self.assertEqual(cursor.fetchone()[0], 1)
+            cursor.execute('PRAGMA cache_size')
+            self.assertEqual(cursor.fetchone()[0], settings.SQLITE_PRAGMAS['cache_size'])
+
+    def test_immediate_transactions(self):
+        self.assertEqual(connection.transaction_mode, 'IMMEDIATE')
@@ -0,0 +1,138 @@
+import json
+import os
+import tempfile
+from datetime import date
+from io import StringIO
+from django.test import TestCase
+from django.core.management import call_command
+from django.contrib.auth import get_user_model
+from teamflow.models import Project, Task, TaskPriority, TaskStatus
+from teamflow.snapshots import export_project, import_snapshot
+
+
+def create_user(username=None, email='test@email.com'):
+    """Create user for testing authenticated features"""
+    if username is None:
+        username = 'TestUsername'
+    else:
+        username=username
+
+    new_user = get_user_model().objects.create(
+        username=username,
+        email=email
+    )
+
+    return new_user
+
+def create_task(user, project, title="Task"):
+    return Task.objects.create(
+        title=title,
+        description="Task Description",
+        status=TaskStatus.IN_PROGRESS,
+        priority=TaskPriority.HIGH,
+        due_date=date(2024, 7, 20),
+        assigned_to=user,
+        project=project
+    )
+
+
+class TestSnapshots(TestCase):
+    """Tests for project snapshot export and import"""
+
+    def setUp(self):
+        self.user = create_user()
+        self.member = create_user(username='Member', email='member@example.com')
+        self.project = Project.objects.create(
+            name="Test Project",
+            description="Test Project Description",
+            start_date=date(2024, 7, 10),
+            due_date=date(2024, 8, 1),
+            created_by=self.user
+        )
+        self.project.members.add(self.user, self.member)
+        for i in range(5):
+            create_task(self.member if i % 2 else self.user, self.project, title=f"Task {i}")
+
+    def export(self, file_format):
+        return ''.join(export_project(self.project, file_format))
+
+    def assertRestored(self, project):
+        self.assertNotEqual(project.id, self.project.id)
+        self.assertEqual(project.name, self.project.name)
+        self.assertEqual(project.start_date, self.project.start_date)
+        self.assertEqual(set(project.members.all()), {self.user, self.member})
+
+        fields = ('title', 'description', 'status', 'priority', 'due_date', 'assigned_to')
+        original = list(Task.objects.filter(project=self.project).order_by('id').values_list(*fields))
+        restored = list(Task.objects.filter(project=project).order_by('id').values_list(*fields))
+        self.assertEqual(restored, original)
+
+    def test_ndjson_round_trip(self):
+        content = self.export('ndjson')
+        lines = content.splitlines()
+        self.assertEqual(len(lines), 1 + 2 + 5)
+        self.assertEqual(json.loads(lines[0])['type'], 'project')
+
+        project, report = import_snapshot(StringIO(content), 'ndjson', batch_size=2)
+
+        self.assertEqual(report, {'members': 1, 'tasks': 5, 'missing_users': 0, 'skipped_tasks': 0})
+        self.assertEqual(project.created_by, self.user)
+        self.assertRestored(project)
+
+    def test_json_export_not_imported(self):
+        document = json.loads(self.export('json'))
+        self.assertEqual(len(document['members']), 2)
+        self.assertEqual(len(document['tasks']), 5)
+
+        with self.assertRaisesMessage(ValueError, "Only ndjson snapshots can be imported"):
+            import_snapshot(StringIO(self.export('json')), 'json')
+
+    def test_invalid_record_reports_line(self):
+        lines = self.export('ndjson').splitlines(keepends=True)
+        task = json.loads(lines[4])
+        task['title'] = None
+        lines[4] = json.dumps(task) + '\n'
+
+        with self.assertRaisesMessage(ValueError, "Line 5: missing or invalid title"):
+            import_snapshot(lines, 'ndjson')
+        self.assertEqual(Project.objects.count(), 1)
+
+        lines[4] = '{"type": "task", "title": \n'
+        with self.assertRaisesMessage(ValueError, "Line 5: invalid JSON"):
+            import_snapshot(lines, 'ndjson')
+
+    def test_empty_sections(self):
+        Task.objects.all().delete()
+        self.project.members.clear()
+
+        document = json.loads(self.export('json'))
+        self.assertEqual(document['members'], [])
+        self.assertEqual(document['tasks'], [])
+
+    def test_unknown_users_skipped(self):
+        content = self.export('ndjson')
+        Task.objects.filter(assigned_to=self.member).delete()
+        self.member.delete()
+        owner = create_user(username='Owner', email='owner@example.com')
+
+        project, report = import_snapshot(StringIO(content), 'ndjson', owner=owner)
+
+        self.assertEqual(report, {'members': 1, 'tasks': 3, 'missing_users': 1, 'skipped_tasks': 2})
+        self.assertEqual(project.created_by, owner)
+
+    def test_export_query_count(self):
+        # Membros e tarefas, cada um numa consulta (o criador já está carregado)
+        with self.assertNumQueries(2):
+            self.export('ndjson')
+
+    def test_management_commands(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'snapshot.ndjson')
+            call_command('export_project', self.project.id, output=path)
+
+            out = StringIO()
+            call_command('import_project', path, stdout=out)
+
+        self.assertIn("1 members, 5 tasks", out.getvalue())
+        project = Project.objects.exclude(pk=self.project.pk).get()
+        self.assertRestored(project)
@@ -0,0 +1,130 @@
+from datetime import date
+from io import StringIO
+from django.test import TestCase
+from django.core.management import call_command
+from django.contrib.auth import get_user_model
+from django.urls import reverse
+from teamflow.counters import rebuild_counts, task_counts
+from teamflow.models import Project, ProjectTaskCount, Task, TaskPriority, TaskStatus
+from teamflow.task_import import import_tasks
+
+
+def create_user(username=None, email='test@email.com'):
+    """Create user for testing authenticated features"""
+    if username is None:
+        username = 'TestUsername'
+
+    return get_user_model().objects.create(username=username, email=email)
+
+def create_project(user):
+    new_project = Project.objects.create(
+        name="Test Project",
+        description="Test Project Description",
+        start_date=date(2024, 7, 10),
+        due_date=date(2024, 8, 1),
+        created_by=user
+    )
+    new_project.members.add(user)
+
+    return new_project
+
+def create_task(user, project, status=TaskStatus.NOT_STARTED):
+    return Task.objects.create(
+        title="Task",
+        description="Task Description",
+        status=status,
+        priority=TaskPriority.LOW,
+        due_date=date(2024, 7, 15),
+        assigned_to=user,
+        project=project,
+    )
+
+
+class TestTaskCounts(TestCase):
+    def setUp(self):
+        self.user = create_user()
+        self.project = create_project(self.user)
+
+    def counts(self):
+        counts = task_counts([self.project.id])[self.project.id]
+        return {status.label: count for status, count in counts.items()}
+
+    def test_new_project_starts_at_zero(self):
+        self.assertEqual(self.counts(), {'Not Started': 0, 'In Progress': 0, 'Concluded': 0})
+        self.assertEqual(ProjectTaskCount.objects.filter(project=self.project).count(), 3)
+
+    def test_create_change_and_delete(self):
+        task = create_task(self.user, self.project)
+        create_task(self.user, self.project, status=TaskStatus.CONCLUDED)
+        self.assertEqual(self.counts(), {'Not Started': 1, 'In Progress': 0, 'Concluded': 1})
+
+        task.status = TaskStatus.IN_PROGRESS
+        task.save()
+        task.save()
+        self.assertEqual(self.counts(), {'Not Started': 0, 'In Progress': 1, 'Concluded': 1})
+
+        Task.objects.get(pk=task.pk).delete()
+        self.assertEqual(self.counts(), {'Not Started': 0, 'In Progress': 0, 'Concluded': 1})
+
+    def test_save_after_refresh_from_db(self):
+        task = create_task(self.user, self.project)
+        Task.objects.filter(pk=task.pk).update(status=TaskStatus.CONCLUDED)
+        rebuild_counts([self.project.id])
+
+        task.refresh_from_db()
+        task.status = TaskStatus.IN_PROGRESS
+        task.save()
+        self.assertEqual(self.counts(), {'Not Started': 0, 'In Progress': 1, 'Concluded': 0})
+
+        Task.objects.filter(pk=task.pk).update(status=TaskStatus.NOT_STARTED)
+        rebuild_counts([self.project.id])
+        task.refresh_from_db(fields=['status'])
+        task.status = TaskStatus.CONCLUDED
+        task.save()
+        self.assertEqual(self.counts(), {'Not Started': 0, 'In Progress': 0, 'Concluded': 1})
+
+    def test_change_status_view(self):
+        task = create_task(self.user, self.project)
+        self.client.force_login(self.user)
+
+        self.client.post(reverse('update_status', args=[task.id]), {'status': 'Concluded'})
+        self.assertEqual(self.counts(), {'Not Started': 0, 'In Progress': 0, 'Concluded': 1})
+
+        self.client.post(reverse('update_status', args=[task.id]), {'status': 'Done?'})
+        task.refresh_from_db()
+        self.assertEqual(task.status, TaskStatus.CONCLUDED)
+
+    def test_cascade_from_user_delete(self):
+        member = create_user(email="member@example.com")
+        self.project.members.add(member)
+        create_task(member, self.project)
+        create_task(self.user, self.project)
+
+        member.delete()
+        self.assertEqual(self.counts()['Not Started'], 1)
+
+    def test_bulk_paths(self):
+        lines = [
+            '{"title": "Task %d", "description": "D", "priority": "Low", '
+            '"due_date": "2024-07-15", "assigned_to": "test@email.com"}\n' % i
+            for i in range(5)
+        ]
+        import_tasks(self.project, iter(lines), 'jsonl', batch_size=2)
+        self.assertEqual(self.counts()['Not Started'], 5)
+
+        self.client.force_login(self.user)
+        ids = list(Task.objects.values_list('id', flat=True)[:3])
+        self.client.post(reverse('bulk_task_status'), {'ids': ids, 'status': 'Concluded'}, content_type='application/json')
+        self.assertEqual(self.counts(), {'Not Started': 2, 'In Progress': 0, 'Concluded': 3})
+
+    def test_rebuild_command(self):
+        create_task(self.user, self.project)
+        create_task(self.user, self.project, status=TaskStatus.IN_PROGRESS)
+        ProjectTaskCount.objects.filter(project=self.project).update(count=42)
+        ProjectTaskCount.objects.filter(project=self.project, status=TaskStatus.CONCLUDED).delete()
+
+        out = StringIO()
+        call_command('rebuild_task_counts', stdout=out)
+
+        self.assertIn("Rebuilt the task counters of 1 projects.", out.getvalue())
+        self.assertEqual(self.counts(), {'Not Started': 1, 'In Progress': 1, 'Concluded': 0})
@@ -2,7 +2,7 @@ from django.test import TestCase
 from django.urls import reverse
 from django.contrib.auth import get_user_model
 from django.contrib.messages import get_messages
-from teamflow.models import Project, Task
+from teamflow.models import Project, Task, TaskPriority, TaskStatus
 from datetime import timedelta
 from django.utils import timezone
 
@@ -47,8 +47,8 @@ def create_project(user):
 def create_task(user, project):
     title="Task"
     description="Task Description"
-    status="Not Started"
-    priority="Low"
+    status=TaskStatus.NOT_STARTED
+    priority=TaskPriority.LOW
     due_date=timezone.now().date() + timedelta(days=2)
 
     new_task = Task.objects.create(
@@ -187,8 +187,8 @@ class TestAssignTaskView(TestCase):
 
         task = Task.objects.get(project=self.project, assigned_to=self.user)
         self.assertIsNotNone(task)
-        self.assertEqual(task.status, "Not Started")
-        self.assertNotEqual(task.status, "In progress")
+        self.assertEqual(task.status, TaskStatus.NOT_STARTED)
+        self.assertNotEqual(task.status, TaskStatus.IN_PROGRESS)
 
     def test_user_not_authenticated_error(self):
         self.client.get(reverse('logout'))
@@ -245,4 +245,4 @@ class TestChangeTaskStatusView(TestCase):
         self.assertRedirects(response, reverse('home'))
 
         self.task.refresh_from_db()
-        self.assertEqual(self.task.status, 'In Progress')
\ No newline at end of file
+        self.assertEqual(self.task.status, TaskStatus.IN_PROGRESS)
\ No newline at end of file
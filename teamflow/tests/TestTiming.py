@@ -0,0 +1,93 @@
+import re
+from datetime import timedelta
+
+from asgiref.sync import async_to_sync
+from django.contrib.auth import get_user_model
+from django.core.exceptions import MiddlewareNotUsed
+from django.db import connection
+from django.http import HttpResponse
+from django.test import AsyncRequestFactory, TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+from teamflow.models import Project
+from teamflow.timing import RequestTimingMiddleware
+
+SERVER_TIMING = re.compile(
+    r'db;dur=(?P<db>[\d.]+);desc="(?P<queries>\d+) queries", tpl;dur=(?P<tpl>[\d.]+), total;dur=(?P<total>[\d.]+)'
+)
+
+
+@override_settings(REQUEST_TIMING=True, REQUEST_QUERY_BUDGET=20, REQUEST_TIME_BUDGET_MS=10000)
+class TestRequestTiming(TestCase):
+    def setUp(self):
+        self.user = get_user_model().objects.create_user(
+            username='TestUsername', email='test@email.com', password='testpass123'
+        )
+        today = timezone.now().date()
+        self.project = Project.objects.create(
+            name="Test Project", description="Description", start_date=today,
+            due_date=today + timedelta(days=2), created_by=self.user,
+        )
+        self.project.members.add(self.user)
+        self.client.force_login(self.user)
+
+    def get(self, url):
+        with self.assertLogs('teamflow.timing') as logs, CaptureQueriesContext(connection) as queries:
+            response = self.client.get(url)
+        timing = SERVER_TIMING.fullmatch(response['Server-Timing'])
+        self.assertIsNotNone(timing, response['Server-Timing'])
+        return response, timing, logs, len(queries)
+
+    def test_page_timings(self):
+        response, timing, logs, queries = self.get(reverse('single_project', args=[self.project.id]))
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(int(timing['queries']), queries)
+        self.assertGreater(float(timing['tpl']), 0)
+        self.assertGreaterEqual(float(timing['total']), float(timing['tpl']))
+
+        record = logs.records[0]
+        self.assertEqual(record.levelname, 'INFO')
+        self.assertEqual(record.request_timing['queries'], queries)
+        self.assertEqual(record.request_timing['path'], reverse('single_project', args=[self.project.id]))
+        self.assertIn(f'queries={queries} ', record.getMessage())
+
+    def test_api_timings(self):
+        response, timing, logs, queries = self.get(reverse('return_user_projects'))
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(int(timing['queries']), queries)
+        self.assertEqual(float(timing['tpl']), 0)
+
+    @override_settings(REQUEST_QUERY_BUDGET=1)
+    def test_over_budget_logs_warning(self):
+        _, _, logs, _ = self.get(reverse('single_project', args=[self.project.id]))
+
+        record = logs.records[0]
+        self.assertEqual(record.levelname, 'WARNING')
+        self.assertTrue(record.request_timing['over_budget'])
+        self.assertTrue(record.getMessage().endswith(' over_budget'))
+
+    def test_async_request(self):
+        async def count_projects(request):
+            return HttpResponse(await Project.objects.acount())
+
+        middleware = RequestTimingMiddleware(count_projects)
+        with self.assertLogs('teamflow.timing'):
+            response = async_to_sync(middleware)(AsyncRequestFactory().get('/'))
+
+        self.assertEqual(response.content, b'1')
+        self.assertEqual(SERVER_TIMING.fullmatch(response['Server-Timing'])['queries'], '1')
+
+
+@override_settings(REQUEST_TIMING=False)
+class TestRequestTimingDisabled(TestCase):
+    def test_middleware_not_used(self):
+        with self.assertRaises(MiddlewareNotUsed):
+            RequestTimingMiddleware(lambda request: HttpResponse())
+
+    def test_no_header(self):
+        response = self.client.get(reverse('login'))
+        self.assertEqual(response.status_code, 200)
+        self.assertFalse(response.has_header('Server-Timing'))
@@ -0,0 +1,154 @@
+import logging
+import time
+from contextvars import ContextVar
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.db import connections
+from django.db.backends.signals import connection_created
+from django.template.backends.django import DjangoTemplates, Template
+
+logger = logging.getLogger('teamflow.timing')
+
+# Contadores da requisição atual (RequestTimingMiddleware). Um objeto mutável,
+# para que as consultas feitas em outra thread (sync_to_async) também entrem
+_stats = ContextVar('request_timing', default=None)
+
+
+class RequestStats:
+    """Queries and time spent by one request, in seconds."""
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.queries = 0
+        self.db = 0.0
+        self.template = 0.0
+        self.rendering = False
+
+    @property
+    def total(self):
+        return time.perf_counter() - self.started
+
+
+def timed_execute(execute, sql, params, many, context):
+    stats = _stats.get()
+    if stats is None:
+        return execute(sql, params, many, context)
+    started = time.perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        stats.db += time.perf_counter() - started
+        stats.queries += 1
+
+
+def install_execute_wrapper(wrapper):
+    """Run ``wrapper`` around the queries of every connection, in every thread.
+
+    Connections opened from now on get it from the ``connection_created``
+    signal; the ones already open get it here.
+    """
+    def add_wrapper(connection, **kwargs):
+        if wrapper not in connection.execute_wrappers:
+            connection.execute_wrappers.append(wrapper)
+
+    connection_created.connect(add_wrapper, weak=False, dispatch_uid=f'{wrapper.__module__}.{wrapper.__name__}')
+    for connection in connections.all(initialized_only=True):
+        add_wrapper(connection)
+
+
+class TimedTemplate(Template):
+    def render(self, context=None, request=None):
+        stats = _stats.get()
+        # Templates renderizados dentro de outro (render_to_string numa tag) já contam no de fora
+        if stats is None or stats.rendering:
+            return super().render(context, request)
+        stats.rendering = True
+        started = time.perf_counter()
+        try:
+            return super().render(context, request)
+        finally:
+            stats.template += time.perf_counter() - started
+            stats.rendering = False
+
+
+class TimedDjangoTemplates(DjangoTemplates):
+    """The Django template backend, with render time counted per request."""
+
+    def from_string(self, template_code):
+        return TimedTemplate(self.engine.from_string(template_code), self)
+
+    def get_template(self, template_name):
+        return TimedTemplate(super().get_template(template_name).template, self)
+
+
+class RequestTimingMiddleware:
+    """Count the queries and time the database, templates and the whole
+    request, for every request.
+
+    The numbers go out in a ``Server-Timing`` header (shown by the browser's
+    network panel) and in one ``teamflow.timing`` log line per request, a
+    warning when the request went over ``REQUEST_QUERY_BUDGET`` queries or
+    ``REQUEST_TIME_BUDGET_MS``. Without ``settings.REQUEST_TIMING`` the
+    middleware removes itself and nothing is timed. Put it first in
+    ``MIDDLEWARE`` so the total covers the other middleware too.
+    """
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        if not settings.REQUEST_TIMING:
+            raise MiddlewareNotUsed
+        install_execute_wrapper(timed_execute)
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        stats = RequestStats()
+        token = _stats.set(stats)
+        try:
+            response = self.get_response(request)
+        finally:
+            _stats.reset(token)
+        return self.finish(request, response, stats)
+
+    async def __acall__(self, request):
+        stats = RequestStats()
+        token = _stats.set(stats)
+        try:
+            response = await self.get_response(request)
+        finally:
+            _stats.reset(token)
+        return self.finish(request, response, stats)
+
+    def finish(self, request, response, stats):
+        total = stats.total
+        timings = {
+            'queries': stats.queries,
+            'db_ms': round(stats.db * 1000, 1),
+            'template_ms': round(stats.template * 1000, 1),
+            'total_ms': round(total * 1000, 1),
+        }
+        header = (f'db;dur={timings["db_ms"]};desc="{stats.queries} queries", '
+                  f'tpl;dur={timings["template_ms"]}, total;dur={timings["total_ms"]}')
+        if response.has_header('Server-Timing'):
+            header = f'{response["Server-Timing"]}, {header}'
+        response['Server-Timing'] = header
+
+        over_budget = (stats.queries > settings.REQUEST_QUERY_BUDGET
+                       or timings['total_ms'] > settings.REQUEST_TIME_BUDGET_MS)
+        logger.log(
+            logging.WARNING if over_budget else logging.INFO,
+            '%s %s %s queries=%d db_ms=%.1f template_ms=%.1f total_ms=%.1f%s',
+            request.method, request.path, response.status_code, stats.queries, timings['db_ms'],
+            timings['template_ms'], timings['total_ms'], ' over_budget' if over_budget else '',
+            extra={'request_timing': {
+                'method': request.method, 'path': request.path, 'status': response.status_code,
+                'over_budget': over_budget, **timings,
+            }},
+        )
+        return response
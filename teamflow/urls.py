@@ -1,8 +1,9 @@
+from django.conf import settings
 from django.urls import path
 from . import views
 
 urlpatterns = [
-    path('', views.HomePage, name='home'),
+    path('', views.AsyncHomePage if settings.ASYNC_VIEWS else views.HomePage, name='home'),
     path('login/', views.LoginView, name='login'),
     path('logout/', views.LogoutView, name='logout'),
     path('register/', views.RegisterView, name="register"),
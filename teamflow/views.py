@@ -1,3 +1,4 @@
+from asgiref.sync import sync_to_async
 from django.shortcuts import render
 from django.urls import reverse
 from django.contrib.auth.decorators import login_required
@@ -7,35 +8,39 @@ from django.http import HttpResponseRedirect
 from django.contrib import messages
 from datetime import datetime
 from django.http import Http404
+from django.db import transaction
 from django.utils import timezone
 
-from .models import User, Project, Task
+from .models import User, Project, Task, TaskPriority, TaskStatus
+from .counters import empty_counts, task_counts
+from .dashboard import aget_cached_project_tasks, get_cached_project_tasks
+from .jobs import start_job
+from .replicas import replica_reads
+from .tasks import delete_project
 
 @login_required
+@replica_reads
 def HomePage(request):
-    user = request.user
-
-    # Obter projetos onde o usuário é membro
-    user_projects = Project.objects.filter(members=user)
-
-    # Inicializar um dicionário para armazenar as tarefas por projeto
-    project_tasks = {}
+    # Projetos e tarefas visíveis ao usuário, com um número fixo de consultas
+    # e guardados em cache por usuário
+    project_tasks = get_cached_project_tasks(request.user)
 
-    for project in user_projects:
-        if project.created_by == user:
-            # Se o usuário é o criador, obtém todas as tarefas do projeto
-            tasks = Task.objects.filter(project=project)
-        else:
-            # Se o usuário não é o criador, obtém apenas as tarefas atribuídas ao usuário
-            tasks = Task.objects.filter(project=project, assigned_to=user)
+    context = {
+        'project_tasks': project_tasks,
+    }
+    return render(request, 'teamflow/main/index.html', context)
 
-        # Adiciona as tarefas ao dicionário
-        project_tasks[project] = tasks
+@login_required
+@replica_reads
+async def AsyncHomePage(request):
+    # Mesma página com o ORM e o cache assíncronos (servida pelo FinalProj.asgi)
+    project_tasks = await aget_cached_project_tasks(await request.auser())
 
     context = {
         'project_tasks': project_tasks,
     }
-    return render(request, 'teamflow/main/index.html', context)
+    # O template e os context processors ainda acessam request.user de forma síncrona
+    return await sync_to_async(render)(request, 'teamflow/main/index.html', context)
 
 def LoginView(request):
     if request.user.is_authenticated:
@@ -88,7 +93,7 @@ def RegisterView(request):
             messages.error(request, "Error: Passwords doesn't match")
             return HttpResponseRedirect(reverse('register'))
 
-        if get_user_model().objects.filter(email=email).exists():
+        if get_user_model().objects.with_email(email).exists():
             messages.error(request, "Email already registered.")
             return HttpResponseRedirect(reverse('register'))
         
@@ -162,33 +167,49 @@ def CreateProjectView(request):
     return render(request, "teamflow/projects/create_project.html")
 
 @login_required
+@replica_reads
 def SingleProjectPage(request, project_id):
     try:
-        query_project = get_object_or_404(Project, pk=project_id)
+        query_project = get_object_or_404(Project.objects.select_related('created_by'), pk=project_id)
     except Http404:
         messages.error(request, "Project not found.")
         return HttpResponseRedirect(reverse('home'))
     
-    project_members = query_project.members.all()
+    project_members = list(query_project.members.all())
     
     user = request.user
 
-    if not query_project.members.filter(pk=user.pk).exists():
+    # A verificação de membro usa a lista já carregada
+    if not any(member.pk == user.pk for member in project_members):
         messages.error(request, "Not allowed.")
         return HttpResponseRedirect(reverse('home'))
 
+    # Uma única consulta de tarefas, agrupadas por membro em memória
+    members_by_id = {member.pk: member for member in project_members}
+    tasks_by_member = {member.pk: [] for member in project_members}
+    for task in Task.objects.filter(project=query_project).order_by('id'):
+        if task.assigned_to_id in members_by_id:
+            task.assigned_to = members_by_id[task.assigned_to_id]
+            task.project = query_project
+            tasks_by_member[task.assigned_to_id].append(task)
+
     members_with_tasks = []
     for member in project_members:
-        tasks = Task.objects.filter(project=query_project, assigned_to=member)
         members_with_tasks.append({
             'member': member,
-            'tasks': tasks
+            'tasks': tasks_by_member[member.pk]
         })
     
+    # Contadores mantidos a cada escrita (teamflow.counters), sem contar as tarefas
+    counts = task_counts([query_project.id]).get(query_project.id) or empty_counts()
+    labels = ['not started', 'in progress', 'done']
+    task_summary = [(counts[status], label) for status, label in zip(TaskStatus, labels)]
+
     return render(request, "teamflow/projects/singleproject.html", {
         "project": query_project,
         "user": user,
         "members_with_tasks": members_with_tasks,
+        "task_summary": task_summary,
     })
 
 @login_required
@@ -226,8 +247,12 @@ def Delete_Project(request, project_id):
             messages.error(request, "Not allowed")
             return HttpResponseRedirect(reverse('home'))
             
-        project.delete()
-        messages.success(request, "Project Deleted")
+        # Some na hora para todos; tarefas e membros são removidos em lotes pelo Celery
+        # (na própria requisição no modo eager)
+        project.hidden = True
+        project.save(update_fields=['hidden', 'updated_at'])
+        job = start_job('delete_project', request.user, delete_project, project.id)
+        messages.success(request, f"Project is being deleted. Progress: {reverse('job_status', args=[job.id])}")
         return HttpResponseRedirect(reverse('projects'))
 
     messages.error(request, "Not allowed")
@@ -251,7 +276,7 @@ def Remove_member_from_project(request, project_id, member_id):
             return redirect(reverse("single_project", args=[project_id]))
 
         # Verifica se o membro tem tarefas não terminadas
-        unfinished_tasks = Task.objects.filter(project=project, assigned_to=member_to_remove, status__in=["Not started", "In progress"])
+        unfinished_tasks = Task.objects.filter(project=project, assigned_to=member_to_remove).exclude(status=TaskStatus.CONCLUDED)
 
         if unfinished_tasks.exists():
             messages.error(request, "Cannot remove member: they have unfinished tasks.")
@@ -298,6 +323,11 @@ def AssignTaskView(request, project_id):
                 messages.error(request, "Error: Missing field")
                 return HttpResponseRedirect(reverse('single_project', args=[project_id]))
 
+            priority = TaskPriority.from_label(priority)
+            if priority is None:
+                messages.error(request, "Error: Invalid priority")
+                return HttpResponseRedirect(reverse('single_project', args=[project_id]))
+
             project_start_date = project.start_date
             project_due_date = project.due_date
 
@@ -314,13 +344,15 @@ def AssignTaskView(request, project_id):
             new_task = Task(
                 title=title,
                 description=description,
-                status="Not Started",
+                status=TaskStatus.NOT_STARTED,
                 priority=priority,
                 due_date=due_date,
                 assigned_to=user,
                 project=project,
             )
-            new_task.save()
+            # A tarefa e o contador do projeto (teamflow.signals) na mesma transação
+            with transaction.atomic():
+                new_task.save()
             messages.success(request, "Task created successfully!")
             return HttpResponseRedirect(reverse('single_project', args=[project_id]))
 
@@ -335,19 +367,28 @@ def AssignTaskView(request, project_id):
 @login_required
 def ChangeTaskStatus(request, task_id):
     if request.method == "POST":
-        try:
-            task = Task.objects.get(pk=task_id)
-        except Task.DoesNotExist:
-            messages.error(request, "Task, does not exist")
-            return HttpResponseRedirect(reverse('home'))
-    
-        if request.user.id != task.assigned_to.id:
-            messages.error(request, "You don't own the task")
-            return HttpResponseRedirect(reverse('home'))
-        
-        new_status = request.POST.get("status")
-        task.status = new_status
-        task.save()
+        new_status = TaskStatus.from_label(request.POST.get("status", ""))
+
+        # A tarefa é lida e gravada, com os contadores do projeto (teamflow.signals),
+        # na mesma transação: o status lido é o que os contadores registram, mesmo
+        # com outra requisição mudando a tarefa ao mesmo tempo
+        with transaction.atomic():
+            try:
+                task = Task.objects.select_for_update().get(pk=task_id)
+            except Task.DoesNotExist:
+                messages.error(request, "Task, does not exist")
+                return HttpResponseRedirect(reverse('home'))
+
+            if request.user.id != task.assigned_to_id:
+                messages.error(request, "You don't own the task")
+                return HttpResponseRedirect(reverse('home'))
+
+            if new_status is None:
+                messages.error(request, "Invalid status.")
+                return HttpResponseRedirect(reverse('home'))
+
+            task.status = new_status
+            task.save()
         return HttpResponseRedirect(reverse('home'))
     
     messages.error(request, "Not Allowed")